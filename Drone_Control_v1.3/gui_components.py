@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 """
 gui_components.py
-Contains GUI components for Drone_control_v1.0, including SavedCommandsPage, AppLogPage, and LogSignalHandler.
+Contains GUI components for Drone_control_v1.0, including SavedCommandsPage, AppLogPage, LogSignalHandler and Toast.
 """
 
 import os, json, logging
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QSizePolicy, QListWidget, QTextEdit
-from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from collections import deque
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QSizePolicy, QListView, QPlainTextEdit
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer, QStringListModel
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
 
 logger = logging.getLogger("DroneControl")
 
 SCALE = 0.7
 
+# Page layout/styles derived from SCALE, computed once at import
+PAGE_MARGIN = int(20 * SCALE)
+PAGE_SPACING = int(10 * SCALE)
+TITLE_STYLE = f"font-size: {int(16 * SCALE)}pt; font-weight: bold; margin-bottom: {PAGE_SPACING}px;"
+_SMALL_BUTTON_STYLE = "font-size: 8pt; min-width: 30px; min-height: 15px; background-color: {}; color: white;"
+ADD_BUTTON_STYLE = _SMALL_BUTTON_STYLE.format("#005BA1")
+REMOVE_BUTTON_STYLE = _SMALL_BUTTON_STYLE.format("#AA0000")
+_TOAST_STYLE = ("background-color: {}; color: white; font-size: 11pt; font-weight: bold; "
+                f"padding: {PAGE_SPACING}px {PAGE_MARGIN}px; border-radius: 6px;")
+TOAST_STYLES = {"ok": _TOAST_STYLE.format("#10893E"), "error": _TOAST_STYLE.format("#AA0000")}
+
 ###############################################################################
 # LogSignalHandler
 ###############################################################################
@@ -32,40 +49,59 @@ class SavedCommandsPage(QWidget):
     SAVED_COMMANDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "saved_commands.json")
     def __init__(self):
         super().__init__()
-        self.commands = []
+        # The model is the single source of truth for the command list; see the commands property
+        self._model = QStringListModel(self)
         self.load_saved_commands()
+        # Coalesce bursts of add/remove clicks into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_saved_commands)
+        from PyQt5.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_save)
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        layout.setSpacing(int(10 * SCALE))
+        layout.setContentsMargins(PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN)
+        layout.setSpacing(PAGE_SPACING)
         lblTitle = QLabel("Saved Commands")
-        lblTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; margin-bottom: {int(10 * SCALE)}px;")
+        lblTitle.setStyleSheet(TITLE_STYLE)
         layout.addWidget(lblTitle)
-        self.list_widget = QListWidget()
-        self.list_widget.setMinimumHeight(300)
-        self.list_widget.itemDoubleClicked.connect(self.copy_command_silently)
-        layout.addWidget(self.list_widget)
+        self.list_view = QListView()
+        self.list_view.setModel(self._model)
+        self.list_view.setEditTriggers(QListView.NoEditTriggers)
+        self.list_view.setSelectionMode(QListView.ExtendedSelection)
+        self.list_view.setMinimumHeight(300)
+        self.list_view.doubleClicked.connect(self.copy_command_silently)
+        layout.addWidget(self.list_view)
         input_layout = QHBoxLayout()
         self.cmd_input = QLineEdit()
         self.cmd_input.setPlaceholderText("Enter command to save")
         self.cmd_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         input_layout.addWidget(self.cmd_input)
         btnAdd = QPushButton("Add")
-        btnAdd.setStyleSheet("font-size: 8pt; min-width: 30px; min-height: 15px; background-color: #005BA1; color: white;")
+        btnAdd.setStyleSheet(ADD_BUTTON_STYLE)
         btnAdd.clicked.connect(self.add_command)
         input_layout.addWidget(btnAdd)
         btnRemove = QPushButton("Remove")
-        btnRemove.setStyleSheet("font-size: 8pt; min-width: 30px; min-height: 15px; background-color: #AA0000; color: white;")
+        btnRemove.setStyleSheet(REMOVE_BUTTON_STYLE)
         btnRemove.clicked.connect(self.remove_command)
         input_layout.addWidget(btnRemove)
         layout.addLayout(input_layout)
-        for cmd in self.commands:
-            self.list_widget.addItem(cmd)
+
+    @property
+    def commands(self):
+        return self._model.stringList()
+
+    @commands.setter
+    def commands(self, value):
+        self._model.setStringList(list(value))
 
     def load_saved_commands(self):
         if os.path.exists(self.SAVED_COMMANDS_FILE):
             try:
-                with open(self.SAVED_COMMANDS_FILE, "r") as f:
-                    data = json.load(f)
+                with open(self.SAVED_COMMANDS_FILE, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
                 self.commands = data.get("commands", [])
             except Exception as e:
                 logger.error(f"Failed to load saved commands: {e}")
@@ -77,51 +113,121 @@ class SavedCommandsPage(QWidget):
         os.makedirs(os.path.dirname(self.SAVED_COMMANDS_FILE), exist_ok=True)
         data = {"commands": self.commands}
         try:
-            with open(self.SAVED_COMMANDS_FILE, "w") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(data, indent=2).encode("utf-8")
+            tmp_path = self.SAVED_COMMANDS_FILE + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.SAVED_COMMANDS_FILE)
         except Exception as e:
             logger.error(f"Failed to save commands: {e}")
 
+    def schedule_save(self):
+        self._save_timer.start(50)
+
+    def flush_pending_save(self):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_saved_commands()
+
     def add_command(self):
         cmd = self.cmd_input.text().strip()
         if cmd:
-            self.commands.append(cmd)
-            self.list_widget.addItem(cmd)
+            row = self._model.rowCount()
+            self._model.insertRow(row)
+            self._model.setData(self._model.index(row), cmd)
             self.cmd_input.clear()
-            self.save_saved_commands()
+            self.schedule_save()
 
     def remove_command(self):
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        rows = sorted({index.row() for index in self.list_view.selectionModel().selectedIndexes()})
+        if not rows:
             return
-        for item in selected_items:
-            if item.text() in self.commands:
-                self.commands.remove(item.text())
-            self.list_widget.takeItem(self.list_widget.row(item))
-        self.save_saved_commands()
+        # Remove contiguous runs bottom-up so earlier row numbers stay valid
+        runs = []
+        for row in rows:
+            if runs and row == runs[-1][0] + runs[-1][1]:
+                runs[-1][1] += 1
+            else:
+                runs.append([row, 1])
+        for first, count in reversed(runs):
+            self._model.removeRows(first, count)
+        self.schedule_save()
 
-    def copy_command_silently(self, item):
+    def copy_command_silently(self, index):
         from PyQt5.QtWidgets import QApplication
-        QApplication.clipboard().setText(item.text())
-        logger.info(f"Copied command to clipboard: {item.text()}")
+        text = index.data()
+        QApplication.clipboard().setText(text)
+        logger.info(f"Copied command to clipboard: {text}")
 
 ###############################################################################
 # AppLogPage
 ###############################################################################
 class AppLogPage(QWidget):
+    MAX_LINES = 2000
+    FLUSH_MS = 100
     def __init__(self, log_handler):
         super().__init__()
         self.log_handler = log_handler
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        layout.setSpacing(int(10 * SCALE))
+        layout.setContentsMargins(PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN)
+        layout.setSpacing(PAGE_SPACING)
         lblTitle = QLabel("App Log")
-        lblTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; margin-bottom: {int(10 * SCALE)}px;")
+        lblTitle.setStyleSheet(TITLE_STYLE)
         layout.addWidget(lblTitle)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LINES)
         layout.addWidget(self.log_text)
+        # Records are queued and written to the widget in one batch every FLUSH_MS
+        self._pending = deque(maxlen=self.MAX_LINES)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush_log)
+        self._flush_timer.start()
         self.log_handler.log_signal.connect(self.append_log)
 
     def append_log(self, message):
-        self.log_text.append(message)
\ No newline at end of file
+        self._pending.append(message)
+
+    def flush_log(self):
+        if not self._pending:
+            return
+        self.log_text.appendPlainText("\n".join(self._pending))
+        self._pending.clear()
+
+###############################################################################
+# Toast
+###############################################################################
+class Toast(QLabel):
+    """Non-modal message shown over the bottom of its parent window; hides itself after DURATION_MS."""
+    DURATION_MS = 4000
+    MAX_WIDTH = 600
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setWordWrap(True)
+        self.setAlignment(Qt.AlignCenter)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._kind = None
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide)
+        self.hide()
+
+    def show_message(self, text, kind="ok"):
+        if kind != self._kind:
+            self._kind = kind
+            self.setStyleSheet(TOAST_STYLES.get(kind, TOAST_STYLES["ok"]))
+        self.setText(text)
+        parent = self.parentWidget()
+        self.setFixedWidth(min(self.MAX_WIDTH, parent.width() - 2 * PAGE_MARGIN))
+        self.adjustSize()
+        self.move((parent.width() - self.width()) // 2, parent.height() - self.height() - 3 * PAGE_MARGIN)
+        self.raise_()
+        self.show()
+        # A newer message restarts the countdown
+        self._hide_timer.start(self.DURATION_MS)
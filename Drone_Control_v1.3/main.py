@@ -4,41 +4,213 @@ main.py
 Entry point for Drone_control_v1.3, a Python-based GUI application for drone control via SSH.
 """
 
-import sys, os, logging, paramiko, re, time, keyring
+import sys, os, logging, re, time, functools, subprocess
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QStackedWidget, QTextEdit, QMessageBox, QLineEdit,
     QSizePolicy, QCheckBox, QTabWidget, QToolButton, QStyle, QDialog,
     QDialogButtonBox, QPlainTextEdit, QFormLayout
 )
-from PyQt5.QtCore import Qt, QTimer, QSize, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QEvent, QTimer, QSize, QThread, QSemaphore, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor
 from ssh_executor import SSHExecutor
-from gui_components import SavedCommandsPage, AppLogPage, LogSignalHandler
-from datetime import datetime
+from gui_components import SavedCommandsPage, AppLogPage, LogSignalHandler, Toast
 
 SCALE = 0.7
 
+# Adaptive Wi-Fi temperature polling (ms): back off while readings are good, retry sooner on errors
+TEMP_INTERVAL_START_MS = 5000
+TEMP_INTERVAL_MAX_MS = 15000
+TEMP_INTERVAL_ERROR_MS = 2000
+
+# Power commands: flush filesystems and go down in the same exec, under a single sudo
+REBOOT_COMMAND = "sudo sh -c 'sync; reboot'"
+SHUTDOWN_COMMAND = "sudo sh -c 'sync; shutdown now'"
+
+# After a relay reboot: first reachability probe, backoff cap, and when to stop waiting (ms)
+RELAY_PROBE_FIRST_MS = 15000
+RELAY_PROBE_MAX_MS = 120000
+RELAY_PROBE_GIVE_UP_MS = 600000
+# After a companion reboot: retry the TCP-level connection check while the SSH port is closed (ms)
+BOOT_RETRY_FIRST_MS = 5000
+BOOT_RETRY_MAX_MS = 60000
+BOOT_WAIT_GIVE_UP_MS = 300000
+
+# Patterns used on every status refresh / settings apply, compiled once
+_RE_VERSION = re.compile(r"[\s:](\d+\.\d+)")
+_RE_HOST = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9.\-]*[A-Za-z0-9])?$")
+_RE_PORT = re.compile(r"^\d{1,5}$")
+# Camera keys in /etc/vision_streaming.conf, matched commented out or not
+_RE_CAM_KEY = re.compile(r"^[ \t]*#*(resolution|fps|format)[^\n]*", re.M)
+_CONF_HEADER = r"^[ \t]*\[[^\n]*\][ \t]*$"
+
+# OpenSSH connection sharing for the external terminals: the first terminal to a host becomes
+# the master and later ones (and quick reconnects within ControlPersist) skip KEX/auth
+SSH_MUX_OPTS = ("-o", "ControlMaster=auto", "-o", "ControlPath=/tmp/roz-%r@%h:%p", "-o", "ControlPersist=600")
+
+
+def _ts():
+    """Local time as YYYYmmdd_HHMMSS, used to name captured files."""
+    t = time.localtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+
+
+def _safe_int(s, d):
+    """Parse a QLineEdit value as int, returning d for anything non-numeric."""
+    s = s.strip()
+    digits = s[1:] if s.startswith("-") else s
+    return int(s) if digits.isdecimal() else d
+
+###############################################################################
+# SCALE-derived style constants (built once at import)
+###############################################################################
+_S = {
+    "font_label": int(12 * SCALE),
+    "font_text": int(13 * SCALE),
+    "font_button": int(14 * SCALE),
+    "font_page_title": int(16 * SCALE),
+    "font_home_title": int(20 * SCALE),
+    "pad_tile": int(8 * SCALE),
+    "pad_v": int(10 * SCALE),
+    "pad_h": int(16 * SCALE),
+    "margin_button": int(6 * SCALE),
+    "min_w_button": int(120 * SCALE),
+    "min_w_tile": int(130 * SCALE),
+    "min_h_button": int(60 * SCALE),
+}
+
+SECTION_TITLE_CSS = f"font-size: {_S['font_button']}pt; font-weight: bold; color: #FFFFFF;"
+PAGE_TITLE_CSS = f"font-size: {_S['font_page_title']}pt; font-weight: bold; color: #FFFFFF;"
+HOME_TITLE_CSS = f"font-size: {_S['font_home_title']}pt; font-weight: bold; color: #FFFFFF;"
+FIELD_LABEL_CSS = f"font-size: {_S['font_button']}pt; color: #FFFFFF;"
+PLACEHOLDER_CSS = f"background-color: #3A3A3A; border: 1px solid #555555; font-size: {_S['font_label']}pt; color: #FFFFFF;"
+
+_TILE_BUTTON_CSS = f"""
+            QPushButton {{{{
+                background-color: {{bg}};
+                color: white;
+                border: 1px solid #555555;
+                font-size: {_S['font_button']}pt;
+                padding: {_S['pad_tile']}px;
+                margin: {_S['margin_button']}px;
+                min-width: {_S['min_w_tile']}px;
+                min-height: {_S['min_h_button']}px;
+            }}}}
+            QPushButton:hover {{{{ background-color: #666666; }}}}
+            QPushButton:pressed {{{{ background-color: #777777; }}}}
+        """
+
+@functools.lru_cache(maxsize=None)
+def tile_button_css(bg_color):
+    return _TILE_BUTTON_CSS.format(bg=bg_color)
+
+RECORD_BUTTON_CSS = tile_button_css("#10893E")
+
+LEFT_MENU_CSS = """
+    QPushButton#LeftMenuBtn {
+        background-color: #444444;
+        color: white;
+        border: 1px solid #555555;
+        font-size: 14pt;
+        padding: 10px;
+        margin: 4px;
+        min-width: 100px;
+    }
+    QPushButton#LeftMenuBtn:hover { background-color: #555555; }
+    QPushButton#LeftMenuBtn:pressed { background-color: #666666; }
+"""
+
+# Top status banner, one stylesheet per connection state
+STATUS_GREEN_CSS = """
+    font-size: 16pt;
+    font-weight: bold;
+    color: black;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
+"""
+STATUS_RED_CSS = """
+    font-size: 16pt;
+    font-weight: bold;
+    color: white;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #8B0000, stop:1 #FF6347);
+"""
+STATUS_GRAY_CSS = """
+    font-size: 16pt;
+    font-weight: bold;
+    color: #FFFFFF;
+    background-color: #2E2E2E;
+"""
+
 ###############################################################################
 # Logging Setup
 ###############################################################################
 logger = logging.getLogger("DroneControl")
 
 class WifiTempWorker(QThread):
-    """Runs Wi-Fi temperature read over SSH off the UI thread."""
+    """
+    Long-lived thread that, whenever request_temp() is called, fetches the Wi-Fi
+    temperature and companion sid.conf over SSH in a single batched round trip.
+    """
     temp_ready = pyqtSignal(object)   # float or None
     temp_error = pyqtSignal(str)
+    version_ready = pyqtSignal(str)   # raw /etc/sid.conf content
+    MIN_GAP_S = 0.1  # requests this soon after a read started are answered by that read
 
     def __init__(self, ssh_executor):
         super().__init__()
         self._ssh_executor = ssh_executor
+        self._wake = QSemaphore(0)
+        self._running = True
+        self._last_read = float("-inf")
+
+    def request_temp(self):
+        # A read that has only just started will deliver (and re-arm the poll timer) anyway
+        if time.monotonic() - self._last_read < self.MIN_GAP_S:
+            return
+        # Coalesce: at most one read is queued behind the one in progress
+        if self._wake.available() == 0:
+            self._wake.release()
+
+    def stop(self):
+        self._running = False
+        self._wake.release()
+        # Abort a read in flight: with the executor shut down its channel reads fail at once
+        # and no fallback reconnect is attempted, so the thread is guaranteed to finish
+        self._ssh_executor.shutdown()
+        self.wait()
+
+    def run(self):
+        while True:
+            self._wake.acquire()
+            if not self._running:
+                break
+            self._last_read = time.monotonic()
+            try:
+                status = self._ssh_executor.query_status()
+                self.temp_ready.emit(status["wifi_temp"])
+                self.version_ready.emit(status["sid_conf"] or "")
+            except Exception as e:
+                self.temp_error.emit(str(e))
+
+class SSHTaskSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class SSHTask(QRunnable):
+    """Runs fn(*args) on the global QThreadPool; the result comes back through self.signals."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self.signals = SSHTaskSignals()
 
     def run(self):
         try:
-            t = self._ssh_executor.get_wifi_module_temperature()
-            self.temp_ready.emit(t)
+            result = self._fn(*self._args)
         except Exception as e:
-            self.temp_error.emit(str(e))
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 logger.setLevel(logging.DEBUG)
 console_handler = logging.StreamHandler()
@@ -68,8 +240,7 @@ def apply_dark_gnome_style(app):
     palette.setColor(QPalette.HighlightedText, Qt.white)
     app.setPalette(palette)
 
-def apply_global_stylesheet(app):
-    app.setStyleSheet(f"""
+GLOBAL_STYLESHEET = f"""
     QMainWindow {{
         background-color: #1E1E1E;
     }}
@@ -81,11 +252,11 @@ def apply_global_stylesheet(app):
         color: #FFFFFF;
         border: 1px solid #555555;
         border-radius: 4px;
-        font-size: {int(14 * SCALE)}pt;
-        padding: {int(10 * SCALE)}px {int(16 * SCALE)}px;
-        margin: {int(6 * SCALE)}px;
-        min-width: {int(120 * SCALE)}px;
-        min-height: {int(60 * SCALE)}px;
+        font-size: {_S['font_button']}pt;
+        padding: {_S['pad_v']}px {_S['pad_h']}px;
+        margin: {_S['margin_button']}px;
+        min-width: {_S['min_w_button']}px;
+        min-height: {_S['min_h_button']}px;
     }}
     QPushButton:hover {{
         background-color: #505050;
@@ -97,9 +268,9 @@ def apply_global_stylesheet(app):
     }}
     QLabel {{
         color: #EEEEEE;
-        font-size: {int(13 * SCALE)}pt;
+        font-size: {_S['font_text']}pt;
     }}
-    QLineEdit, QTextEdit {{
+    QLineEdit, QTextEdit, QPlainTextEdit {{
         background-color: #3A3A3A;
         color: white;
         border: 1px solid #555555;
@@ -107,7 +278,7 @@ def apply_global_stylesheet(app):
     }}
     QCheckBox {{
         color: white;
-        font-size: {int(12 * SCALE)}pt;
+        font-size: {_S['font_label']}pt;
     }}
     QTabWidget::pane {{
         border: 1px solid #555555;
@@ -127,7 +298,15 @@ def apply_global_stylesheet(app):
     QTabBar::tab:selected {{
         background: #606060;
     }}
-    """)
+    """
+
+def apply_global_stylesheet(app):
+    app.setStyleSheet(GLOBAL_STYLESHEET)
+
+def apply_style(app):
+    """Full application look in one call: Fusion + dark palette, then the prebuilt stylesheet."""
+    apply_dark_gnome_style(app)
+    apply_global_stylesheet(app)
 
 ###############################################################################
 # DroneControlApp
@@ -139,14 +318,29 @@ class DroneControlApp(QMainWindow):
         self.resize(int(1200 * SCALE), int(700 * SCALE))
 
         self.ssh_executor = SSHExecutor()
-        # Wi-Fi temp polling state (avoid UI freezes)
-        self._wifi_temp_busy = False
-        self._wifi_temp_worker = None
+        # Wi-Fi temp is read on one persistent worker thread (avoid UI freezes)
+        self._wifi_temp_worker = WifiTempWorker(self.ssh_executor)
+        self._wifi_temp_worker.temp_ready.connect(self._on_wifi_temp_ready, Qt.QueuedConnection)
+        self._wifi_temp_worker.temp_error.connect(self._on_wifi_temp_error, Qt.QueuedConnection)
+        self._wifi_temp_worker.version_ready.connect(self._on_companion_version, Qt.QueuedConnection)
+        self._wifi_temp_worker.start()
         self.time_synced = False
         self.connection_check_enabled = bool(self.ssh_executor.ssh_config.get("connection_check_enabled", True))
         self.connection_check_interval = int(self.ssh_executor.ssh_config.get("connection_check_interval", 30000))  # ms
         self.camera_swapped = False
+        # Local destinations for captures/recordings, resolved and created once
+        home = os.path.expanduser("~")
+        self._pics_dir = os.path.join(home, "Pictures")
+        self._vids_dir = os.path.join(home, "Videos")
+        for path in (self._pics_dir, self._vids_dir):
+            os.makedirs(path, exist_ok=True)
         self.is_rebooting_or_shutting_down = False
+        self._confirm_box = None  # see confirm_action()
+        self._relay_power_busy = False
+        self._boot_wait = None  # (next retry ms, ms waited so far) after a reboot; see _on_conn_checked
+        # SSHTask instances in flight (kept referenced until they report back)
+        self._ssh_tasks = set()
+        self._conn_check_running = False
 
         # Labels shown in UI
         self.companion_version_label = QLabel("Companion Version: N/A")
@@ -160,6 +354,11 @@ class DroneControlApp(QMainWindow):
         central_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
         central_layout.setSpacing(int(10 * SCALE))
         self.setCentralWidget(central_container)
+        # Non-modal notifications; see show_success_message/show_error_message
+        self._toast = Toast(self)
+
+        # Standard icons resolved once and shared by any widget that needs them
+        self._icons = {"reload": self.style().standardIcon(QStyle.SP_BrowserReload)}
 
         # Top dock (status + temp + refresh)
         self.top_dock = QDockWidget("", self)
@@ -177,18 +376,14 @@ class DroneControlApp(QMainWindow):
         self.top_status_label = QLabel("Connected and Ready | Drone IP: Checking...")
         self.top_status_label.setAlignment(Qt.AlignCenter)
         self.top_status_label.setMinimumHeight(int(40 * SCALE))
-        self.top_status_label.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: black;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
-        """)
+        self.top_status_label.setStyleSheet(STATUS_GREEN_CSS)
+        self._last_status_key = None
 
         top_dock_layout.addWidget(self.top_status_label)
         top_dock_layout.addWidget(self.wifi_temp_label, 0, Qt.AlignRight)
 
         self.refresh_btn = QToolButton()
-        self.refresh_btn.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
+        self.refresh_btn.setIcon(self._icons["reload"])
         self.refresh_btn.setIconSize(QSize(int(16 * SCALE), int(16 * SCALE)))
         self.refresh_btn.setToolTip("Refresh Connection")
         self.refresh_btn.setStyleSheet("""
@@ -219,10 +414,19 @@ class DroneControlApp(QMainWindow):
         self.statusBar().addPermanentWidget(self.version_label)
 
         # Timers
+        # Wi-Fi temp polling is single-shot and re-armed from each result (see _schedule_next_temp)
         self.temp_timer = QTimer(self)
-        self.temp_timer.timeout.connect(self.update_wifi_temp)
-        # Wifi Module Temperature Check Delay
-        self.temp_timer.start(1000)  
+        self.temp_timer.setSingleShot(True)
+        self.temp_timer.timeout.connect(self._on_temp_timer)
+        self._temp_interval_ms = TEMP_INTERVAL_START_MS
+        # Polling is paused while the window is hidden or minimized (see showEvent/hideEvent)
+        self._temp_polling_paused = False
+        self.temp_timer.start(self._temp_interval_ms)
+        # Periodic connection check; re-armed when a check is submitted, not when it
+        # finishes, so the cadence doesn't drift with SSH round-trip time
+        self.conn_check_timer = QTimer(self)
+        self.conn_check_timer.setSingleShot(True)
+        self.conn_check_timer.timeout.connect(self.periodic_connection_check)
 
         # Initial connection check
         self.refresh_connection_status()
@@ -237,69 +441,53 @@ class DroneControlApp(QMainWindow):
         # Header row
         header_layout = QHBoxLayout()
         lblTitle = QLabel("Camera Control")
-        lblTitle.setStyleSheet(f"font-size: {int(20 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblTitle.setStyleSheet(HOME_TITLE_CSS)
         header_layout.addWidget(lblTitle)
         header_layout.addStretch()
         header_layout.addWidget(self.companion_version_label)
         layout.addLayout(header_layout)
 
-        # Switch row
-        rowSwitch = QHBoxLayout()
-        rowSwitch.setSpacing(int(15 * SCALE))
-        btnFrontSW = self.create_tile_button("F-SW", "#008B8B",
-                                             "Front camera switched.",
-                                             self.front_switch,
-                                             "Failed to switch front camera. Check SSH credentials or remote command.")
-        btnBottomSW = self.create_tile_button("B-SW", "#008B8B",
-                                              "Bottom camera switched.",
-                                              self.bottom_switch,
-                                              "Failed to switch bottom camera. Check SSH credentials or remote command.")
-        btnSplitFBSW = self.create_tile_button("F/B-SW", "#008B8B",
-                                               "Split (Front/Bottom) switched.",
-                                               self.split_front_bottom,
-                                               "Failed to switch split (front/bottom). Check SSH credentials or remote command.")
-        btnSplitBFSW = self.create_tile_button("B/F-SW", "#008B8B",
-                                               "Split (Bottom/Front) switched.",
-                                               self.split_bottom_front,
-                                               "Failed to switch split (bottom/front). Check SSH credentials or remote command.")
-        rowSwitch.addWidget(btnFrontSW)
-        rowSwitch.addWidget(btnBottomSW)
-        rowSwitch.addWidget(btnSplitFBSW)
-        rowSwitch.addWidget(btnSplitBFSW)
-        layout.addLayout(rowSwitch)
-
-        # Capture row
-        rowCapture = QHBoxLayout()
-        rowCapture.setSpacing(int(15 * SCALE))
-        btnCaptureFront = self.create_tile_button("Capture - Front", "#FFB900",
-                                                  "Captured image from Front camera.",
-                                                  self.capture_front,
-                                                  "Failed to capture front image. Check SSH credentials or remote command.")
-        btnCaptureBottom = self.create_tile_button("Capture - Bottom", "#FFB900",
-                                                   "Captured image from Bottom camera.",
-                                                   self.capture_bottom,
-                                                   "Failed to capture bottom image. Check SSH credentials or remote command.")
-        rowCapture.addWidget(btnCaptureFront)
-        rowCapture.addWidget(btnCaptureBottom)
-        layout.addLayout(rowCapture)
+        # Tile rows: (text, success message, slot, error message) per button
+        switch_specs = (
+            ("F-SW", "Front camera switched.", self.front_switch,
+             "Failed to switch front camera. Check SSH credentials or remote command."),
+            ("B-SW", "Bottom camera switched.", self.bottom_switch,
+             "Failed to switch bottom camera. Check SSH credentials or remote command."),
+            ("F/B-SW", "Split (Front/Bottom) switched.", self.split_front_bottom,
+             "Failed to switch split (front/bottom). Check SSH credentials or remote command."),
+            ("B/F-SW", "Split (Bottom/Front) switched.", self.split_bottom_front,
+             "Failed to switch split (bottom/front). Check SSH credentials or remote command."),
+        )
+        capture_specs = (
+            ("Capture - Front", "Captured image from Front camera.", lambda: self._capture(True),
+             "Failed to capture front image. Check SSH credentials or remote command."),
+            ("Capture - Bottom", "Captured image from Bottom camera.", lambda: self._capture(False),
+             "Failed to capture bottom image. Check SSH credentials or remote command."),
+        )
+        create_tile_button = self.create_tile_button
+        for bg_color, specs in (("#008B8B", switch_specs), ("#FFB900", capture_specs)):
+            row = QHBoxLayout()
+            row.setSpacing(int(15 * SCALE))
+            for text, success_msg, slot, error_msg in specs:
+                row.addWidget(create_tile_button(text, bg_color, success_msg, slot, error_msg))
+            layout.addLayout(row)
 
         # Record row
         rowRecord = QHBoxLayout()
         rowRecord.setSpacing(int(15 * SCALE))
-        btnRecordFront = QPushButton("Record - Front")
-        btnRecordFront.setStyleSheet(self._record_btn_css())
-        btnRecordFront.clicked.connect(self.record_front)
-        btnRecordBottom = QPushButton("Record - Bottom")
-        btnRecordBottom.setStyleSheet(self._record_btn_css())
-        btnRecordBottom.clicked.connect(self.record_bottom)
-        rowRecord.addWidget(btnRecordFront)
-        rowRecord.addWidget(btnRecordBottom)
+        record_css = self._record_btn_css()
+        for text, slot in (("Record - Front", lambda: self._record(True)),
+                          ("Record - Bottom", lambda: self._record(False))):
+            btn = QPushButton(text)
+            btn.setStyleSheet(record_css)
+            btn.clicked.connect(slot)
+            rowRecord.addWidget(btn)
         layout.addLayout(rowRecord)
 
         # Duration row
         dur_layout = QHBoxLayout()
         lblDur = QLabel("Record Duration (sec):")
-        lblDur.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; color: #FFFFFF;")
+        lblDur.setStyleSheet(FIELD_LABEL_CSS)
         self.record_duration_entry = QLineEdit()
         self.record_duration_entry.setFixedWidth(int(100 * SCALE))
         self.record_duration_entry.setPlaceholderText("Seconds")
@@ -309,27 +497,14 @@ class DroneControlApp(QMainWindow):
 
         # Placeholder
         placeholder = QLabel("[Camera feed preview or additional info here...]")
-        placeholder.setStyleSheet(f"background-color: #3A3A3A; border: 1px solid #555555; font-size: {int(12 * SCALE)}pt; color: #FFFFFF;")
+        placeholder.setStyleSheet(PLACEHOLDER_CSS)
         placeholder.setAlignment(Qt.AlignCenter)
         layout.addWidget(placeholder)
 
         return page
 
     def _record_btn_css(self):
-        return f"""
-            QPushButton {{
-                background-color: #10893E;
-                color: white;
-                border: 1px solid #555555;
-                font-size: {int(14 * SCALE)}pt;
-                padding: {int(8 * SCALE)}px;
-                margin: {int(6 * SCALE)}px;
-                min-width: {int(130 * SCALE)}px;
-                min-height: {int(60 * SCALE)}px;
-            }}
-            QPushButton:hover {{ background-color: #666666; }}
-            QPushButton:pressed {{ background-color: #777777; }}
-        """
+        return RECORD_BUTTON_CSS
 
     # -------------------- Left Dock --------------------
     def create_left_dock(self):
@@ -341,31 +516,21 @@ class DroneControlApp(QMainWindow):
         dock.setStyleSheet("background-color: #2E2E2E;")
 
         menuWidget = QWidget()
+        # Hold off repaints while the dock is populated; the layout is activated once at the end
+        menuWidget.setUpdatesEnabled(False)
         menuLayout = QVBoxLayout(menuWidget)
         menuLayout.setContentsMargins(int(10 * SCALE), int(10 * SCALE), int(10 * SCALE), int(10 * SCALE))
         menuLayout.setSpacing(int(10 * SCALE))
 
-        def style_menu_button(btn):
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #444444;
-                    color: white;
-                    border: 1px solid #555555;
-                    font-size: 14pt;
-                    padding: 10px;
-                    margin: 4px;
-                    min-width: 100px;
-                }
-                QPushButton:hover { background-color: #555555; }
-                QPushButton:pressed { background-color: #666666; }
-            """)
-
-        btnHome = QPushButton("Home");            style_menu_button(btnHome)
-        btnSettings = QPushButton("Settings");    style_menu_button(btnSettings)
-        btnCompanionSSH = QPushButton("Companion SSH"); style_menu_button(btnCompanionSSH)
-        btnRelaySSH = QPushButton("Relay SSH");   style_menu_button(btnRelaySSH)
-        btnQGC = QPushButton("Launch QGC App");   style_menu_button(btnQGC)
-        btnExit = QPushButton("Exit");            style_menu_button(btnExit)
+        # One shared rule for the menu buttons instead of a stylesheet per button
+        menuWidget.setStyleSheet(LEFT_MENU_CSS)
+
+        btnHome = QPushButton("Home")
+        btnSettings = QPushButton("Settings")
+        btnCompanionSSH = QPushButton("Companion SSH")
+        btnRelaySSH = QPushButton("Relay SSH")
+        btnQGC = QPushButton("Launch QGC App")
+        btnExit = QPushButton("Exit")
 
         btnHome.clicked.connect(lambda: self.stack.setCurrentWidget(self.page_home))
         btnSettings.clicked.connect(lambda: self.stack.setCurrentWidget(self.page_conn))
@@ -375,6 +540,7 @@ class DroneControlApp(QMainWindow):
         btnExit.clicked.connect(self.close)
 
         for btn in [btnHome, btnSettings, btnCompanionSSH, btnRelaySSH, btnQGC, btnExit]:
+            btn.setObjectName("LeftMenuBtn")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             menuLayout.addWidget(btn)
 
@@ -405,6 +571,8 @@ class DroneControlApp(QMainWindow):
         menuLayout.addWidget(relayRebootBtn)
         menuLayout.addWidget(relayShutdownBtn)
         menuLayout.addStretch()
+        menuLayout.activate()
+        menuWidget.setUpdatesEnabled(True)
 
         dock.setWidget(menuWidget)
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
@@ -428,7 +596,10 @@ class DroneControlApp(QMainWindow):
 
     # -------------------- Settings / Connection Page --------------------
     def create_conn_page(self):
+        executor = self.ssh_executor
+        get = executor.ssh_config.get
         page = QWidget()
+        page.setUpdatesEnabled(False)
         main_layout = QVBoxLayout(page)
         main_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
         main_layout.setSpacing(int(20 * SCALE))
@@ -446,26 +617,23 @@ class DroneControlApp(QMainWindow):
         # Column 1 - Companion
         col1 = QWidget(); col1_layout = QVBoxLayout(col1); col1_layout.setSpacing(int(5 * SCALE))
         lblSSH = QLabel("Companion SSH Configuration")
-        lblSSH.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblSSH.setStyleSheet(SECTION_TITLE_CSS)
         col1_layout.addWidget(lblSSH)
-        col1_layout.addWidget(QLabel("Primary IP (Relay Tunnel):"))
-        self.primary_ip_entry = QLineEdit(self.ssh_executor.ssh_config.get("primary_ip", "10.5.6.100"))
-        col1_layout.addWidget(self.primary_ip_entry)
-        col1_layout.addWidget(QLabel("Primary Port (Relay Tunnel):"))
-        self.primary_port_entry = QLineEdit(self.ssh_executor.ssh_config.get("primary_port", "2222"))
-        col1_layout.addWidget(self.primary_port_entry)
-        col1_layout.addWidget(QLabel("Secondary IP (Optional):"))
-        self.secondary_ip_entry = QLineEdit(str(self.ssh_executor.ssh_config.get("secondary_ip", "")))
-        col1_layout.addWidget(self.secondary_ip_entry)
-        col1_layout.addWidget(QLabel("Secondary Port:"))
-        self.secondary_port_entry = QLineEdit(str(self.ssh_executor.ssh_config.get("secondary_port", "22")))
-        col1_layout.addWidget(self.secondary_port_entry)
-        col1_layout.addWidget(QLabel("Username (Companion):"))
-        self.username_entry = QLineEdit(self.ssh_executor.username)
-        col1_layout.addWidget(self.username_entry)
-        col1_layout.addWidget(QLabel("Password:"))
+        col1_form = QFormLayout()
+        col1_form.setSpacing(int(5 * SCALE))
+        self.primary_ip_entry = QLineEdit(get("primary_ip", "10.5.6.100"))
+        self.primary_port_entry = QLineEdit(get("primary_port", "2222"))
+        self.secondary_ip_entry = QLineEdit(str(get("secondary_ip", "")))
+        self.secondary_port_entry = QLineEdit(str(get("secondary_port", "22")))
+        self.username_entry = QLineEdit(executor.username)
         self.password_entry = QLineEdit(); self.password_entry.setEchoMode(QLineEdit.Password)
-        col1_layout.addWidget(self.password_entry)
+        col1_form.addRow("Primary IP (Relay Tunnel):", self.primary_ip_entry)
+        col1_form.addRow("Primary Port (Relay Tunnel):", self.primary_port_entry)
+        col1_form.addRow("Secondary IP (Optional):", self.secondary_ip_entry)
+        col1_form.addRow("Secondary Port:", self.secondary_port_entry)
+        col1_form.addRow("Username (Companion):", self.username_entry)
+        col1_form.addRow("Password:", self.password_entry)
+        col1_layout.addLayout(col1_form)
         btnApplySSH = QPushButton("Apply")
         btnApplySSH.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
         btnApplySSH.clicked.connect(self.apply_ssh_config)
@@ -475,20 +643,19 @@ class DroneControlApp(QMainWindow):
         # Column 2 - Relay
         col2 = QWidget(); col2_layout = QVBoxLayout(col2); col2_layout.setSpacing(int(5 * SCALE))
         lblRelaySSH = QLabel("Relay SSH Configuration")
-        lblRelaySSH.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblRelaySSH.setStyleSheet(SECTION_TITLE_CSS)
         col2_layout.addWidget(lblRelaySSH)
-        col2_layout.addWidget(QLabel("Relay IP:"))
-        self.relay_ip_entry = QLineEdit(self.ssh_executor.ssh_config.get("relay_ip", "10.5.6.100"))
-        col2_layout.addWidget(self.relay_ip_entry)
-        col2_layout.addWidget(QLabel("Relay SSH Port:"))
-        self.relay_ssh_port_entry = QLineEdit(self.ssh_executor.ssh_config.get("relay_ssh_port", "22"))
-        col2_layout.addWidget(self.relay_ssh_port_entry)
-        col2_layout.addWidget(QLabel("Username (Relay):"))
-        self.relay_username_entry = QLineEdit(self.ssh_executor.relay_username)
-        col2_layout.addWidget(self.relay_username_entry)
-        col2_layout.addWidget(QLabel("Password:"))
+        col2_form = QFormLayout()
+        col2_form.setSpacing(int(5 * SCALE))
+        self.relay_ip_entry = QLineEdit(get("relay_ip", "10.5.6.100"))
+        self.relay_ssh_port_entry = QLineEdit(get("relay_ssh_port", "22"))
+        self.relay_username_entry = QLineEdit(executor.relay_username)
         self.relay_password_entry = QLineEdit(); self.relay_password_entry.setEchoMode(QLineEdit.Password)
-        col2_layout.addWidget(self.relay_password_entry)
+        col2_form.addRow("Relay IP:", self.relay_ip_entry)
+        col2_form.addRow("Relay SSH Port:", self.relay_ssh_port_entry)
+        col2_form.addRow("Username (Relay):", self.relay_username_entry)
+        col2_form.addRow("Password:", self.relay_password_entry)
+        col2_layout.addLayout(col2_form)
         btnApplyRelaySSH = QPushButton("Apply")
         btnApplyRelaySSH.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
         btnApplyRelaySSH.clicked.connect(self.apply_relay_ssh_config)
@@ -498,20 +665,20 @@ class DroneControlApp(QMainWindow):
         # Column 3 - Periodic Check
         col3 = QWidget(); col3_layout = QVBoxLayout(col3); col3_layout.setSpacing(int(5 * SCALE))
         lblCheck = QLabel("Periodic Connection Check")
-        lblCheck.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblCheck.setStyleSheet(SECTION_TITLE_CSS)
         col3_layout.addWidget(lblCheck)
         self.conn_check_enabled_box = QCheckBox("Enable Periodic Connection Check")
         self.conn_check_enabled_box.setChecked(self.connection_check_enabled)
         col3_layout.addWidget(self.conn_check_enabled_box)
-        col3_layout.addWidget(QLabel("Check Interval (seconds):"))
+        col3_form = QFormLayout()
+        col3_form.setSpacing(int(5 * SCALE))
         self.interval_entry = QLineEdit(str(self.connection_check_interval // 1000))  # seconds
-        col3_layout.addWidget(self.interval_entry)
-        self.timeout_entry = QLineEdit(str(self.ssh_executor.timeout))
-        col3_layout.addWidget(QLabel("Timeout (seconds):"))
-        col3_layout.addWidget(self.timeout_entry)
-        self.max_attempts_entry = QLineEdit(str(self.ssh_executor.max_attempts))
-        col3_layout.addWidget(QLabel("Max Attempts:"))
-        col3_layout.addWidget(self.max_attempts_entry)
+        self.timeout_entry = QLineEdit(str(executor.timeout))
+        self.max_attempts_entry = QLineEdit(str(executor.max_attempts))
+        col3_form.addRow("Check Interval (seconds):", self.interval_entry)
+        col3_form.addRow("Timeout (seconds):", self.timeout_entry)
+        col3_form.addRow("Max Attempts:", self.max_attempts_entry)
+        col3_layout.addLayout(col3_form)
         btnApplyCheck = QPushButton("Apply")
         btnApplyCheck.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
         btnApplyCheck.clicked.connect(self.apply_connection_settings)
@@ -528,7 +695,7 @@ class DroneControlApp(QMainWindow):
         main_cam_layout.setSpacing(int(20 * SCALE))
 
         lblCamTitle = QLabel("Camera Settings")
-        lblCamTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblCamTitle.setStyleSheet(PAGE_TITLE_CSS)
         main_cam_layout.addWidget(lblCamTitle)
 
         form_layout = QFormLayout()
@@ -572,7 +739,7 @@ class DroneControlApp(QMainWindow):
         about_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
         about_layout.setSpacing(int(10 * SCALE))
         lblAboutTitle = QLabel("About Drone_control_v1.3")
-        lblAboutTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblAboutTitle.setStyleSheet(PAGE_TITLE_CSS)
         about_layout.addWidget(lblAboutTitle)
         about_text = QTextEdit()
         about_text.setReadOnly(True)
@@ -603,6 +770,8 @@ This application provides a user-friendly interface to manage drone camera contr
         about_layout.addWidget(about_text)
         tab_widget.addTab(about_tab, "About")
 
+        main_layout.activate()
+        page.setUpdatesEnabled(True)
         return page
 
     # -------------------- Camera control helpers --------------------
@@ -615,244 +784,205 @@ This application provides a user-friendly interface to manage drone camera contr
     def front_switch(self):
         device = "/dev/video2" if self.camera_swapped else "/dev/video0"
         command = f"sudo vision_config_manager {device}"
-        if self.ssh_executor.execute_command(command, "Front camera switched.", "Failed to switch front camera. Check SSH credentials or remote command."):
-            self.show_success_message("Front camera switched.")
-        else:
-            self.show_error_message("Failed to switch front camera. Check SSH credentials or remote command.")
+        self._run_command(command, "Front camera switched.", "Failed to switch front camera. Check SSH credentials or remote command.")
 
     def bottom_switch(self):
         device = "/dev/video0" if self.camera_swapped else "/dev/video2"
         command = f"sudo vision_config_manager {device}"
-        if self.ssh_executor.execute_command(command, "Bottom camera switched.", "Failed to switch bottom camera. Check SSH credentials or remote command."):
-            self.show_success_message("Bottom camera switched.")
-        else:
-            self.show_error_message("Failed to switch bottom camera. Check SSH credentials or remote command.")
+        self._run_command(command, "Bottom camera switched.", "Failed to switch bottom camera. Check SSH credentials or remote command.")
 
     def split_front_bottom(self):
         command = "sudo vision_config_manager /dev/video2 /dev/video0" if self.camera_swapped else "sudo vision_config_manager /dev/video0 /dev/video2"
-        if self.ssh_executor.execute_command(command, "Split (Front/Bottom) switched.", "Failed to switch split (front/bottom). Check SSH credentials or remote command."):
-            self.show_success_message("Split (Front/Bottom) switched.")
-        else:
-            self.show_error_message("Failed to switch split (front/bottom). Check SSH credentials or remote command.")
+        self._run_command(command, "Split (Front/Bottom) switched.", "Failed to switch split (front/bottom). Check SSH credentials or remote command.")
 
     def split_bottom_front(self):
         command = "sudo vision_config_manager /dev/video0 /dev/video2" if self.camera_swapped else "sudo vision_config_manager /dev/video2 /dev/video0"
-        if self.ssh_executor.execute_command(command, "Split (Bottom/Front) switched.", "Failed to switch split (bottom/front). Check SSH credentials or remote command."):
-            self.show_success_message("Split (Bottom/Front) switched.")
-        else:
-            self.show_error_message("Failed to switch split (bottom/front). Check SSH credentials or remote command.")
+        self._run_command(command, "Split (Bottom/Front) switched.", "Failed to switch split (bottom/front). Check SSH credentials or remote command.")
 
-    def capture_front(self):
-        device = "/dev/video2" if self.camera_swapped else "/dev/video0"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        remote_path = f"/home/roz/Model_image/Rozcam_{timestamp}.jpg"
-        local_path = os.path.join(os.path.expanduser("~"), "Pictures", f"Rozcam_{timestamp}.jpg")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -i {device}"
-        if self.ssh_executor.execute_command(command, f"Captured image from Front ({device}).", "Failed to capture front image. Check SSH credentials or remote command."):
-            time.sleep(2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Front image captured and saved to {transferred_path}")
-            else:
-                self.show_error_message(f"Failed to transfer front image from {remote_path}. Check path or permissions.")
+    def _run_command(self, command, success_msg, error_msg):
+        """Run a remote command on the thread pool and report the outcome on the GUI thread."""
+        self._start_task(self.ssh_executor.execute_command, command, success_msg, error_msg,
+                         on_done=lambda ok: self._show_outcome(ok, success_msg, error_msg),
+                         on_error=lambda msg: self.show_error_message(error_msg))
+
+    def _show_outcome(self, ok, success_msg, error_msg):
+        if ok:
+            self.show_success_message(success_msg)
         else:
-            self.show_error_message("Failed to capture front image. Check SSH credentials or remote command.")
+            self.show_error_message(error_msg)
 
-    def capture_bottom(self):
-        device = "/dev/video0" if self.camera_swapped else "/dev/video2"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        remote_path = f"/home/roz/Model_image/Rozcam_{timestamp}.jpg"
-        local_path = os.path.join(os.path.expanduser("~"), "Pictures", f"Rozcam_{timestamp}.jpg")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -i {device}"
-        if self.ssh_executor.execute_command(command, f"Captured image from Bottom ({device}).", "Failed to capture bottom image. Check SSH credentials or remote command."):
-            time.sleep(2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Bottom image captured and saved to {transferred_path}")
+    def _capture_and_fetch(self, command, run_msg, fail_msg, wait_s, remote_path, local_path,
+                           saved_msg, transfer_fail_msg, run_timeout=None):
+        """
+        Run a Rozcam command off the GUI thread, then fetch its output file once it should
+        exist (wait_s later) instead of sleeping on the event loop.
+        """
+        def _on_done(ok):
+            if ok:
+                QTimer.singleShot(wait_s * 1000, lambda: self._post_record_transfer(
+                    remote_path, local_path, saved_msg, transfer_fail_msg))
             else:
-                self.show_error_message(f"Failed to transfer bottom image from {remote_path}. Check path or permissions.")
-        else:
-            self.show_error_message("Failed to capture bottom image. Check SSH credentials or remote command.")
+                self.show_error_message(fail_msg)
 
-    def record_front(self):
-        device = "/dev/video2" if self.camera_swapped else "/dev/video0"
-        dur = self.record_duration_entry.text().strip()
-        if not dur.isdigit():
-            self.show_error_message("Please enter a valid duration in seconds.")
-            return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        remote_path = f"/home/roz/Model_video/Rozcam_{timestamp}.mp4"
-        local_path = os.path.join(os.path.expanduser("~"), "Videos", f"Rozcam_{timestamp}.mp4")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -v {device} {dur}"
-        if self.ssh_executor.execute_command(command, f"Recording Front camera ({device}) for {dur} seconds.", "Failed to record front camera. Check SSH credentials or remote command."):
-            time.sleep(int(dur) + 2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
+        self._start_task(self.ssh_executor.execute_command, command, run_msg, fail_msg, None, run_timeout,
+                         on_done=_on_done, on_error=lambda msg: self.show_error_message(fail_msg))
+
+    def _post_record_transfer(self, remote_path, local_path, saved_msg, transfer_fail_msg):
+        def _on_done(result):
+            success, transferred_path = result
             if success:
-                self.show_success_message(f"Front video recorded and saved to {transferred_path}")
+                self.show_success_message(f"{saved_msg} {transferred_path}")
             else:
-                self.show_error_message(f"Failed to transfer front video from {remote_path}. Check path or duration.")
-        else:
-            self.show_error_message("Failed to record front camera. Check SSH credentials or remote command.")
+                self.show_error_message(transfer_fail_msg)
 
-    def record_bottom(self):
-        device = "/dev/video0" if self.camera_swapped else "/dev/video2"
+        self._start_task(self.ssh_executor.transfer_file, remote_path, local_path,
+                         on_done=_on_done, on_error=lambda msg: self.show_error_message(transfer_fail_msg))
+
+    def _camera_device(self, is_front):
+        # Front is /dev/video0 unless the cameras are swapped
+        return "/dev/video0" if is_front != self.camera_swapped else "/dev/video2"
+
+    def _capture(self, is_front):
+        device = self._camera_device(is_front)
+        label = "Front" if is_front else "Bottom"
+        timestamp = _ts()
+        remote_path = f"/home/roz/Model_image/Rozcam_{timestamp}.jpg"
+        local_path = os.path.join(self._pics_dir, f"Rozcam_{timestamp}.jpg")
+        self._capture_and_fetch(f"Rozcam -i {device}", f"Captured image from {label} ({device}).",
+                                f"Failed to capture {label.lower()} image. Check SSH credentials or remote command.",
+                                2, remote_path, local_path, f"{label} image captured and saved to",
+                                f"Failed to transfer {label.lower()} image from {remote_path}. Check path or permissions.")
+
+    def _record(self, is_front):
+        device = self._camera_device(is_front)
+        label = "Front" if is_front else "Bottom"
         dur = self.record_duration_entry.text().strip()
         if not dur.isdigit():
             self.show_error_message("Please enter a valid duration in seconds.")
             return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _ts()
         remote_path = f"/home/roz/Model_video/Rozcam_{timestamp}.mp4"
-        local_path = os.path.join(os.path.expanduser("~"), "Videos", f"Rozcam_{timestamp}.mp4")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -v {device} {dur}"
-        if self.ssh_executor.execute_command(command, f"Recording Bottom camera ({device}) for {dur} seconds.", "Failed to record bottom camera. Check SSH credentials or remote command."):
-            time.sleep(int(dur) + 2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Bottom video recorded and saved to {transferred_path}")
-            else:
-                self.show_error_message(f"Failed to transfer bottom video from {remote_path}. Check path or duration.")
-        else:
-            self.show_error_message("Failed to record bottom camera. Check SSH credentials or remote command.")
+        local_path = os.path.join(self._vids_dir, f"Rozcam_{timestamp}.mp4")
+        self._capture_and_fetch(f"Rozcam -v {device} {dur}", f"Recording {label} camera ({device}) for {dur} seconds.",
+                                f"Failed to record {label.lower()} camera. Check SSH credentials or remote command.",
+                                int(dur) + 2, remote_path, local_path, f"{label} video recorded and saved to",
+                                f"Failed to transfer {label.lower()} video from {remote_path}. Check path or duration.",
+                                run_timeout=int(dur) + self.ssh_executor.timeout)
 
     # -------------------- Connection / status --------------------
-    def refresh_connection_status(self):
-        if self.is_rebooting_or_shutting_down:
-            self.update_connection_status("System Rebooting/Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
-            return
-
-        original_timeout = self.ssh_executor.timeout
-        original_max_attempts = self.ssh_executor.max_attempts
-        try:
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-            self.ssh_executor.max_attempts = int(self.ssh_executor.max_attempts)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings, using defaults.")
-            self.ssh_executor.timeout = 5
-            self.ssh_executor.max_attempts = 3
-
+    def _start_task(self, fn, *args, on_done=None, on_error=None):
+        """Run blocking SSH work fn(*args) on QThreadPool; on_done/on_error run on the GUI thread."""
+        task = SSHTask(fn, *args)
+
+        def _finished(result):
+            self._ssh_tasks.discard(task)
+            if on_done is not None:
+                on_done(result)
+
+        def _failed(msg):
+            self._ssh_tasks.discard(task)
+            logger.error("Background SSH task failed: %s", msg)
+            if on_error is not None:
+                on_error(msg)
+
+        task.signals.finished.connect(_finished)
+        task.signals.error.connect(_failed)
+        self._ssh_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def _check_connection(self):
+        """Worker-thread half of the connection check: returns the reachable IP or None."""
         reachable_ip = self.ssh_executor.test_connection()
+        if not reachable_ip:
+            self.ssh_executor.restart_relay_ssh_tunnel()
+        return reachable_ip
+
+    def _run_connection_check(self, periodic):
+        if self._conn_check_running:
+            return False
+        self._conn_check_running = True
+        self._start_task(self._check_connection,
+                         on_done=lambda ip: self._on_conn_checked(ip, periodic),
+                         on_error=lambda msg: self._on_conn_checked(None, periodic))
+        return True
+
+    def _on_conn_checked(self, reachable_ip, periodic):
+        self._conn_check_running = False
+        if not reachable_ip and self._boot_wait is not None:
+            delay_ms, waited_ms = self._boot_wait
+            if waited_ms < BOOT_WAIT_GIVE_UP_MS:
+                self._boot_wait = (min(delay_ms * 2, BOOT_RETRY_MAX_MS), waited_ms + delay_ms)
+                self.update_connection_status("Booting…", "gray", "Drone IP: Waiting for SSH port", "gray")
+                QTimer.singleShot(delay_ms, self.refresh_connection_status)
+                return
+        self._boot_wait = None
         if reachable_ip:
             self.update_connection_status("Connected and Ready", "green", f"Drone IP: {reachable_ip}:{self.ssh_executor.current_port}", "green")
-            self.update_companion_version()
-            self.update_wifi_temp()  # refresh immediately on connect
+            if periodic and not self.time_synced:
+                self.sync_time_with_popup(reachable_ip)
+                self.time_synced = True
+            self.update_wifi_temp()  # refresh temp + companion version immediately on connect
         else:
             self.update_connection_status("Not Ready", "red", "Drone IP: Not Connected", "red")
-            self.ssh_executor.restart_relay_ssh_tunnel()
 
-        self.ssh_executor.timeout = original_timeout
-        self.ssh_executor.max_attempts = original_max_attempts
+    def refresh_connection_status(self):
+        if self.is_rebooting_or_shutting_down:
+            self.update_connection_status("System Rebooting/Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
+            return
+        self._run_connection_check(periodic=False)
 
     def periodic_connection_check(self):
         if not self.connection_check_enabled or self.is_rebooting_or_shutting_down:
+            self.conn_check_timer.stop()
             self.update_connection_status("Connection Check Disabled", "gray", "Drone IP: N/A", "gray")
             return
-
-        original_timeout = self.ssh_executor.timeout
-        original_max_attempts = self.ssh_executor.max_attempts
-        try:
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-            self.ssh_executor.max_attempts = int(self.ssh_executor.max_attempts)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings, using defaults.")
-            self.ssh_executor.timeout = 5
-            self.ssh_executor.max_attempts = 3
-
-        reachable_ip = self.ssh_executor.test_connection()
-        if reachable_ip:
-            self.update_connection_status("Connected and Ready", "green", f"Drone IP: {reachable_ip}:{self.ssh_executor.current_port}", "green")
-            if not self.time_synced:
-                self.sync_time_with_popup(reachable_ip)
-                self.time_synced = True
-            self.update_companion_version()
-            self.update_wifi_temp()
-        else:
-            self.update_connection_status("Not Ready", "red", "Drone IP: Not Connected", "red")
-            self.ssh_executor.restart_relay_ssh_tunnel()
-
-        self.ssh_executor.timeout = original_timeout
-        self.ssh_executor.max_attempts = original_max_attempts
-        QTimer.singleShot(self.connection_check_interval, self.periodic_connection_check)
+        self.conn_check_timer.start(self.connection_check_interval)
+        # If a check is already in flight this tick is skipped; the timer retries next interval
+        self._run_connection_check(periodic=True)
 
     def update_connection_status(self, status_text, status_color, ip_text, ip_color):
-        if status_color.lower() == "green":
-            combined_text = f"Connected and Ready | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: black;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
-            """)
-        elif status_color.lower() == "red":
-            combined_text = f"Not Ready | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #8B0000, stop:1 #FF6347);
-            """)
+        color = status_color.lower()
+        if color == "green":
+            combined_text, css = f"Connected and Ready | {ip_text}", STATUS_GREEN_CSS
+        elif color == "red":
+            combined_text, css = f"Not Ready | {ip_text}", STATUS_RED_CSS
         else:
-            combined_text = f"{status_text} | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: #FFFFFF;
-                background-color: #2E2E2E;
-            """)
+            combined_text, css = f"{status_text} | {ip_text}", STATUS_GRAY_CSS
+        # Periodic checks mostly repeat the last state; skip the relabel and CSS re-parse then
+        key = (css, combined_text)
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        self.top_status_label.setText(combined_text)
+        self.top_status_label.setStyleSheet(css)
 
     def sync_time_with_popup(self, reachable_ip):
         logger.info("Synchronizing time with drone at IP: %s:%s", reachable_ip, self.ssh_executor.current_port)
-        success = self.ssh_executor.sync_date_time()
+        self._start_task(self.ssh_executor.sync_date_time,
+                         on_done=self._on_time_synced, on_error=lambda msg: self._on_time_synced(False))
+
+    def _on_time_synced(self, success):
         if success:
             self.show_success_message("Time synchronized with the drone.")
         else:
             self.show_error_message("Failed to synchronize time with the drone.")
 
     def update_companion_version(self):
-        command = "cat /etc/sid.conf"  # Assumes remote is Linux
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        try:
-            ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-            stdin, stdout, stderr = ssh.exec_command(command)
-            content = stdout.read().decode().strip()
-            version = "N/A"
-            if content:
-                match = re.search(r"[\s:](\d+\.\d+)", content)
-                version = match.group(1) if match else "N/A"
-            self.companion_version_label.setText(f"Companion Version: {version}")
-        except paramiko.AuthenticationException as e:
-            logger.error("SSH Authentication failed for version retrieval: %s", e)
-            self.companion_version_label.setText("Companion Version: N/A")
-        except Exception as e:
-            logger.error("Error retrieving companion version: %s", e)
-            self.companion_version_label.setText("Companion Version: N/A")
-        finally:
-            ssh.close()
+        # The version is read from sid.conf in the same batched query as the Wi-Fi temp
+        self.update_wifi_temp()
+
+    def _on_companion_version(self, content):
+        version = "N/A"
+        if content:
+            match = _RE_VERSION.search(content)
+            version = match.group(1) if match else "N/A"
+        self.companion_version_label.setText(f"Companion Version: {version}")
 
     # -------------------- Generic helpers --------------------
     def create_tile_button(self, text, bg_color, success_msg, command, error_msg):
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: 1px solid #555555;
-                font-size: {int(14 * SCALE)}pt;
-                padding: {int(8 * SCALE)}px;
-                margin: {int(6 * SCALE)}px;
-                min-width: {int(130 * SCALE)}px;
-                min-height: {int(60 * SCALE)}px;
-            }}
-            QPushButton:hover {{ background-color: #666666; }}
-            QPushButton:pressed {{ background-color: #777777; }}
-        """)
+        btn.setStyleSheet(tile_button_css(bg_color))
         if callable(command):
             btn.clicked.connect(command)
         else:
@@ -860,80 +990,120 @@ This application provides a user-friendly interface to manage drone camera contr
         return btn
 
     def execute_ssh_command(self, command, success_msg, error_msg):
-        if self.ssh_executor.execute_command(command, success_msg, error_msg):
-            self.show_success_message(success_msg)
-        else:
-            self.show_error_message(error_msg)
+        self._run_command(command, success_msg, error_msg)
 
     # -------------------- Settings actions --------------------
+    def _validate_endpoint(self, label, host, port, optional=False):
+        """Show an error and return False unless host/port look like a hostname/IP and a TCP port."""
+        if optional and not host:
+            return True
+        if not _RE_HOST.match(host):
+            self.show_error_message(f"Invalid {label} address: {host!r}")
+            return False
+        if not _RE_PORT.match(port) or not 0 < int(port) < 65536:
+            self.show_error_message(f"Invalid {label} port: {port!r}")
+            return False
+        return True
+
     def apply_ssh_config(self):
-        self.ssh_executor.ssh_config["primary_ip"] = self.primary_ip_entry.text().strip()
-        self.ssh_executor.ssh_config["primary_port"] = self.primary_port_entry.text().strip()
-        self.ssh_executor.ssh_config["secondary_ip"] = self.secondary_ip_entry.text().strip()
-        self.ssh_executor.ssh_config["secondary_port"] = self.secondary_port_entry.text().strip()
-        self.ssh_executor.username = self.username_entry.text().strip()
+        executor = self.ssh_executor
+        cfg = executor.ssh_config
+        new = {
+            "primary_ip": self.primary_ip_entry.text().strip(),
+            "primary_port": self.primary_port_entry.text().strip(),
+            "secondary_ip": self.secondary_ip_entry.text().strip(),
+            "secondary_port": self.secondary_port_entry.text().strip(),
+        }
+        if not (self._validate_endpoint("primary", new["primary_ip"], new["primary_port"])
+                and self._validate_endpoint("secondary", new["secondary_ip"], new["secondary_port"], optional=True)):
+            return
+        username = self.username_entry.text().strip()
         password = self.password_entry.text().strip()
-        if password:
-            keyring.set_password("Drone-Control", self.ssh_executor.username, password)
-            self.ssh_executor.password = password
-        self.ssh_executor.save_config()
-        self.ssh_executor.current_ip = self.ssh_executor.ssh_config["primary_ip"]
-        self.ssh_executor.current_port = self.ssh_executor.ssh_config["primary_port"]
+        config_changed = new != {key: str(cfg.get(key) or "") for key in new}
+        password_changed = bool(password) and password != executor.password
+        if not config_changed and not password_changed and username == executor.username:
+            self.show_success_message("No changes to Companion SSH Configuration.")
+            return
+        cfg.update(new)
+        executor.username = username
+        if password_changed:
+            executor.store_password(username, password)
+            executor.password = password
+        if config_changed:
+            executor.save_config()
+        executor.current_ip = cfg["primary_ip"]
+        executor.current_port = cfg["primary_port"]
         logger.info("Companion SSH Configuration updated: primary IP = %s:%s, secondary IP = %s:%s",
-                    self.ssh_executor.ssh_config["primary_ip"],
-                    self.ssh_executor.ssh_config["primary_port"],
-                    self.ssh_executor.ssh_config["secondary_ip"],
-                    self.ssh_executor.ssh_config["secondary_port"])
+                    cfg["primary_ip"], cfg["primary_port"], cfg["secondary_ip"], cfg["secondary_port"])
         self.show_success_message("Companion SSH Configuration updated successfully!")
         self.refresh_connection_status()
 
     def apply_relay_ssh_config(self):
-        self.ssh_executor.ssh_config["relay_ip"] = self.relay_ip_entry.text().strip()
-        self.ssh_executor.ssh_config["relay_ssh_port"] = self.relay_ssh_port_entry.text().strip()
-        self.ssh_executor.relay_username = self.relay_username_entry.text().strip()
+        executor = self.ssh_executor
+        cfg = executor.ssh_config
+        new = {
+            "relay_ip": self.relay_ip_entry.text().strip(),
+            "relay_ssh_port": self.relay_ssh_port_entry.text().strip(),
+        }
+        if not self._validate_endpoint("relay", new["relay_ip"], new["relay_ssh_port"]):
+            return
+        relay_username = self.relay_username_entry.text().strip()
         relay_password = self.relay_password_entry.text().strip()
-        if relay_password:
-            keyring.set_password("Drone-Control", self.ssh_executor.relay_username, relay_password)
-            self.ssh_executor.relay_password = relay_password
-        self.ssh_executor.save_config()
-        self.ssh_executor.relay_ip = self.ssh_executor.ssh_config["relay_ip"]
-        self.ssh_executor.relay_ssh_port = self.ssh_executor.ssh_config["relay_ssh_port"]
+        config_changed = new != {key: str(cfg.get(key) or "") for key in new}
+        password_changed = bool(relay_password) and relay_password != executor.relay_password
+        if not config_changed and not password_changed and relay_username == executor.relay_username:
+            self.show_success_message("No changes to Relay SSH Configuration.")
+            return
+        cfg.update(new)
+        executor.relay_username = relay_username
+        if password_changed:
+            executor.store_password(relay_username, relay_password)
+            executor.relay_password = relay_password
+        if config_changed:
+            executor.save_config()
+        executor.relay_ip = cfg["relay_ip"]
+        executor.relay_ssh_port = cfg["relay_ssh_port"]
         logger.info("Relay SSH Configuration updated: IP = %s:%s, username = %s",
-                    self.ssh_executor.ssh_config["relay_ip"],
-                    self.ssh_executor.ssh_config["relay_ssh_port"],
-                    self.ssh_executor.relay_username)
+                    cfg["relay_ip"], cfg["relay_ssh_port"], executor.relay_username)
         self.show_success_message("Relay SSH Configuration updated successfully!")
         self.refresh_connection_status()
 
     def apply_connection_settings(self):
-        self.connection_check_enabled = self.conn_check_enabled_box.isChecked()
-        self.ssh_executor.ssh_config["connection_check_enabled"] = self.connection_check_enabled
-        try:
-            interval_sec = int(self.interval_entry.text())
-            if interval_sec <= 0:
-                self.show_error_message("Interval must be a positive integer.")
-                return
-            self.connection_check_interval = interval_sec * 1000
-            self.ssh_executor.ssh_config["connection_check_interval"] = self.connection_check_interval
-
-            timeout_sec = int(self.timeout_entry.text())
-            if timeout_sec <= 0:
-                self.show_error_message("Timeout must be a positive integer.")
-                return
-            self.ssh_executor.timeout = timeout_sec
+        # Non-numeric input parses to 0 and is rejected by the positivity checks below
+        interval_sec = _safe_int(self.interval_entry.text(), 0)
+        if interval_sec <= 0:
+            self.show_error_message("Interval must be a positive integer.")
+            return
+        timeout_sec = _safe_int(self.timeout_entry.text(), 0)
+        if timeout_sec <= 0:
+            self.show_error_message("Timeout must be a positive integer.")
+            return
+        max_attempts = _safe_int(self.max_attempts_entry.text(), 0)
+        if max_attempts <= 0:
+            self.show_error_message("Max attempts must be a positive integer.")
+            return
 
-            max_attempts = int(self.max_attempts_entry.text())
-            if max_attempts <= 0:
-                self.show_error_message("Max attempts must be a positive integer.")
-                return
-            self.ssh_executor.max_attempts = max_attempts
-        except ValueError:
-            self.show_error_message("Invalid interval, timeout, or max attempts value. Please enter valid integers.")
+        executor = self.ssh_executor
+        enabled = self.conn_check_enabled_box.isChecked()
+        interval_ms = interval_sec * 1000
+        config_changed = (enabled, interval_ms) != (self.connection_check_enabled, self.connection_check_interval)
+        unchanged = (not config_changed and timeout_sec == executor.timeout
+                     and max_attempts == executor.max_attempts)
+        # An unchanged Apply still has to start the periodic check if it isn't running yet
+        if unchanged and (not enabled or self.conn_check_timer.isActive()):
+            self.show_success_message("No changes to connection settings.")
             return
 
-        self.ssh_executor.save_config()
+        self.connection_check_enabled = enabled
+        self.connection_check_interval = interval_ms
+        executor.ssh_config["connection_check_enabled"] = enabled
+        executor.ssh_config["connection_check_interval"] = interval_ms
+        executor.timeout = timeout_sec
+        executor.max_attempts = max_attempts
+        if config_changed:
+            executor.save_config()
         logger.info("Connection settings updated: enabled=%s, interval=%d ms, timeout=%d s, max_attempts=%d",
-                    self.connection_check_enabled, self.connection_check_interval, self.ssh_executor.timeout, self.ssh_executor.max_attempts)
+                    self.connection_check_enabled, self.connection_check_interval, executor.timeout, executor.max_attempts)
         self.show_success_message("Connection settings updated successfully!")
         if self.connection_check_enabled:
             self.periodic_connection_check()
@@ -946,124 +1116,119 @@ This application provides a user-friendly interface to manage drone camera contr
         resolution = self.camera_res_entry.text().strip()
         fps = self.camera_fps_entry.text().strip()
         fmt = self.camera_format_entry.text().strip()
-        command = f"sudo vision_config_manager set-cam-params {device} {resolution} {fps} --format {fmt}"
-        if self.ssh_executor.execute_command(command, "Camera settings updated successfully.", "Failed to update camera settings. Check SSH credentials or remote command availability."):
-            self.update_cam_params_config(device, resolution, fps, fmt)
-            self.show_success_message("Camera settings updated successfully.")
-        else:
-            self.show_error_message("Failed to update camera settings. Check SSH credentials or remote command availability.")
+        error_msg = "Failed to update camera settings. Check SSH credentials or remote command availability."
+        self._start_task(self._apply_camera_params, device, resolution, fps, fmt,
+                         on_done=lambda result: self._show_outcome(result[0], result[1], result[1]),
+                         on_error=lambda msg: self.show_error_message(error_msg))
+
+    def _apply_camera_params(self, device, resolution, fps, fmt):
+        """Worker-thread half of apply_camera_settings; returns (ok, message for the user)."""
+        error = self.update_cam_params_config(device, resolution, fps, fmt)
+        if error:
+            return False, error
+        # Apply the parameters and restart the streaming service in one SSH round-trip
+        commands = [f"sudo vision_config_manager set-cam-params {device} {resolution} {fps} --format {fmt}",
+                    "sudo systemctl restart vision_streaming.service"]
+        if self.ssh_executor.execute_batch(commands, "Camera settings updated and service restarted.", "Failed to update camera settings. Check SSH credentials or remote command availability."):
+            return True, "Camera settings updated and service restarted successfully."
+        return False, "Failed to update camera settings. Check SSH credentials or remote command availability."
 
     def update_cam_params_config(self, device, resolution, fps, cam_format):
+        """
+        Rewrite the device's section of the remote streaming config. Runs on a worker thread;
+        returns None on success, otherwise the error message to show.
+        """
         config_path = "/etc/vision_streaming.conf"
         if sys.platform.startswith('win'):
             logger.warning("Config file update not supported on Windows locally; assuming remote Linux target.")
-        ssh = paramiko.SSHClient(); sftp = None
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
-            ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-            sftp = ssh.open_sftp()
-            with sftp.file(config_path, 'r') as file:
-                lines = file.readlines()
-            in_target = False
-            new_lines = []
-            res_updated = fps_updated = format_updated = False
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    if in_target:
-                        if not res_updated:
-                            new_lines.append(f"resolution = {resolution}\n")
-                        if not fps_updated:
-                            new_lines.append(f"fps = {fps}\n")
-                        if not format_updated:
-                            new_lines.append(f"format = {cam_format}\n")
-                    in_target = False
-                    new_lines.append(line)
-                    continue
-                if "camera_name" in line and device in line:
-                    in_target = True
-                    new_lines.append(line)
-                    continue
-                if in_target:
-                    if stripped.lstrip('#').startswith("resolution"):
-                        new_lines.append(f"resolution = {resolution}\n"); res_updated = True
-                    elif stripped.lstrip('#').startswith("fps"):
-                        new_lines.append(f"fps = {fps}\n"); fps_updated = True
-                    elif stripped.lstrip('#').startswith("format"):
-                        new_lines.append(f"format = {cam_format}\n"); format_updated = True
-                    else:
-                        new_lines.append(line)
-                else:
-                    new_lines.append(line)
-            if in_target:
-                if not res_updated:
-                    new_lines.append(f"resolution = {resolution}\n")
-                if not fps_updated:
-                    new_lines.append(f"fps = {fps}\n")
-                if not format_updated:
-                    new_lines.append(f"format = {cam_format}\n")
-            with sftp.file(config_path, 'w') as file:
-                file.writelines(new_lines)
+            text = self.ssh_executor.read_remote_text(config_path)
+            values = {"resolution": resolution, "fps": fps, "format": cam_format}
+
+            def _replace_section(m):
+                seen = set()
+
+                def _replace_key(km):
+                    seen.add(km.group(1))
+                    return f"{km.group(1)} = {values[km.group(1)]}"
+
+                section_text = m.group(1) + _RE_CAM_KEY.sub(_replace_key, m.group(2))
+                missing = "".join(f"{key} = {value}\n" for key, value in values.items() if key not in seen)
+                if missing and not section_text.endswith("\n"):
+                    section_text += "\n"
+                return section_text + missing
+
+            # The device's section runs from its camera_name line up to the next [header]
+            section = re.compile(
+                rf"^((?=[^\n]*camera_name)(?=[^\n]*{re.escape(device)})[^\n]*\n?)(.*?)(?={_CONF_HEADER}|\Z)",
+                re.M | re.S)
+            new_text = section.sub(_replace_section, text)
+            self.ssh_executor.write_remote_text(config_path, new_text)
             logger.info("Configuration file updated successfully with new camera parameters.")
-            self.control_service('restart')
-            self.show_success_message("Configuration file updated and service restarted successfully.")
-        except paramiko.AuthenticationException as e:
-            logger.error("SSH Authentication failed for config update: %s", e)
-            self.show_error_message("Failed to update config file. Check SSH credentials.")
+            return None
         except Exception as e:
+            if self.ssh_executor.is_auth_error(e):
+                logger.error("SSH Authentication failed for config update: %s", e)
+                return "Failed to update config file. Check SSH credentials."
             logger.error("Error updating config file: %s", e)
-            self.show_error_message(f"Error updating config file: {str(e)}")
-        finally:
-            try:
-                if sftp: sftp.close()
-            except Exception:
-                pass
-            ssh.close()
+            return f"Error updating config file: {str(e)}"
 
     def control_service(self, action):
         if sys.platform.startswith('win'):
             logger.warning("Service control not supported on Windows; assuming remote Linux target.")
         command = f"sudo systemctl {action} vision_streaming.service"
-        if self.ssh_executor.execute_command(command, f"Service {action}ed.", f"Failed to {action} service."):
-            self.show_success_message(f"Service {action}ed.")
-        else:
-            self.show_error_message(f"Failed to {action} service.")
+        self._run_command(command, f"Service {action}ed.", f"Failed to {action} service.")
 
     def query_camera_details(self):
         device = self.camera_device_entry.text().strip()
         command = f"sudo vision_config_manager list-details {device}"
-        if self.ssh_executor.execute_command(command, "Camera details queried successfully.", "Failed to query camera details. Check SSH credentials or remote command availability."):
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            try:
-                ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-                stdin, stdout, stderr = ssh.exec_command(command)
-                details = stdout.read().decode()
-                dialog = QDialog(self)
-                dialog.setWindowTitle("Camera Details")
-                dialog.resize(800, 600)
-                layout = QVBoxLayout(dialog)
-                text_area = QPlainTextEdit()
-                text_area.setReadOnly(True)
-                text_area.setPlainText(details)
-                layout.addWidget(text_area)
-                button_box = QDialogButtonBox(QDialogButtonBox.Close)
-                button_box.rejected.connect(dialog.reject)
-                layout.addWidget(button_box)
-                dialog.exec_()
-                self.show_success_message("Camera details queried successfully.")
-            except paramiko.AuthenticationException as e:
-                logger.error("SSH Authentication failed for camera query: %s", e)
-                self.show_error_message("Failed to query camera details. Check SSH credentials or remote command availability.")
-            except Exception as e:
-                logger.error("Error querying camera details: %s", e)
-                self.show_error_message("Failed to query camera details.")
-            finally:
-                ssh.close()
-        else:
+        error_msg = "Failed to query camera details. Check SSH credentials or remote command availability."
+        self._start_task(self.ssh_executor.execute_command_capture, command,
+                         on_done=self._show_camera_details,
+                         on_error=lambda msg: self.show_error_message(error_msg))
+
+    def _show_camera_details(self, result):
+        ok, details, err, _ = result
+        if not ok:
+            logger.error("Failed to query camera details: %s", err)
             self.show_error_message("Failed to query camera details. Check SSH credentials or remote command availability.")
+            return
+        logger.info("Camera details queried successfully.")
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Camera Details")
+        dialog.resize(800, 600)
+        layout = QVBoxLayout(dialog)
+        text_area = QPlainTextEdit()
+        text_area.setReadOnly(True)
+        text_area.setPlainText(details)
+        layout.addWidget(text_area)
+        button_box = QDialogButtonBox(QDialogButtonBox.Close)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+        dialog.exec_()
+        self.show_success_message("Camera details queried successfully.")
 
     # -------------------- External tools --------------------
+    def _ssh_terminal_command(self, user, ip, port):
+        alive_opts = ("-o", f"ServerAliveInterval={self.ssh_executor.keepalive_interval}",
+                      "-o", f"ServerAliveCountMax={self.ssh_executor.keepalive_count_max}")
+        if sys.platform.startswith('win'):
+            # The Windows OpenSSH client has no ControlMaster support
+            return ["cmd", "/k", " ".join(("ssh", *alive_opts, "-p", str(port), f"{user}@{ip}"))]
+        return ["gnome-terminal", "--", "ssh", *SSH_MUX_OPTS, *alive_opts, "-p", str(port), f"{user}@{ip}"]
+
+    def _launch_detached(self, args):
+        """Start an external program without a shell and without waiting for it."""
+        try:
+            if sys.platform.startswith('win'):
+                subprocess.Popen(args, creationflags=subprocess.CREATE_NEW_CONSOLE)
+            else:
+                subprocess.Popen(args, start_new_session=True, stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            logger.error("Failed to launch %s: %s", args[0], e)
+            self.show_error_message(f"Failed to launch {args[0]}: {e}")
+
     def open_companion_ssh_terminal(self):
         if not self.ssh_executor.current_ip or not self.ssh_executor.username:
             self.show_error_message("No valid SSH configuration found for companion.")
@@ -1071,12 +1236,9 @@ This application provides a user-friendly interface to manage drone camera contr
         user = self.ssh_executor.username
         ip = self.ssh_executor.current_ip
         port = self.ssh_executor.current_port
-        if sys.platform.startswith('win'):
-            command = f'start cmd /k "ssh -p {port} {user}@{ip}"'
-        else:
-            command = f"gnome-terminal -- ssh -p {port} {user}@{ip}"
-        logger.info("Opening external SSH terminal to companion: %s", command)
-        QTimer.singleShot(0, lambda: os.system(command))
+        command = self._ssh_terminal_command(user, ip, port)
+        logger.info("Opening external SSH terminal to companion: %s", " ".join(command))
+        self._launch_detached(command)
 
     def open_relay_ssh_terminal(self):
         if not self.ssh_executor.relay_ip or not self.ssh_executor.relay_username:
@@ -1085,166 +1247,212 @@ This application provides a user-friendly interface to manage drone camera contr
         user = self.ssh_executor.relay_username
         ip = self.ssh_executor.relay_ip
         port = self.ssh_executor.relay_ssh_port
-        if sys.platform.startswith('win'):
-            command = f'start cmd /k "ssh -p {port} {user}@{ip}"'
-        else:
-            command = f"gnome-terminal -- ssh -p {port} {user}@{ip}"
-        logger.info("Opening external SSH terminal to relay: %s", command)
-        QTimer.singleShot(0, lambda: os.system(command))
+        command = self._ssh_terminal_command(user, ip, port)
+        logger.info("Opening external SSH terminal to relay: %s", " ".join(command))
+        self._launch_detached(command)
 
     def launch_qgc_app(self):
         qgc_path = r"C:\Program Files\QGroundControl\QGroundControl.exe" if sys.platform.startswith('win') else "/home/vind/Desktop/QGroundControl.AppImage"
         if os.path.exists(qgc_path):
             logger.info("Launching QGC App from %s", qgc_path)
-            QTimer.singleShot(0, lambda: os.system(f'"{qgc_path}"'))
+            self._launch_detached([qgc_path])
         else:
             self.show_error_message(f"QGC App not found at {qgc_path}")
 
     def confirm_action(self, message, action):
-        reply = QMessageBox.question(self, "Confirmation", message, QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
+        # One dialog is built on first use and reused for every later confirmation
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Question)
+            self._confirm_box.setWindowTitle("Confirmation")
+            self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self._confirm_box.setText(message)
+        if self._confirm_box.exec_() == QMessageBox.Yes:
             action()
 
     # -------------------- Reboot/shutdown helpers --------------------
+    def _run_companion_power_command(self, command, success_msg, error_msg):
+        """Worker-thread half of companion reboot/shutdown; returns True if every target got the command."""
+        # Fire-and-forget: the remote drops the session while going down, so waiting for an
+        # exit status (or retrying) would only report a false failure
+        ok = self.ssh_executor.send_async(command)
+        if not ok:
+            self.ssh_executor.restart_relay_ssh_tunnel()
+        return ok
+
+    def _on_companion_power_done(self, ok, success_msg, error_msg, wait_ms, expect_boot=False):
+        if ok:
+            self.show_success_message(success_msg)
+            # Check back once the companions have had time to go down/come back up
+            QTimer.singleShot(wait_ms, lambda: self._finish_power_action(expect_boot))
+        else:
+            self.show_error_message(error_msg, critical=True)
+            self._finish_power_action()
+
+    def _finish_power_action(self, expect_boot=False):
+        self.is_rebooting_or_shutting_down = False
+        # A periodic tick during the power action stopped the timer; put the cadence back
+        if self.connection_check_enabled and not self.conn_check_timer.isActive():
+            self.conn_check_timer.start(self.connection_check_interval)
+        # After a reboot, keep retrying the cheap TCP check while the SSH port is still closed
+        self._boot_wait = (BOOT_RETRY_FIRST_MS, 0) if expect_boot else None
+        self.refresh_connection_status()
+
     def reboot_companion_and_restart_tunnel(self):
         self.is_rebooting_or_shutting_down = True
         self.update_connection_status("System Rebooting", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for reboot, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_command_all("sudo reboot", "Companion computers are rebooting.", "Failed to initiate reboot of companion computers."):
-            self.show_success_message("Companion computers are rebooting.")
-            time.sleep(90)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to initiate reboot of companion computers.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
-
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+        success_msg = "Companion computers are rebooting."
+        error_msg = "Failed to initiate reboot of companion computers."
+        self._start_task(self._run_companion_power_command, REBOOT_COMMAND, success_msg, error_msg,
+                         on_done=lambda ok: self._on_companion_power_done(ok, success_msg, error_msg, 90000, expect_boot=True),
+                         on_error=lambda msg: self._on_companion_power_done(False, success_msg, error_msg, 0))
 
     def shutdown_companion_and_restart_tunnel(self):
         self.is_rebooting_or_shutting_down = True
         self.update_connection_status("System Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for shutdown, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_command_all("sudo shutdown now", "Companion computers are shutting down.", "Failed to shut down companion computers."):
-            self.show_success_message("Companion computers are shutting down.")
-            time.sleep(120)
-            self.refresh_connection_status()
+        success_msg = "Companion computers are shutting down."
+        error_msg = "Failed to shut down companion computers."
+        self._start_task(self._run_companion_power_command, SHUTDOWN_COMMAND, success_msg, error_msg,
+                         on_done=lambda ok: self._on_companion_power_done(ok, success_msg, error_msg, 120000),
+                         on_error=lambda msg: self._on_companion_power_done(False, success_msg, error_msg, 0))
+
+    def _probe_relay_after_reboot(self, delay_ms=RELAY_PROBE_FIRST_MS, waited_ms=0):
+        """Probe the relay's SSH port with backoff and refresh as soon as it answers."""
+        def _probe():
+            executor = self.ssh_executor
+            return executor.is_reachable(executor.relay_ip, executor.relay_ssh_port, max_attempts=1)
+
+        def _on_probe(up):
+            total_ms = waited_ms + delay_ms
+            if up or total_ms >= RELAY_PROBE_GIVE_UP_MS:
+                if not up:
+                    logger.warning("Relay did not answer within %d s of the reboot.", total_ms // 1000)
+                self._finish_power_action(expect_boot=True)
+            else:
+                self._probe_relay_after_reboot(min(delay_ms * 2, RELAY_PROBE_MAX_MS), total_ms)
+
+        QTimer.singleShot(delay_ms, lambda: self._start_task(
+            _probe, on_done=_on_probe, on_error=lambda msg: _on_probe(False)))
+
+    def _run_relay_power_command(self, command, success_msg, error_msg):
+        """Worker-thread half of relay reboot/shutdown; returns True if the relay got the command."""
+        ok = self.ssh_executor.send_async(command, relay=True)
+        if ok:
+            # The relay is going down; don't hand its dying session to the next caller
+            self.ssh_executor.drop_relay_session()
         else:
-            self.show_error_message("Failed to shut down companion computers.")
             self.ssh_executor.restart_relay_ssh_tunnel()
+        return ok
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+    def _on_relay_power_done(self, ok, success_msg, error_msg, on_accepted):
+        self._relay_power_busy = False
+        if ok:
+            self.show_success_message(success_msg)
+            on_accepted()
+        else:
+            self.show_error_message(error_msg, critical=True)
+            self._finish_power_action()
 
-    def reboot_relay(self):
+    def _start_relay_power_action(self, command, status_text, success_msg, error_msg, on_accepted):
+        if self._relay_power_busy:
+            logger.info("A relay reboot/shutdown is already in progress.")
+            return
+        self._relay_power_busy = True
         self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Rebooting", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for relay reboot, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_relay_command("sudo reboot", "Relay station is rebooting.", "Failed to reboot relay station."):
-            self.show_success_message("Relay station is rebooting.")
-            time.sleep(90)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to reboot relay station.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
+        self.update_connection_status(status_text, "gray", "Drone IP: Temporarily Unavailable", "gray")
+        self._start_task(self._run_relay_power_command, command, success_msg, error_msg,
+                         on_done=lambda ok: self._on_relay_power_done(ok, success_msg, error_msg, on_accepted),
+                         on_error=lambda msg: self._on_relay_power_done(False, success_msg, error_msg, on_accepted))
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+    def reboot_relay(self):
+        self._start_relay_power_action(REBOOT_COMMAND, "System Rebooting",
+                                       "Relay station is rebooting.", "Failed to reboot relay station.",
+                                       self._probe_relay_after_reboot)
 
     def shutdown_relay(self):
-        self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for relay shutdown, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_relay_command("sudo shutdown now", "Relay station is shutting down.", "Failed to shut down relay station."):
-            self.show_success_message("Relay station is shutting down.")
-            time.sleep(120)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to shut down relay station.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
+        self._start_relay_power_action(SHUTDOWN_COMMAND, "System Shutting Down",
+                                       "Relay station is shutting down.", "Failed to shut down relay station.",
+                                       lambda: QTimer.singleShot(120000, self._finish_power_action))
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
     # -------------------- Wi-Fi Temp polling --------------------
     def update_wifi_temp(self):
         """Non-blocking Wi-Fi temperature update.
 
-        Keeps the original method name so existing call sites remain unchanged,
-        but moves SSH work into a worker thread to avoid freezing the UI.
+        Keeps the original method name so existing call sites remain unchanged;
+        the SSH read itself happens on the persistent WifiTempWorker thread.
         """
-        # Skip if a previous read is still running
-        if self._wifi_temp_busy:
+        self._wifi_temp_worker.request_temp()
+
+    def _on_temp_timer(self):
+        if self.is_rebooting_or_shutting_down:
+            # Nothing to read while the companion is down; keep the chain alive at the slow rate
+            self.temp_timer.start(TEMP_INTERVAL_MAX_MS)
             return
+        self.update_wifi_temp()
 
-        self._wifi_temp_busy = True
-        self._wifi_temp_worker = WifiTempWorker(self.ssh_executor)
-        self._wifi_temp_worker.temp_ready.connect(self._on_wifi_temp_ready)
-        self._wifi_temp_worker.temp_error.connect(self._on_wifi_temp_error)
-        self._wifi_temp_worker.finished.connect(self._on_wifi_temp_finished)
-        self._wifi_temp_worker.start()
+    def _schedule_next_temp(self, interval_ms):
+        self._temp_interval_ms = interval_ms
+        if not self._temp_polling_paused:
+            self.temp_timer.start(interval_ms)
+
+    def _set_temp_polling_paused(self, paused):
+        if paused == self._temp_polling_paused:
+            return
+        self._temp_polling_paused = paused
+        if paused:
+            self.temp_timer.stop()
+        else:
+            self.temp_timer.start(self._temp_interval_ms)
 
     def _on_wifi_temp_ready(self, t):
         try:
             self.wifi_temp_label.setText("Wi-Fi Temp: " + (f"{t:.1f} °C" if t is not None else "N/A"))
         except Exception:
             self.wifi_temp_label.setText("Wi-Fi Temp: N/A")
+        if t is None:
+            self._schedule_next_temp(TEMP_INTERVAL_START_MS)
+        else:
+            self._schedule_next_temp(min(int(self._temp_interval_ms * 1.5), TEMP_INTERVAL_MAX_MS))
 
     def _on_wifi_temp_error(self, msg):
         logger.error("Temp update failed: %s", msg)
         self.wifi_temp_label.setText("Wi-Fi Temp: N/A")
+        self._schedule_next_temp(TEMP_INTERVAL_ERROR_MS)
+
+    def showEvent(self, event):
+        self._set_temp_polling_paused(bool(self.windowState() & Qt.WindowMinimized))
+        super().showEvent(event)
 
-    def _on_wifi_temp_finished(self):
-        self._wifi_temp_busy = False
-        self._wifi_temp_worker = None
+    def hideEvent(self, event):
+        self._set_temp_polling_paused(True)
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self._set_temp_polling_paused(bool(self.windowState() & Qt.WindowMinimized))
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        self.temp_timer.stop()
+        self.conn_check_timer.stop()
+        self._wifi_temp_worker.stop()
+        super().closeEvent(event)
 
     # -------------------- Utilities --------------------
     def show_success_message(self, message):
-        QMessageBox.information(self, "Success", message)
+        self._toast.show_message(message, "ok")
 
-    def show_error_message(self, message):
-        QMessageBox.warning(self, "Error", message)
+    def show_error_message(self, message, critical=False):
+        """Errors are toasts too; critical ones still need the user to acknowledge them."""
+        if critical:
+            QMessageBox.warning(self, "Error", message)
+        else:
+            self._toast.show_message(message, "error")
 
 # -------------------- Entrypoint --------------------
 def main():
     app = QApplication(sys.argv)
-    apply_dark_gnome_style(app)
-    apply_global_stylesheet(app)
+    apply_style(app)
     logger.debug("Starting Drone_control_v1.3...")
     window = DroneControlApp()
     window.show()
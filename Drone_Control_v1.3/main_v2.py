@@ -4,14 +4,14 @@ main.py
 Entry point for Drone_control_v1.1, a Python-based GUI application for drone control via SSH.
 """
 
-import sys, os, logging, paramiko, re, time, keyring
+import sys, os, logging, re, time
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QDockWidget, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QStackedWidget, QTextEdit, QMessageBox, QLineEdit,
+    QPushButton, QLabel, QStackedWidget, QMessageBox, QLineEdit,
     QSizePolicy, QCheckBox, QTabWidget, QToolButton, QStyle, QDialog,
-    QDialogButtonBox, QPlainTextEdit, QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView, QSpinBox
+    QDialogButtonBox, QPlainTextEdit, QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView, QSpinBox, QScrollArea
 )
-from PyQt5.QtCore import Qt, QTimer, QSize, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QSize, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor
 from ssh_executor import SSHExecutor
 from gui_components import SavedCommandsPage, AppLogPage, LogSignalHandler
@@ -19,6 +19,129 @@ from datetime import datetime
 
 SCALE = 0.7
 
+# Patterns used on every status refresh, compiled once
+_RE_VERSION = re.compile(r"[\s:](\d+\.\d+)")
+
+_ABOUT_HTML = """
+<b>Drone_control_v1.1</b><br>
+A Python-based GUI application built with PyQt5 for controlling a drone's companion computer via SSH.<br><br>
+
+<b>Description:</b><br>
+This application provides a user-friendly interface to manage drone camera controls, and SSH connections. It connects to a companion computer through a relay station at 10.5.6.100:2222 (username: roz) and supports secondary IP failover. Features include camera switching, image/video capture, and system management (reboot/shutdown). Windows version uses paramiko for SSH.<br><br>
+
+<b>Changelog:</b><br>
+- Added Wi-Fi module temperature in the top status bar (updates every 5s).<br>
+- Updated all "Apply ..." buttons to simply read "Apply."<br>
+- Removed the large home-screen toggle for camera swap (use the checkbox in Camera Settings instead).<br>
+- Companion computer version is displayed as "N/A" (not retrieved due to configuration).<br>
+- Restored the three-column Connection Settings tab with improved alignment.<br>
+- Added explicit port fields and relay SSH settings in Connection Settings tab.<br>
+- Updated capture and video to match Rozcam script and transfer files via tunnel with delay.<br>
+- Added Relay SSH and Shutdown Relay buttons to left menu, renamed Open SSH Terminal to Companion SSH.<br>
+- Enhanced SSH command execution with retry logic (max_attempts=3, 5-second delay).<br>
+- Added sudo password handling for SSH commands.<br>
+- Added restart_relay_ssh_tunnel method to handle SSH tunnel restarts after reboots/shutdowns.<br>
+- Renamed Reboot and Shutdown buttons to Companion Reboot and Companion Shutdown for clarity.<br>
+- Removed ROS2 Topics tab and related functionality.<br>
+- Improved reboot/shutdown handling and connection checks.<br><br>
+"""
+
+###############################################################################
+# SCALE-derived style constants (built once at import)
+###############################################################################
+_S = {
+    "font_label": int(12 * SCALE),
+    "font_text": int(13 * SCALE),
+    "font_button": int(14 * SCALE),
+    "font_page_title": int(16 * SCALE),
+    "font_home_title": int(20 * SCALE),
+    "pad_tile": int(8 * SCALE),
+    "pad_v": int(10 * SCALE),
+    "pad_h": int(16 * SCALE),
+    "margin_button": int(6 * SCALE),
+    "min_w_button": int(120 * SCALE),
+    "min_w_tile": int(130 * SCALE),
+    "min_h_button": int(60 * SCALE),
+    "margin_page": int(20 * SCALE),
+    "margin_menu": int(10 * SCALE),
+    "gap_xs": int(5 * SCALE),
+    "gap_s": int(10 * SCALE),
+    "gap_m": int(12 * SCALE),
+    "gap_l": int(15 * SCALE),
+    "gap_xl": int(20 * SCALE),
+}
+PAGE_MARGINS = (_S["margin_page"],) * 4
+MENU_MARGINS = (_S["margin_menu"],) * 4
+
+# Widgets only carry an objectName or a dynamic property; the look lives in the
+# application stylesheet below, which Qt parses once at startup.
+TILE_COLORS = {"teal": "#008B8B", "amber": "#FFB900", "green": "#10893E"}
+ACTION_COLORS = {"apply": "#10893E", "query": "#007ACC", "warn": "#D2691E", "danger": "#AA0000"}
+
+LEFT_MENU_CSS = """
+    QPushButton#LeftMenuBtn {
+        background-color: #444444;
+        color: white;
+        border: 1px solid #555555;
+        font-size: 14pt;
+        padding: 10px;
+        margin: 4px;
+        min-width: 100px;
+    }
+    QPushButton#LeftMenuBtn:hover { background-color: #555555; }
+    QPushButton#LeftMenuBtn:pressed { background-color: #666666; }
+"""
+
+_ROLE_CSS = f"""
+    QLabel#SectionTitle {{ font-size: {_S['font_button']}pt; font-weight: bold; color: #FFFFFF; }}
+    QLabel#SubsectionTitle {{ font-size: {_S['font_label']}pt; font-weight: bold; color: #FFFFFF; }}
+    QLabel#PageTitle {{ font-size: {_S['font_page_title']}pt; font-weight: bold; color: #FFFFFF; }}
+    QLabel#HomeTitle {{ font-size: {_S['font_home_title']}pt; font-weight: bold; color: #FFFFFF; }}
+    QLabel#FieldLabel {{ font-size: {_S['font_button']}pt; color: #FFFFFF; }}
+    QLabel#InfoLabel {{ font-size: 12pt; color: #FFFFFF; }}
+    QLabel#VersionLabel {{ font-style: italic; color: #AAAAAA; }}
+    QLabel#Placeholder {{
+        background-color: #3A3A3A;
+        border: 1px solid #555555;
+        font-size: {_S['font_label']}pt;
+        color: #FFFFFF;
+    }}
+    QScrollArea#AboutScroll {{ background-color: #3A3A3A; border: 1px solid #555555; }}
+    QLabel#AboutText {{ background-color: #3A3A3A; color: #FFFFFF; padding: 4px; }}
+    QToolButton#RefreshBtn {{ background-color: transparent; border: none; margin-right: 10px; }}
+    QToolButton#RefreshBtn:hover {{ background-color: #505050; }}
+
+    /* Top status banner; update_connection_status switches the state property */
+    QLabel#TopStatus {{ font-size: 16pt; font-weight: bold; color: #FFFFFF; background-color: #2E2E2E; }}
+    QLabel#TopStatus[state="ok"] {{
+        color: black;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
+    }}
+    QLabel#TopStatus[state="err"] {{
+        color: white;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #8B0000, stop:1 #FF6347);
+    }}
+
+    QPushButton[role="tile"] {{
+        color: white;
+        border: 1px solid #555555;
+        font-size: {_S['font_button']}pt;
+        padding: {_S['pad_tile']}px;
+        margin: {_S['margin_button']}px;
+        min-width: {_S['min_w_tile']}px;
+        min-height: {_S['min_h_button']}px;
+    }}
+""" + "".join(
+    f'    QPushButton[role="tile"][tile="{name}"] {{ background-color: {bg}; }}\n'
+    for name, bg in TILE_COLORS.items()
+) + """
+    QPushButton[role="tile"]:hover { background-color: #666666; }
+    QPushButton[role="tile"]:pressed { background-color: #777777; }
+""" + "".join(
+    f'    QPushButton[action="{name}"] {{ background-color: {bg}; color: white; font-weight: bold; }}\n'
+    for name, bg in ACTION_COLORS.items()
+)
+
 ###############################################################################
 # Logging Setup
 ###############################################################################
@@ -40,77 +163,101 @@ logger.addHandler(gui_log_handler)
 ###############################################################################
 # Background Workers (NO UI FREEZE)
 ###############################################################################
-class SSHCommandWorker(QThread):
+class SSHCommandSignals(QObject):
     finished_result = pyqtSignal(bool, str, str)
 
-    def __init__(self, host, port, user, password, command, timeout=5, parent=None):
-        super().__init__(parent)
+
+class SSHCommandTask(QRunnable):
+    """One-shot SSH command run on the global QThreadPool; the result comes back through self.signals."""
+
+    def __init__(self, ssh_executor: SSHExecutor, host, port, user, password, command, want_output=True):
+        super().__init__()
+        self.ssh_executor = ssh_executor
         self.host = host
         self.port = int(port)
         self.user = user
         self.password = password
         self.command = command
-        self.timeout = timeout
+        self.want_output = want_output  # False: stdout is not read (emitted as ""), stderr only on failure
+        self.signals = SSHCommandSignals()
 
     def run(self):
-        ssh = None
+        # Borrows the executor's pooled session for (host, port, user) instead of a fresh connect
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(self.host, self.port, username=self.user, password=self.password, timeout=self.timeout)
-
-            cmd = self.command.strip()
-            if cmd.startswith("sudo "):
-                cmd = f"echo {self.password} | sudo -S {cmd[5:]}"
-            stdin, stdout, stderr = ssh.exec_command(cmd)
-            out = stdout.read().decode(errors="ignore")
-            err = stderr.read().decode(errors="ignore")
-            ok = (stdout.channel.recv_exit_status() == 0)
-            self.finished_result.emit(ok, out, err)
+            ok, out, err = self.ssh_executor.run_on(self.host, self.port, self.user, self.password,
+                                                    self.command, want_output=self.want_output)
+            self.signals.finished_result.emit(ok, out, err)
         except Exception as e:
-            self.finished_result.emit(False, "", str(e))
-        finally:
-            try:
-                if ssh:
-                    ssh.close()
-            except Exception:
-                pass
+            self.signals.finished_result.emit(False, "", str(e))
+
+
+class SSHTaskSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class SSHTask(QRunnable):
+    """Runs fn(*args) on the global QThreadPool; the result comes back through self.signals."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self.signals = SSHTaskSignals()
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 
-class WifiTempPoller(QThread):
-    temp_ready = pyqtSignal(object)  # float or None
+class BatchedSSHQueue(QObject):
+    """Collects read-only companion commands for DEBOUNCE_MS and runs them as one SSH batch."""
+    DEBOUNCE_MS = 50
 
-    def __init__(self, ssh_executor: SSHExecutor, interval_ms: int = 60000, enabled: bool = True, parent=None):
+    def __init__(self, ssh_executor: SSHExecutor, parent=None):
         super().__init__(parent)
         self.ssh_executor = ssh_executor
-        self._interval_ms = max(200, int(interval_ms))
-        self._enabled = bool(enabled)
-        self._stop = False
+        self._pending = []
+        # Batch tasks in flight, kept referenced until they report back
+        self._tasks = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def submit(self, command, callback):
+        """callback(output) runs on the GUI thread; output is None if the batch failed."""
+        self._pending.append((command, callback))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        callbacks = [cb for _, cb in batch]
+        task = SSHTask(self.ssh_executor.batch_query, [cmd for cmd, _ in batch])
 
-    def set_interval_ms(self, interval_ms: int):
-        self._interval_ms = max(200, int(interval_ms))
+        def _done(outputs):
+            self._tasks.discard(task)
+            self._dispatch(callbacks, outputs)
 
-    def set_enabled(self, enabled: bool):
-        self._enabled = bool(enabled)
+        task.signals.finished.connect(_done)
+        task.signals.error.connect(lambda msg: _done(None))
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
 
-    def stop(self):
-        self._stop = True
+    def _dispatch(self, callbacks, outputs):
+        for i, callback in enumerate(callbacks):
+            try:
+                callback(outputs[i] if outputs is not None else None)
+            except Exception as e:
+                logger.error("Batched SSH callback failed: %s", e)
 
-    def run(self):
-        # Simple loop; all SSH happens in this thread, never in UI thread
-        while not self._stop:
-            if self._enabled:
-                try:
-                    t = self.ssh_executor.get_wifi_module_temperature()
-                except Exception:
-                    t = None
-                self.temp_ready.emit(t)
-            # Sleep in small chunks so stop/enable changes apply quickly
-            remaining = self._interval_ms / 1000.0
-            step = 0.1
-            while remaining > 0 and not self._stop:
-                time.sleep(step if remaining > step else remaining)
-                remaining -= step
 
 def apply_dark_gnome_style(app):
     app.setStyle("Fusion")
@@ -127,12 +274,12 @@ def apply_dark_gnome_style(app):
     palette.setColor(QPalette.HighlightedText, Qt.white)
     app.setPalette(palette)
 
-def apply_global_stylesheet(app):
-    app.setStyleSheet(f"""
+GLOBAL_STYLESHEET = f"""
     QMainWindow {{
         background-color: #1E1E1E;
     }}
-    QDockWidget#LeftMenuDock {{
+    QDockWidget#LeftMenuDock, QDockWidget#RightDock,
+    QDockWidget#LeftMenuDock > QWidget, QDockWidget#RightDock > QWidget {{
         background-color: #2E2E2E;
     }}
     QPushButton {{
@@ -140,11 +287,11 @@ def apply_global_stylesheet(app):
         color: #FFFFFF;
         border: 1px solid #555555;
         border-radius: 4px;
-        font-size: {int(14 * SCALE)}pt;
-        padding: {int(10 * SCALE)}px {int(16 * SCALE)}px;
-        margin: {int(6 * SCALE)}px;
-        min-width: {int(120 * SCALE)}px;
-        min-height: {int(60 * SCALE)}px;
+        font-size: {_S['font_button']}pt;
+        padding: {_S['pad_v']}px {_S['pad_h']}px;
+        margin: {_S['margin_button']}px;
+        min-width: {_S['min_w_button']}px;
+        min-height: {_S['min_h_button']}px;
     }}
     QPushButton:hover {{
         background-color: #505050;
@@ -156,9 +303,9 @@ def apply_global_stylesheet(app):
     }}
     QLabel {{
         color: #EEEEEE;
-        font-size: {int(13 * SCALE)}pt;
+        font-size: {_S['font_text']}pt;
     }}
-    QLineEdit, QTextEdit {{
+    QLineEdit, QTextEdit, QPlainTextEdit {{
         background-color: #3A3A3A;
         color: white;
         border: 1px solid #555555;
@@ -166,7 +313,7 @@ def apply_global_stylesheet(app):
     }}
     QCheckBox {{
         color: white;
-        font-size: {int(12 * SCALE)}pt;
+        font-size: {_S['font_label']}pt;
     }}
     QTabWidget::pane {{
         border: 1px solid #555555;
@@ -186,19 +333,43 @@ def apply_global_stylesheet(app):
     QTabBar::tab:selected {{
         background: #606060;
     }}
-    """)
+    """ + LEFT_MENU_CSS + _ROLE_CSS
+
+def apply_global_stylesheet(app):
+    app.setStyleSheet(GLOBAL_STYLESHEET)
+
 
 ###############################################################################
 # DroneControlApp
 ###############################################################################
 class DroneControlApp(QMainWindow):
+    PROBE_MIN_GAP_S = 1.0
+    REFRESH_DEBOUNCE_MS = 500
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Drone_control_v1.1")
         self.resize(int(1200 * SCALE), int(700 * SCALE))
 
         self.ssh_executor = SSHExecutor()
+        # Read-only status queries issued back to back share one SSH round trip
+        self.ssh_batch = BatchedSSHQueue(self.ssh_executor, parent=self)
+        # SSHCommandTask/SSHTask instances in flight (kept referenced until they report back)
+        self._ssh_tasks = set()
+        # Coalesces refresh requests (button mashing, settings applies) into one probe
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # Start of the last probe; see _probe_delay_s
+        self._last_probe = float("-inf")
+        # Periodic connection check; one timer re-armed per check, so repeated
+        # applies restart the cadence instead of stacking extra check chains
+        self.conn_check_timer = QTimer(self)
+        self.conn_check_timer.setSingleShot(True)
+        self.conn_check_timer.timeout.connect(self.periodic_connection_check)
         self.time_synced = False
+        # (ip, port) the shown companion version was read from; None forces a re-read
+        self._version_source = None
         self.connection_check_enabled = bool(self.ssh_executor.ssh_config.get("connection_check_enabled", True))
         # Wi-Fi Temperature polling (independent from connection check)
         self.wifi_temp_enabled = bool(self.ssh_executor.ssh_config.get("temp_poll_enabled", True))
@@ -209,15 +380,16 @@ class DroneControlApp(QMainWindow):
 
         # Labels shown in UI
         self.companion_version_label = QLabel("Companion Version: N/A")
-        self.companion_version_label.setStyleSheet("font-size: 12pt; color: #FFFFFF;")
+        self.companion_version_label.setObjectName("InfoLabel")
         self.wifi_temp_label = QLabel("Wi-Fi Temp: -- °C")
-        self.wifi_temp_label.setStyleSheet("font-size: 12pt; color: #FFFFFF;")
+        self.wifi_temp_label.setObjectName("InfoLabel")
+        self._last_temp = None  # last value shown, rounded to 0.1 °C; see _on_wifi_temp_ready
 
         # Central container
         central_container = QWidget()
         central_layout = QVBoxLayout(central_container)
-        central_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        central_layout.setSpacing(int(10 * SCALE))
+        central_layout.setContentsMargins(*PAGE_MARGINS)
+        central_layout.setSpacing(_S['gap_s'])
         self.setCentralWidget(central_container)
 
         # Top dock (status + temp + refresh)
@@ -236,12 +408,9 @@ class DroneControlApp(QMainWindow):
         self.top_status_label = QLabel("Connected and Ready | Drone IP: Checking...")
         self.top_status_label.setAlignment(Qt.AlignCenter)
         self.top_status_label.setMinimumHeight(int(40 * SCALE))
-        self.top_status_label.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: black;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
-        """)
+        self.top_status_label.setObjectName("TopStatus")
+        self.top_status_label.setProperty("state", "ok")
+        self._last_status_key = None
 
         top_dock_layout.addWidget(self.top_status_label)
         top_dock_layout.addWidget(self.wifi_temp_label, 0, Qt.AlignRight)
@@ -250,10 +419,7 @@ class DroneControlApp(QMainWindow):
         self.refresh_btn.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
         self.refresh_btn.setIconSize(QSize(int(16 * SCALE), int(16 * SCALE)))
         self.refresh_btn.setToolTip("Refresh Connection")
-        self.refresh_btn.setStyleSheet("""
-            QToolButton { background-color: transparent; border: none; margin-right: 10px; }
-            QToolButton:hover { background-color: #505050; }
-        """)
+        self.refresh_btn.setObjectName("RefreshBtn")
         self.refresh_btn.clicked.connect(self.refresh_connection_status)
         top_dock_layout.addWidget(self.refresh_btn, 0, Qt.AlignRight)
 
@@ -274,18 +440,14 @@ class DroneControlApp(QMainWindow):
 
         # Footer
         self.version_label = QLabel("App Version: v1.1")
-        self.version_label.setStyleSheet("font-style: italic; color: #AAAAAA;")
+        self.version_label.setObjectName("VersionLabel")
         self.statusBar().addPermanentWidget(self.version_label)
 
-        # Wi-Fi Temperature Poller (runs in background thread; no UI freeze)
-        self.wifi_temp_poller = WifiTempPoller(
-            self.ssh_executor,
-            interval_ms=self.wifi_temp_poll_ms,
-            enabled=self.wifi_temp_enabled,
-            parent=self
-        )
-        self.wifi_temp_poller.temp_ready.connect(self._on_wifi_temp_ready)
-        self.wifi_temp_poller.start()
+        # Wi-Fi Temperature polling: an event-loop timer; each read runs on the shared thread pool
+        self._temp_task = None
+        self.wifi_temp_timer = QTimer(self)
+        self.wifi_temp_timer.timeout.connect(self._fire_temp_task)
+        self._apply_temp_polling()
 
         # Initial connection check
         self.refresh_connection_status()
@@ -294,13 +456,13 @@ class DroneControlApp(QMainWindow):
     def create_home_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
-        layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        layout.setSpacing(int(15 * SCALE))
+        layout.setContentsMargins(*PAGE_MARGINS)
+        layout.setSpacing(_S['gap_l'])
 
         # Header row
         header_layout = QHBoxLayout()
         lblTitle = QLabel("Camera Control")
-        lblTitle.setStyleSheet(f"font-size: {int(20 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblTitle.setObjectName("HomeTitle")
         header_layout.addWidget(lblTitle)
         header_layout.addStretch()
         header_layout.addWidget(self.companion_version_label)
@@ -308,20 +470,20 @@ class DroneControlApp(QMainWindow):
 
         # Switch row
         rowSwitch = QHBoxLayout()
-        rowSwitch.setSpacing(int(15 * SCALE))
-        btnFrontSW = self.create_tile_button("F-SW", "#008B8B",
+        rowSwitch.setSpacing(_S['gap_l'])
+        btnFrontSW = self.create_tile_button("F-SW", "teal",
                                              "Front camera switched.",
                                              self.front_switch,
                                              "Failed to switch front camera. Check SSH credentials or remote command.")
-        btnBottomSW = self.create_tile_button("B-SW", "#008B8B",
+        btnBottomSW = self.create_tile_button("B-SW", "teal",
                                               "Bottom camera switched.",
                                               self.bottom_switch,
                                               "Failed to switch bottom camera. Check SSH credentials or remote command.")
-        btnSplitFBSW = self.create_tile_button("F/B-SW", "#008B8B",
+        btnSplitFBSW = self.create_tile_button("F/B-SW", "teal",
                                                "Split (Front/Bottom) switched.",
                                                self.split_front_bottom,
                                                "Failed to switch split (front/bottom). Check SSH credentials or remote command.")
-        btnSplitBFSW = self.create_tile_button("B/F-SW", "#008B8B",
+        btnSplitBFSW = self.create_tile_button("B/F-SW", "teal",
                                                "Split (Bottom/Front) switched.",
                                                self.split_bottom_front,
                                                "Failed to switch split (bottom/front). Check SSH credentials or remote command.")
@@ -333,12 +495,12 @@ class DroneControlApp(QMainWindow):
 
         # Capture row
         rowCapture = QHBoxLayout()
-        rowCapture.setSpacing(int(15 * SCALE))
-        btnCaptureFront = self.create_tile_button("Capture - Front", "#FFB900",
+        rowCapture.setSpacing(_S['gap_l'])
+        btnCaptureFront = self.create_tile_button("Capture - Front", "amber",
                                                   "Captured image from Front camera.",
                                                   self.capture_front,
                                                   "Failed to capture front image. Check SSH credentials or remote command.")
-        btnCaptureBottom = self.create_tile_button("Capture - Bottom", "#FFB900",
+        btnCaptureBottom = self.create_tile_button("Capture - Bottom", "amber",
                                                    "Captured image from Bottom camera.",
                                                    self.capture_bottom,
                                                    "Failed to capture bottom image. Check SSH credentials or remote command.")
@@ -348,12 +510,12 @@ class DroneControlApp(QMainWindow):
 
         # Record row
         rowRecord = QHBoxLayout()
-        rowRecord.setSpacing(int(15 * SCALE))
+        rowRecord.setSpacing(_S['gap_l'])
         btnRecordFront = QPushButton("Record - Front")
-        btnRecordFront.setStyleSheet(self._record_btn_css())
+        self._make_tile(btnRecordFront, "green")
         btnRecordFront.clicked.connect(self.record_front)
         btnRecordBottom = QPushButton("Record - Bottom")
-        btnRecordBottom.setStyleSheet(self._record_btn_css())
+        self._make_tile(btnRecordBottom, "green")
         btnRecordBottom.clicked.connect(self.record_bottom)
         rowRecord.addWidget(btnRecordFront)
         rowRecord.addWidget(btnRecordBottom)
@@ -362,38 +524,24 @@ class DroneControlApp(QMainWindow):
         # Duration row
         dur_layout = QHBoxLayout()
         lblDur = QLabel("Record Duration (sec):")
-        lblDur.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; color: #FFFFFF;")
-        self.record_duration_entry = QLineEdit()
-        self.record_duration_entry.setFixedWidth(int(100 * SCALE))
-        self.record_duration_entry.setPlaceholderText("Seconds")
+        lblDur.setObjectName("FieldLabel")
+        self.record_duration_spin = QSpinBox()
+        self.record_duration_spin.setFixedWidth(int(100 * SCALE))
+        self.record_duration_spin.setRange(1, 3600)
+        self.record_duration_spin.setValue(10)
+        self.record_duration_spin.setSuffix(" s")
         dur_layout.addWidget(lblDur)
-        dur_layout.addWidget(self.record_duration_entry)
+        dur_layout.addWidget(self.record_duration_spin)
         layout.addLayout(dur_layout)
 
         # Placeholder
         placeholder = QLabel("[Camera feed preview or additional info here...]")
-        placeholder.setStyleSheet(f"background-color: #3A3A3A; border: 1px solid #555555; font-size: {int(12 * SCALE)}pt; color: #FFFFFF;")
+        placeholder.setObjectName("Placeholder")
         placeholder.setAlignment(Qt.AlignCenter)
         layout.addWidget(placeholder)
 
         return page
 
-    def _record_btn_css(self):
-        return f"""
-            QPushButton {{
-                background-color: #10893E;
-                color: white;
-                border: 1px solid #555555;
-                font-size: {int(14 * SCALE)}pt;
-                padding: {int(8 * SCALE)}px;
-                margin: {int(6 * SCALE)}px;
-                min-width: {int(130 * SCALE)}px;
-                min-height: {int(60 * SCALE)}px;
-            }}
-            QPushButton:hover {{ background-color: #666666; }}
-            QPushButton:pressed {{ background-color: #777777; }}
-        """
-
     # -------------------- Left Dock --------------------
     def create_left_dock(self):
         dock = QDockWidget("", self)
@@ -401,34 +549,18 @@ class DroneControlApp(QMainWindow):
         dock.setFeatures(QDockWidget.NoDockWidgetFeatures)
         dock.setTitleBarWidget(QWidget())
         dock.setMinimumWidth(int(180 * SCALE))
-        dock.setStyleSheet("background-color: #2E2E2E;")
 
         menuWidget = QWidget()
         menuLayout = QVBoxLayout(menuWidget)
-        menuLayout.setContentsMargins(int(10 * SCALE), int(10 * SCALE), int(10 * SCALE), int(10 * SCALE))
-        menuLayout.setSpacing(int(10 * SCALE))
-
-        def style_menu_button(btn):
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #444444;
-                    color: white;
-                    border: 1px solid #555555;
-                    font-size: 14pt;
-                    padding: 10px;
-                    margin: 4px;
-                    min-width: 100px;
-                }
-                QPushButton:hover { background-color: #555555; }
-                QPushButton:pressed { background-color: #666666; }
-            """)
-
-        btnHome = QPushButton("Home");            style_menu_button(btnHome)
-        btnSettings = QPushButton("Settings");    style_menu_button(btnSettings)
-        btnCompanionSSH = QPushButton("Companion SSH"); style_menu_button(btnCompanionSSH)
-        btnRelaySSH = QPushButton("Relay SSH");   style_menu_button(btnRelaySSH)
-        btnQGC = QPushButton("Launch QGC App");   style_menu_button(btnQGC)
-        btnExit = QPushButton("Exit");            style_menu_button(btnExit)
+        menuLayout.setContentsMargins(*MENU_MARGINS)
+        menuLayout.setSpacing(_S['gap_s'])
+
+        btnHome = QPushButton("Home")
+        btnSettings = QPushButton("Settings")
+        btnCompanionSSH = QPushButton("Companion SSH")
+        btnRelaySSH = QPushButton("Relay SSH")
+        btnQGC = QPushButton("Launch QGC App")
+        btnExit = QPushButton("Exit")
 
         btnHome.clicked.connect(lambda: self.stack.setCurrentWidget(self.page_home))
         btnSettings.clicked.connect(lambda: self.stack.setCurrentWidget(self.page_conn))
@@ -438,27 +570,28 @@ class DroneControlApp(QMainWindow):
         btnExit.clicked.connect(self.close)
 
         for btn in [btnHome, btnSettings, btnCompanionSSH, btnRelaySSH, btnQGC, btnExit]:
+            btn.setObjectName("LeftMenuBtn")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             menuLayout.addWidget(btn)
 
         # Danger zone actions
         companionRebootBtn = QPushButton("Companion Reboot")
-        companionRebootBtn.setStyleSheet("background-color: #D2691E; color: white; font-weight: bold;")
+        companionRebootBtn.setProperty("action", "warn")
         companionRebootBtn.clicked.connect(lambda: self.confirm_action(
             "Reboot ALL companion computers?",
             lambda: self.reboot_companion_and_restart_tunnel()))
         companionShutdownBtn = QPushButton("Companion Shutdown")
-        companionShutdownBtn.setStyleSheet("background-color: #AA0000; color: white; font-weight: bold;")
+        companionShutdownBtn.setProperty("action", "danger")
         companionShutdownBtn.clicked.connect(lambda: self.confirm_action(
             "Shutdown ALL companion computers?",
             lambda: self.shutdown_companion_and_restart_tunnel()))
         relayRebootBtn = QPushButton("Reboot Relay")
-        relayRebootBtn.setStyleSheet("background-color: #D2691E; color: white; font-weight: bold;")
+        relayRebootBtn.setProperty("action", "warn")
         relayRebootBtn.clicked.connect(lambda: self.confirm_action(
             "Reboot the relay station?",
             lambda: self.reboot_relay()))
         relayShutdownBtn = QPushButton("Shutdown Relay")
-        relayShutdownBtn.setStyleSheet("background-color: #AA0000; color: white; font-weight: bold;")
+        relayShutdownBtn.setProperty("action", "danger")
         relayShutdownBtn.clicked.connect(lambda: self.confirm_action(
             "Shutdown the relay station?",
             lambda: self.shutdown_relay()))
@@ -475,10 +608,10 @@ class DroneControlApp(QMainWindow):
     # -------------------- Right Dock --------------------
     def create_right_dock(self):
         dock = QDockWidget("", self)
+        dock.setObjectName("RightDock")
         dock.setFeatures(QDockWidget.NoDockWidgetFeatures)
         dock.setTitleBarWidget(QWidget())
         dock.setMinimumWidth(int(360 * SCALE))
-        dock.setStyleSheet("background-color: #2E2E2E;")
 
         tabs = QTabWidget()
         self.app_log_page = AppLogPage(gui_log_handler)
@@ -493,8 +626,8 @@ class DroneControlApp(QMainWindow):
     def create_conn_page(self):
         page = QWidget()
         main_layout = QVBoxLayout(page)
-        main_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        main_layout.setSpacing(int(20 * SCALE))
+        main_layout.setContentsMargins(*PAGE_MARGINS)
+        main_layout.setSpacing(_S['gap_xl'])
 
         tab_widget = QTabWidget()
         main_layout.addWidget(tab_widget)
@@ -502,14 +635,14 @@ class DroneControlApp(QMainWindow):
         # Connection Settings tab
         connection_tab = QWidget()
         conn_layout = QHBoxLayout(connection_tab)
-        conn_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        conn_layout.setSpacing(int(20 * SCALE))
+        conn_layout.setContentsMargins(*PAGE_MARGINS)
+        conn_layout.setSpacing(_S['gap_xl'])
         conn_layout.setAlignment(Qt.AlignTop)
 
         # Column 1 - Companion
-        col1 = QWidget(); col1_layout = QVBoxLayout(col1); col1_layout.setSpacing(int(5 * SCALE))
+        col1 = QWidget(); col1_layout = QVBoxLayout(col1); col1_layout.setSpacing(_S['gap_xs'])
         lblSSH = QLabel("Companion SSH Configuration")
-        lblSSH.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblSSH.setObjectName("SectionTitle")
         col1_layout.addWidget(lblSSH)
         col1_layout.addWidget(QLabel("Primary IP (Relay Tunnel):"))
         self.primary_ip_entry = QLineEdit(self.ssh_executor.ssh_config.get("primary_ip", "10.5.6.100"))
@@ -530,15 +663,15 @@ class DroneControlApp(QMainWindow):
         self.password_entry = QLineEdit(); self.password_entry.setEchoMode(QLineEdit.Password)
         col1_layout.addWidget(self.password_entry)
         btnApplySSH = QPushButton("Apply")
-        btnApplySSH.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
+        btnApplySSH.setProperty("action", "apply")
         btnApplySSH.clicked.connect(self.apply_ssh_config)
         col1_layout.addWidget(btnApplySSH)
         conn_layout.addWidget(col1)
 
         # Column 2 - Relay
-        col2 = QWidget(); col2_layout = QVBoxLayout(col2); col2_layout.setSpacing(int(5 * SCALE))
+        col2 = QWidget(); col2_layout = QVBoxLayout(col2); col2_layout.setSpacing(_S['gap_xs'])
         lblRelaySSH = QLabel("Relay SSH Configuration")
-        lblRelaySSH.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblRelaySSH.setObjectName("SectionTitle")
         col2_layout.addWidget(lblRelaySSH)
         col2_layout.addWidget(QLabel("Relay IP:"))
         self.relay_ip_entry = QLineEdit(self.ssh_executor.ssh_config.get("relay_ip", "10.5.6.100"))
@@ -553,32 +686,40 @@ class DroneControlApp(QMainWindow):
         self.relay_password_entry = QLineEdit(); self.relay_password_entry.setEchoMode(QLineEdit.Password)
         col2_layout.addWidget(self.relay_password_entry)
         btnApplyRelaySSH = QPushButton("Apply")
-        btnApplyRelaySSH.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
+        btnApplyRelaySSH.setProperty("action", "apply")
         btnApplyRelaySSH.clicked.connect(self.apply_relay_ssh_config)
         col2_layout.addWidget(btnApplyRelaySSH)
         conn_layout.addWidget(col2)
 
         # Column 3 - Periodic Check
-        col3 = QWidget(); col3_layout = QVBoxLayout(col3); col3_layout.setSpacing(int(5 * SCALE))
+        col3 = QWidget(); col3_layout = QVBoxLayout(col3); col3_layout.setSpacing(_S['gap_xs'])
         lblCheck = QLabel("Periodic Connection Check")
-        lblCheck.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblCheck.setObjectName("SectionTitle")
         col3_layout.addWidget(lblCheck)
         self.conn_check_enabled_box = QCheckBox("Enable Periodic Connection Check")
         self.conn_check_enabled_box.setChecked(self.connection_check_enabled)
         col3_layout.addWidget(self.conn_check_enabled_box)
         col3_layout.addWidget(QLabel("Check Interval (seconds):"))
-        self.interval_entry = QLineEdit(str(self.connection_check_interval // 1000))  # seconds
-        col3_layout.addWidget(self.interval_entry)
-        self.timeout_entry = QLineEdit(str(self.ssh_executor.timeout))
+        self.interval_spin = QSpinBox()
+        self.interval_spin.setRange(1, 3600)
+        self.interval_spin.setValue(max(1, int(self.connection_check_interval // 1000)))
+        self.interval_spin.setSuffix(" s")
+        col3_layout.addWidget(self.interval_spin)
+        self.timeout_spin = QSpinBox()
+        self.timeout_spin.setRange(1, 300)
+        self.timeout_spin.setValue(int(self.ssh_executor.timeout))
+        self.timeout_spin.setSuffix(" s")
         col3_layout.addWidget(QLabel("Timeout (seconds):"))
-        col3_layout.addWidget(self.timeout_entry)
-        self.max_attempts_entry = QLineEdit(str(self.ssh_executor.max_attempts))
+        col3_layout.addWidget(self.timeout_spin)
+        self.max_attempts_spin = QSpinBox()
+        self.max_attempts_spin.setRange(1, 20)
+        self.max_attempts_spin.setValue(int(self.ssh_executor.max_attempts))
         col3_layout.addWidget(QLabel("Max Attempts:"))
-        col3_layout.addWidget(self.max_attempts_entry)
+        col3_layout.addWidget(self.max_attempts_spin)
 
         # Wi-Fi Temperature Polling
         lblTemp = QLabel("Wi-Fi Temperature Polling")
-        lblTemp.setStyleSheet(f"font-size: {int(12 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblTemp.setObjectName("SubsectionTitle")
         col3_layout.addWidget(lblTemp)
         self.wifi_temp_enabled_box = QCheckBox("Enable Wi-Fi Temperature")
         self.wifi_temp_enabled_box.setChecked(self.wifi_temp_enabled)
@@ -590,7 +731,7 @@ class DroneControlApp(QMainWindow):
         col3_layout.addWidget(self.wifi_temp_interval_spin)
 
         btnApplyCheck = QPushButton("Apply")
-        btnApplyCheck.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
+        btnApplyCheck.setProperty("action", "apply")
         btnApplyCheck.clicked.connect(self.apply_connection_settings)
         col3_layout.addWidget(btnApplyCheck)
         conn_layout.addWidget(col3)
@@ -601,17 +742,17 @@ class DroneControlApp(QMainWindow):
         camera_tab = QWidget()
         main_cam_layout = QVBoxLayout(camera_tab)
         main_cam_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        main_cam_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        main_cam_layout.setSpacing(int(20 * SCALE))
+        main_cam_layout.setContentsMargins(*PAGE_MARGINS)
+        main_cam_layout.setSpacing(_S['gap_xl'])
 
         lblCamTitle = QLabel("Camera Settings")
-        lblCamTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblCamTitle.setObjectName("PageTitle")
         main_cam_layout.addWidget(lblCamTitle)
 
         form_layout = QFormLayout()
         form_layout.setLabelAlignment(Qt.AlignLeft)
         form_layout.setFormAlignment(Qt.AlignLeft | Qt.AlignTop)
-        form_layout.setSpacing(int(10 * SCALE))
+        form_layout.setSpacing(_S['gap_s'])
         self.camera_device_entry = QLineEdit("/dev/video0")
         self.camera_res_entry = QLineEdit("1920x1080")
         self.camera_fps_entry = QLineEdit("60")
@@ -628,14 +769,14 @@ class DroneControlApp(QMainWindow):
         main_cam_layout.addWidget(swap_checkbox, alignment=Qt.AlignLeft)
 
         btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(int(10 * SCALE))
+        btn_layout.setSpacing(_S['gap_s'])
         btnApplyCam = QPushButton("Apply")
         btnApplyCam.setFixedSize(100, 30)
-        btnApplyCam.setStyleSheet("background-color: #10893E; color: white; font-weight: bold;")
+        btnApplyCam.setProperty("action", "apply")
         btnApplyCam.clicked.connect(self.apply_camera_settings)
         btnQueryCam = QPushButton("Query")
         btnQueryCam.setFixedSize(100, 30)
-        btnQueryCam.setStyleSheet("background-color: #007ACC; color: white; font-weight: bold;")
+        btnQueryCam.setProperty("action", "query")
         btnQueryCam.clicked.connect(self.query_camera_details)
         btn_layout.addWidget(btnApplyCam, alignment=Qt.AlignLeft)
         btn_layout.addWidget(btnQueryCam, alignment=Qt.AlignLeft)
@@ -643,50 +784,61 @@ class DroneControlApp(QMainWindow):
 
         tab_widget.addTab(camera_tab, "Camera Settings")
 
-        # About tab
+        # Services and About are built on first view; see _on_settings_tab_changed
+        for title, builder in (("Services", self._build_services_tab), ("About", self._build_about_tab)):
+            placeholder = QWidget()
+            placeholder._lazy_builder = builder
+            tab_widget.addTab(placeholder, title)
+        tab_widget.currentChanged.connect(lambda i: self._on_settings_tab_changed(tab_widget, i))
+
+        return page
+
+    def _on_settings_tab_changed(self, tab_widget, index):
+        placeholder = tab_widget.widget(index)
+        builder = getattr(placeholder, "_lazy_builder", None)
+        if builder is None:
+            return
+        del placeholder._lazy_builder
+        title = tab_widget.tabText(index)
+        real = builder()
+        # Swapping the tab re-emits currentChanged; the placeholder no longer has a builder then
+        tab_widget.blockSignals(True)
+        tab_widget.removeTab(index)
+        tab_widget.insertTab(index, real, title)
+        tab_widget.setCurrentIndex(index)
+        tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _build_about_tab(self):
         about_tab = QWidget()
         about_layout = QVBoxLayout(about_tab)
-        about_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        about_layout.setSpacing(int(10 * SCALE))
+        about_layout.setContentsMargins(*PAGE_MARGINS)
+        about_layout.setSpacing(_S['gap_s'])
         lblAboutTitle = QLabel("About Drone_control_v1.1")
-        lblAboutTitle.setStyleSheet(f"font-size: {int(16 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblAboutTitle.setObjectName("PageTitle")
         about_layout.addWidget(lblAboutTitle)
-        about_text = QTextEdit()
-        about_text.setReadOnly(True)
-        about_text.setStyleSheet("background-color: #3A3A3A; color: #FFFFFF; border: 1px solid #555555;")
-        about_text.setText("""
-<b>Drone_control_v1.1</b><br>
-A Python-based GUI application built with PyQt5 for controlling a drone's companion computer via SSH.<br><br>
-
-<b>Description:</b><br>
-This application provides a user-friendly interface to manage drone camera controls, and SSH connections. It connects to a companion computer through a relay station at 10.5.6.100:2222 (username: roz) and supports secondary IP failover. Features include camera switching, image/video capture, and system management (reboot/shutdown). Windows version uses paramiko for SSH.<br><br>
-
-<b>Changelog:</b><br>
-- Added Wi-Fi module temperature in the top status bar (updates every 5s).<br>
-- Updated all "Apply ..." buttons to simply read "Apply."<br>
-- Removed the large home-screen toggle for camera swap (use the checkbox in Camera Settings instead).<br>
-- Companion computer version is displayed as "N/A" (not retrieved due to configuration).<br>
-- Restored the three-column Connection Settings tab with improved alignment.<br>
-- Added explicit port fields and relay SSH settings in Connection Settings tab.<br>
-- Updated capture and video to match Rozcam script and transfer files via tunnel with delay.<br>
-- Added Relay SSH and Shutdown Relay buttons to left menu, renamed Open SSH Terminal to Companion SSH.<br>
-- Enhanced SSH command execution with retry logic (max_attempts=3, 5-second delay).<br>
-- Added sudo password handling for SSH commands.<br>
-- Added restart_relay_ssh_tunnel method to handle SSH tunnel restarts after reboots/shutdowns.<br>
-- Renamed Reboot and Shutdown buttons to Companion Reboot and Companion Shutdown for clarity.<br>
-- Removed ROS2 Topics tab and related functionality.<br>
-- Improved reboot/shutdown handling and connection checks.<br><br>
-""")
-        about_layout.addWidget(about_text)
-
-        # Services tab
+        # Static rich text: a label is enough, no QTextDocument/undo stack needed
+        about_text = QLabel(_ABOUT_HTML)
+        about_text.setObjectName("AboutText")
+        about_text.setTextFormat(Qt.RichText)
+        about_text.setWordWrap(True)
+        about_text.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        about_text.setTextInteractionFlags(Qt.TextBrowserInteraction)
+        about_scroll = QScrollArea()
+        about_scroll.setObjectName("AboutScroll")
+        about_scroll.setWidgetResizable(True)
+        about_scroll.setWidget(about_text)
+        about_layout.addWidget(about_scroll)
+        return about_tab
+
+    def _build_services_tab(self):
         services_tab = QWidget()
         services_layout = QVBoxLayout(services_tab)
-        services_layout.setContentsMargins(int(20 * SCALE), int(20 * SCALE), int(20 * SCALE), int(20 * SCALE))
-        services_layout.setSpacing(int(12 * SCALE))
+        services_layout.setContentsMargins(*PAGE_MARGINS)
+        services_layout.setSpacing(_S['gap_m'])
 
         lblSvc = QLabel("Service Control (Companion + Relay)")
-        lblSvc.setStyleSheet(f"font-size: {int(14 * SCALE)}pt; font-weight: bold; color: #FFFFFF;")
+        lblSvc.setObjectName("SectionTitle")
         services_layout.addWidget(lblSvc)
 
         svc_tabs = QTabWidget()
@@ -695,7 +847,7 @@ This application provides a user-friendly interface to manage drone camera contr
         # Companion services table
         comp_tab = QWidget()
         comp_layout = QVBoxLayout(comp_tab)
-        comp_layout.setSpacing(int(10 * SCALE))
+        comp_layout.setSpacing(_S['gap_s'])
 
         self.comp_service_table = QTableWidget()
         self.comp_service_table.setColumnCount(3)
@@ -721,7 +873,7 @@ This application provides a user-friendly interface to manage drone camera contr
         # Relay services table
         relay_tab = QWidget()
         relay_layout = QVBoxLayout(relay_tab)
-        relay_layout.setSpacing(int(10 * SCALE))
+        relay_layout.setSpacing(_S['gap_s'])
 
         self.relay_service_table = QTableWidget()
         self.relay_service_table.setColumnCount(3)
@@ -744,8 +896,6 @@ This application provides a user-friendly interface to manage drone camera contr
 
         svc_tabs.addTab(relay_tab, "Relay")
 
-        tab_widget.addTab(services_tab, "Services")
-
         # Populate initial rows (status will be filled on Refresh)
         self._populate_service_table("companion", [(s, "—", "—") for s in self._default_service_list()])
         self._populate_service_table("relay", [(s, "—", "—") for s in self._default_service_list()])
@@ -765,9 +915,7 @@ This application provides a user-friendly interface to manage drone camera contr
         self.btn_relay_enable.clicked.connect(lambda: self.service_action("relay", "enable"))
         self.btn_relay_disable.clicked.connect(lambda: self.service_action("relay", "disable"))
 
-        tab_widget.addTab(about_tab, "About")
-
-        return page
+        return services_tab
 
     # -------------------- Camera control helpers --------------------
     def toggle_camera_swap(self, new_state):
@@ -806,87 +954,97 @@ This application provides a user-friendly interface to manage drone camera contr
         else:
             self.show_error_message("Failed to switch split (bottom/front). Check SSH credentials or remote command.")
 
-    def capture_front(self):
-        device = "/dev/video2" if self.camera_swapped else "/dev/video0"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        remote_path = f"/home/roz/Model_image/Rozcam_{timestamp}.jpg"
-        local_path = os.path.join(os.path.expanduser("~"), "Pictures", f"Rozcam_{timestamp}.jpg")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -i {device}"
-        if self.ssh_executor.execute_command(command, f"Captured image from Front ({device}).", "Failed to capture front image. Check SSH credentials or remote command."):
-            time.sleep(2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
+    def _run_and_fetch(self, command, run_msg, fail_msg, delay_ms, remote_path, local_path,
+                       saved_msg, transfer_fail_msg, run_timeout=None):
+        """
+        Run a Rozcam command on the thread pool and fetch its output file delay_ms after it
+        returns, so the event loop keeps running while the camera works.
+        """
+        def _on_done(ok):
+            if ok:
+                self._schedule_transfer(remote_path, local_path, saved_msg, transfer_fail_msg, delay_ms)
+            else:
+                self.show_error_message(fail_msg)
+
+        self._start_task(self.ssh_executor.execute_command, command, run_msg, fail_msg, None, run_timeout,
+                         on_done=_on_done, on_error=lambda msg: self.show_error_message(fail_msg))
+
+    def _schedule_transfer(self, remote_path, local_path, saved_msg, transfer_fail_msg, delay_ms):
+        QTimer.singleShot(delay_ms, lambda: self._do_transfer(remote_path, local_path, saved_msg, transfer_fail_msg))
+
+    def _do_transfer(self, remote_path, local_path, saved_msg, transfer_fail_msg):
+        def _on_done(result):
+            success, transferred_path = result
             if success:
-                self.show_success_message(f"Front image captured and saved to {transferred_path}")
+                self.show_success_message(f"{saved_msg} {transferred_path}")
             else:
-                self.show_error_message(f"Failed to transfer front image from {remote_path}. Check path or permissions.")
-        else:
-            self.show_error_message("Failed to capture front image. Check SSH credentials or remote command.")
+                self.show_error_message(transfer_fail_msg)
 
-    def capture_bottom(self):
-        device = "/dev/video0" if self.camera_swapped else "/dev/video2"
+        self._start_task(self.ssh_executor.transfer_file, remote_path, local_path,
+                         on_done=_on_done, on_error=lambda msg: self.show_error_message(transfer_fail_msg))
+
+    def _capture(self, device, label):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         remote_path = f"/home/roz/Model_image/Rozcam_{timestamp}.jpg"
         local_path = os.path.join(os.path.expanduser("~"), "Pictures", f"Rozcam_{timestamp}.jpg")
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -i {device}"
-        if self.ssh_executor.execute_command(command, f"Captured image from Bottom ({device}).", "Failed to capture bottom image. Check SSH credentials or remote command."):
-            time.sleep(2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Bottom image captured and saved to {transferred_path}")
-            else:
-                self.show_error_message(f"Failed to transfer bottom image from {remote_path}. Check path or permissions.")
-        else:
-            self.show_error_message("Failed to capture bottom image. Check SSH credentials or remote command.")
+        self._run_and_fetch(f"Rozcam -i {device}", f"Captured image from {label} ({device}).",
+                            f"Failed to capture {label.lower()} image. Check SSH credentials or remote command.",
+                            2000, remote_path, local_path, f"{label} image captured and saved to",
+                            f"Failed to transfer {label.lower()} image from {remote_path}. Check path or permissions.")
 
-    def record_front(self):
-        device = "/dev/video2" if self.camera_swapped else "/dev/video0"
-        dur = self.record_duration_entry.text().strip()
-        if not dur.isdigit():
-            self.show_error_message("Please enter a valid duration in seconds.")
-            return
+    def _record(self, device, label):
+        dur = self.record_duration_spin.value()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         remote_path = f"/home/roz/Model_video/Rozcam_{timestamp}.mp4"
         local_path = os.path.join(os.path.expanduser("~"), "Videos", f"Rozcam_{timestamp}.mp4")
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -v {device} {dur}"
-        if self.ssh_executor.execute_command(command, f"Recording Front camera ({device}) for {dur} seconds.", "Failed to record front camera. Check SSH credentials or remote command."):
-            time.sleep(int(dur) + 2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Front video recorded and saved to {transferred_path}")
-            else:
-                self.show_error_message(f"Failed to transfer front video from {remote_path}. Check path or duration.")
-        else:
-            self.show_error_message("Failed to record front camera. Check SSH credentials or remote command.")
+        self._run_and_fetch(f"Rozcam -v {device} {dur}", f"Recording {label} camera ({device}) for {dur} seconds.",
+                            f"Failed to record {label.lower()} camera. Check SSH credentials or remote command.",
+                            (dur + 2) * 1000, remote_path, local_path, f"{label} video recorded and saved to",
+                            f"Failed to transfer {label.lower()} video from {remote_path}. Check path or duration.",
+                            run_timeout=dur + self.ssh_executor.timeout)
+
+    def capture_front(self):
+        self._capture("/dev/video2" if self.camera_swapped else "/dev/video0", "Front")
+
+    def capture_bottom(self):
+        self._capture("/dev/video0" if self.camera_swapped else "/dev/video2", "Bottom")
+
+    def record_front(self):
+        self._record("/dev/video2" if self.camera_swapped else "/dev/video0", "Front")
 
     def record_bottom(self):
-        device = "/dev/video0" if self.camera_swapped else "/dev/video2"
-        dur = self.record_duration_entry.text().strip()
-        if not dur.isdigit():
-            self.show_error_message("Please enter a valid duration in seconds.")
-            return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        remote_path = f"/home/roz/Model_video/Rozcam_{timestamp}.mp4"
-        local_path = os.path.join(os.path.expanduser("~"), "Videos", f"Rozcam_{timestamp}.mp4")
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        command = f"Rozcam -v {device} {dur}"
-        if self.ssh_executor.execute_command(command, f"Recording Bottom camera ({device}) for {dur} seconds.", "Failed to record bottom camera. Check SSH credentials or remote command."):
-            time.sleep(int(dur) + 2)
-            success, transferred_path = self.ssh_executor.transfer_file(remote_path, local_path)
-            if success:
-                self.show_success_message(f"Bottom video recorded and saved to {transferred_path}")
-            else:
-                self.show_error_message(f"Failed to transfer bottom video from {remote_path}. Check path or duration.")
-        else:
-            self.show_error_message("Failed to record bottom camera. Check SSH credentials or remote command.")
+        self._record("/dev/video0" if self.camera_swapped else "/dev/video2", "Bottom")
 
     # -------------------- Connection / status --------------------
     def refresh_connection_status(self):
+        # Starting an already pending timer doesn't queue a second probe
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_DEBOUNCE_MS)
+
+    def _probe_delay_s(self):
+        """
+        Throttle shared by manual refreshes and periodic checks: returns 0 (and records the
+        probe) when one may run now, otherwise the seconds left until PROBE_MIN_GAP_S has passed.
+        """
+        now = time.monotonic()
+        remaining = self._last_probe + self.PROBE_MIN_GAP_S - now
+        if remaining > 0:
+            return remaining
+        self._last_probe = now
+        return 0
+
+    def _do_refresh(self):
         if self.is_rebooting_or_shutting_down:
             self.update_connection_status("System Rebooting/Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
             return
+        delay = self._probe_delay_s()
+        if delay:
+            # Too soon after the last probe; run once the window has passed rather than drop
+            # it, since it may be for an endpoint that was just applied
+            self._refresh_timer.start(int(delay * 1000) + 1)
+            return
 
         original_timeout = self.ssh_executor.timeout
         original_max_attempts = self.ssh_executor.max_attempts
@@ -905,6 +1063,7 @@ This application provides a user-friendly interface to manage drone camera contr
             self.update_wifi_temp()  # refresh immediately on connect
         else:
             self.update_connection_status("Not Ready", "red", "Drone IP: Not Connected", "red")
+            self._version_source = None
             self.ssh_executor.restart_relay_ssh_tunnel()
 
         self.ssh_executor.timeout = original_timeout
@@ -912,8 +1071,13 @@ This application provides a user-friendly interface to manage drone camera contr
 
     def periodic_connection_check(self):
         if not self.connection_check_enabled or self.is_rebooting_or_shutting_down:
+            self.conn_check_timer.stop()
             self.update_connection_status("Connection Check Disabled", "gray", "Drone IP: N/A", "gray")
             return
+        self.conn_check_timer.start(self.connection_check_interval)
+        # A probe has only just run; its result stands until the next tick
+        if self._probe_delay_s():
+            return
 
         original_timeout = self.ssh_executor.timeout
         original_max_attempts = self.ssh_executor.max_attempts
@@ -935,40 +1099,31 @@ This application provides a user-friendly interface to manage drone camera contr
             self.update_wifi_temp()
         else:
             self.update_connection_status("Not Ready", "red", "Drone IP: Not Connected", "red")
+            self._version_source = None
             self.ssh_executor.restart_relay_ssh_tunnel()
 
         self.ssh_executor.timeout = original_timeout
         self.ssh_executor.max_attempts = original_max_attempts
-        QTimer.singleShot(self.connection_check_interval, self.periodic_connection_check)
 
     def update_connection_status(self, status_text, status_color, ip_text, ip_color):
-        if status_color.lower() == "green":
-            combined_text = f"Connected and Ready | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: black;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #006400, stop:1 #90EE90);
-            """)
-        elif status_color.lower() == "red":
-            combined_text = f"Not Ready | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #8B0000, stop:1 #FF6347);
-            """)
+        color = status_color.lower()
+        if color == "green":
+            combined_text, state = f"Connected and Ready | {ip_text}", "ok"
+        elif color == "red":
+            combined_text, state = f"Not Ready | {ip_text}", "err"
         else:
-            combined_text = f"{status_text} | {ip_text}"
-            self.top_status_label.setText(combined_text)
-            self.top_status_label.setStyleSheet("""
-                font-size: 16pt;
-                font-weight: bold;
-                color: #FFFFFF;
-                background-color: #2E2E2E;
-            """)
+            combined_text, state = f"{status_text} | {ip_text}", "neutral"
+        # Periodic checks mostly repeat the last state; skip the relabel and re-polish then
+        key = (state, combined_text)
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        label = self.top_status_label
+        label.setText(combined_text)
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def sync_time_with_popup(self, reachable_ip):
         logger.info("Synchronizing time with drone at IP: %s:%s", reachable_ip, self.ssh_executor.current_port)
@@ -979,44 +1134,32 @@ This application provides a user-friendly interface to manage drone camera contr
             self.show_error_message("Failed to synchronize time with the drone.")
 
     def update_companion_version(self):
-        command = "cat /etc/sid.conf"  # Assumes remote is Linux
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        try:
-            ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-            stdin, stdout, stderr = ssh.exec_command(command)
-            content = stdout.read().decode().strip()
-            version = "N/A"
-            if content:
-                match = re.search(r"[\s:](\d+\.\d+)", content)
-                version = match.group(1) if match else "N/A"
-            self.companion_version_label.setText(f"Companion Version: {version}")
-        except paramiko.AuthenticationException as e:
-            logger.error("SSH Authentication failed for version retrieval: %s", e)
-            self.companion_version_label.setText("Companion Version: N/A")
-        except Exception as e:
-            logger.error("Error retrieving companion version: %s", e)
-            self.companion_version_label.setText("Companion Version: N/A")
-        finally:
-            ssh.close()
+        # sid.conf doesn't change while the companion stays up; read it once per connection
+        source = (self.ssh_executor.current_ip, self.ssh_executor.current_port)
+        if source == self._version_source:
+            return
+        self.ssh_batch.submit("cat /etc/sid.conf 2>/dev/null",  # Assumes remote is Linux
+                              lambda content: self._on_sid_conf(content, source))
+
+    def _on_sid_conf(self, content, source=None):
+        version = "N/A"
+        if content is not None:
+            self._version_source = source
+        if content:
+            match = _RE_VERSION.search(content)
+            version = match.group(1) if match else "N/A"
+        elif content is None:
+            logger.error("Error retrieving companion version.")
+        self.companion_version_label.setText(f"Companion Version: {version}")
 
     # -------------------- Generic helpers --------------------
-    def create_tile_button(self, text, bg_color, success_msg, command, error_msg):
+    def _make_tile(self, btn, tile):
+        btn.setProperty("role", "tile")
+        btn.setProperty("tile", tile)
+
+    def create_tile_button(self, text, tile, success_msg, command, error_msg):
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: 1px solid #555555;
-                font-size: {int(14 * SCALE)}pt;
-                padding: {int(8 * SCALE)}px;
-                margin: {int(6 * SCALE)}px;
-                min-width: {int(130 * SCALE)}px;
-                min-height: {int(60 * SCALE)}px;
-            }}
-            QPushButton:hover {{ background-color: #666666; }}
-            QPushButton:pressed {{ background-color: #777777; }}
-        """)
+        self._make_tile(btn, tile)
         if callable(command):
             btn.clicked.connect(command)
         else:
@@ -1038,7 +1181,7 @@ This application provides a user-friendly interface to manage drone camera contr
         self.ssh_executor.username = self.username_entry.text().strip()
         password = self.password_entry.text().strip()
         if password:
-            keyring.set_password("Drone-Control", self.ssh_executor.username, password)
+            self.ssh_executor.store_password(self.ssh_executor.username, password)
             self.ssh_executor.password = password
         # Apply Wi-Fi temperature polling settings (independent of connection check)
         try:
@@ -1046,9 +1189,7 @@ This application provides a user-friendly interface to manage drone camera contr
             self.wifi_temp_poll_ms = int(self.wifi_temp_interval_spin.value()) * 1000
             self.ssh_executor.ssh_config["temp_poll_enabled"] = self.wifi_temp_enabled
             self.ssh_executor.ssh_config["temp_poll_ms"] = self.wifi_temp_poll_ms
-            if hasattr(self, "wifi_temp_poller") and self.wifi_temp_poller:
-                self.wifi_temp_poller.set_enabled(self.wifi_temp_enabled)
-                self.wifi_temp_poller.set_interval_ms(self.wifi_temp_poll_ms)
+            self._apply_temp_polling()
         except Exception as e:
             logger.error("Failed to apply Wi-Fi temp polling settings: %s", e)
 
@@ -1069,7 +1210,7 @@ This application provides a user-friendly interface to manage drone camera contr
         self.ssh_executor.relay_username = self.relay_username_entry.text().strip()
         relay_password = self.relay_password_entry.text().strip()
         if relay_password:
-            keyring.set_password("Drone-Control", self.ssh_executor.relay_username, relay_password)
+            self.ssh_executor.store_password(self.ssh_executor.relay_username, relay_password)
             self.ssh_executor.relay_password = relay_password
         # Apply Wi-Fi temperature polling settings (independent of connection check)
         try:
@@ -1077,9 +1218,7 @@ This application provides a user-friendly interface to manage drone camera contr
             self.wifi_temp_poll_ms = int(self.wifi_temp_interval_spin.value()) * 1000
             self.ssh_executor.ssh_config["temp_poll_enabled"] = self.wifi_temp_enabled
             self.ssh_executor.ssh_config["temp_poll_ms"] = self.wifi_temp_poll_ms
-            if hasattr(self, "wifi_temp_poller") and self.wifi_temp_poller:
-                self.wifi_temp_poller.set_enabled(self.wifi_temp_enabled)
-                self.wifi_temp_poller.set_interval_ms(self.wifi_temp_poll_ms)
+            self._apply_temp_polling()
         except Exception as e:
             logger.error("Failed to apply Wi-Fi temp polling settings: %s", e)
 
@@ -1096,28 +1235,11 @@ This application provides a user-friendly interface to manage drone camera contr
     def apply_connection_settings(self):
         self.connection_check_enabled = self.conn_check_enabled_box.isChecked()
         self.ssh_executor.ssh_config["connection_check_enabled"] = self.connection_check_enabled
-        try:
-            interval_sec = int(self.interval_entry.text())
-            if interval_sec <= 0:
-                self.show_error_message("Interval must be a positive integer.")
-                return
-            self.connection_check_interval = interval_sec * 1000
-            self.ssh_executor.ssh_config["connection_check_interval"] = self.connection_check_interval
-
-            timeout_sec = int(self.timeout_entry.text())
-            if timeout_sec <= 0:
-                self.show_error_message("Timeout must be a positive integer.")
-                return
-            self.ssh_executor.timeout = timeout_sec
-
-            max_attempts = int(self.max_attempts_entry.text())
-            if max_attempts <= 0:
-                self.show_error_message("Max attempts must be a positive integer.")
-                return
-            self.ssh_executor.max_attempts = max_attempts
-        except ValueError:
-            self.show_error_message("Invalid interval, timeout, or max attempts value. Please enter valid integers.")
-            return
+        # The spin boxes only accept positive integers, so there is nothing to parse or reject
+        self.connection_check_interval = self.interval_spin.value() * 1000
+        self.ssh_executor.ssh_config["connection_check_interval"] = self.connection_check_interval
+        self.ssh_executor.timeout = self.timeout_spin.value()
+        self.ssh_executor.max_attempts = self.max_attempts_spin.value()
 
         # Apply Wi-Fi temperature polling settings (independent of connection check)
         try:
@@ -1125,9 +1247,7 @@ This application provides a user-friendly interface to manage drone camera contr
             self.wifi_temp_poll_ms = int(self.wifi_temp_interval_spin.value()) * 1000
             self.ssh_executor.ssh_config["temp_poll_enabled"] = self.wifi_temp_enabled
             self.ssh_executor.ssh_config["temp_poll_ms"] = self.wifi_temp_poll_ms
-            if hasattr(self, "wifi_temp_poller") and self.wifi_temp_poller:
-                self.wifi_temp_poller.set_enabled(self.wifi_temp_enabled)
-                self.wifi_temp_poller.set_interval_ms(self.wifi_temp_poll_ms)
+            self._apply_temp_polling()
         except Exception as e:
             logger.error("Failed to apply Wi-Fi temp polling settings: %s", e)
 
@@ -1138,6 +1258,7 @@ This application provides a user-friendly interface to manage drone camera contr
         if self.connection_check_enabled:
             self.periodic_connection_check()
         else:
+            self.conn_check_timer.stop()
             self.update_connection_status("Connection Check Disabled", "gray", "Drone IP: N/A", "gray")
 
     # -------------------- Camera settings to remote --------------------
@@ -1157,13 +1278,9 @@ This application provides a user-friendly interface to manage drone camera contr
         config_path = "/etc/vision_streaming.conf"
         if sys.platform.startswith('win'):
             logger.warning("Config file update not supported on Windows locally; assuming remote Linux target.")
-        ssh = paramiko.SSHClient(); sftp = None
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
-            ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-            sftp = ssh.open_sftp()
-            with sftp.file(config_path, 'r') as file:
-                lines = file.readlines()
+            # Read and write over the executor's pooled SFTP channel instead of a fresh connection
+            lines = self.ssh_executor.read_remote_text(config_path).splitlines(keepends=True)
             in_target = False
             new_lines = []
             res_updated = fps_updated = format_updated = False
@@ -1202,23 +1319,17 @@ This application provides a user-friendly interface to manage drone camera contr
                     new_lines.append(f"fps = {fps}\n")
                 if not format_updated:
                     new_lines.append(f"format = {cam_format}\n")
-            with sftp.file(config_path, 'w') as file:
-                file.writelines(new_lines)
+            self.ssh_executor.write_remote_text(config_path, "".join(new_lines))
             logger.info("Configuration file updated successfully with new camera parameters.")
             self.control_service('restart')
             self.show_success_message("Configuration file updated and service restarted successfully.")
-        except paramiko.AuthenticationException as e:
-            logger.error("SSH Authentication failed for config update: %s", e)
-            self.show_error_message("Failed to update config file. Check SSH credentials.")
         except Exception as e:
-            logger.error("Error updating config file: %s", e)
-            self.show_error_message(f"Error updating config file: {str(e)}")
-        finally:
-            try:
-                if sftp: sftp.close()
-            except Exception:
-                pass
-            ssh.close()
+            if self.ssh_executor.is_auth_error(e):
+                logger.error("SSH Authentication failed for config update: %s", e)
+                self.show_error_message("Failed to update config file. Check SSH credentials.")
+            else:
+                logger.error("Error updating config file: %s", e)
+                self.show_error_message(f"Error updating config file: {str(e)}")
 
     def control_service(self, action):
         if sys.platform.startswith('win'):
@@ -1232,36 +1343,25 @@ This application provides a user-friendly interface to manage drone camera contr
     def query_camera_details(self):
         device = self.camera_device_entry.text().strip()
         command = f"sudo vision_config_manager list-details {device}"
-        if self.ssh_executor.execute_command(command, "Camera details queried successfully.", "Failed to query camera details. Check SSH credentials or remote command availability."):
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            try:
-                ssh.connect(self.ssh_executor.current_ip, int(self.ssh_executor.current_port), self.ssh_executor.username, self.ssh_executor.password, timeout=self.ssh_executor.timeout)
-                stdin, stdout, stderr = ssh.exec_command(command)
-                details = stdout.read().decode()
-                dialog = QDialog(self)
-                dialog.setWindowTitle("Camera Details")
-                dialog.resize(800, 600)
-                layout = QVBoxLayout(dialog)
-                text_area = QPlainTextEdit()
-                text_area.setReadOnly(True)
-                text_area.setPlainText(details)
-                layout.addWidget(text_area)
-                button_box = QDialogButtonBox(QDialogButtonBox.Close)
-                button_box.rejected.connect(dialog.reject)
-                layout.addWidget(button_box)
-                dialog.exec_()
-                self.show_success_message("Camera details queried successfully.")
-            except paramiko.AuthenticationException as e:
-                logger.error("SSH Authentication failed for camera query: %s", e)
-                self.show_error_message("Failed to query camera details. Check SSH credentials or remote command availability.")
-            except Exception as e:
-                logger.error("Error querying camera details: %s", e)
-                self.show_error_message("Failed to query camera details.")
-            finally:
-                ssh.close()
-        else:
+        # One channel on the pooled transport; the output comes back from the same run
+        ok, details, err, _ = self.ssh_executor.execute_command_capture(command)
+        if not ok:
+            logger.error("Error querying camera details: %s", err)
             self.show_error_message("Failed to query camera details. Check SSH credentials or remote command availability.")
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Camera Details")
+        dialog.resize(800, 600)
+        layout = QVBoxLayout(dialog)
+        text_area = QPlainTextEdit()
+        text_area.setReadOnly(True)
+        text_area.setPlainText(details)
+        layout.addWidget(text_area)
+        button_box = QDialogButtonBox(QDialogButtonBox.Close)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+        dialog.exec_()
+        self.show_success_message("Camera details queried successfully.")
 
     # -------------------- External tools --------------------
     def open_companion_ssh_terminal(self):
@@ -1306,113 +1406,97 @@ This application provides a user-friendly interface to manage drone camera contr
             action()
 
     # -------------------- Reboot/shutdown helpers --------------------
-    def reboot_companion_and_restart_tunnel(self):
+    def _send_power_command(self, command, status_text, relay, sent_msg, error_msg, settle_ms):
+        """Send a reboot/shutdown without waiting on it, then re-probe once the targets have had settle_ms."""
         self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Rebooting", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for reboot, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_command_all("sudo reboot", "Companion computers are rebooting.", "Failed to initiate reboot of companion computers."):
-            self.show_success_message("Companion computers are rebooting.")
-            time.sleep(90)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to initiate reboot of companion computers.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
+        self._version_source = None
+        self.update_connection_status(status_text, "gray", "Drone IP: Temporarily Unavailable", "gray")
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+        def _on_sent(sent):
+            if sent:
+                self.show_success_message(sent_msg)
+                QTimer.singleShot(settle_ms, self._after_power_command)
+            else:
+                self.show_error_message(error_msg)
+                self._after_power_command()
 
-    def shutdown_companion_and_restart_tunnel(self):
-        self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for shutdown, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_command_all("sudo shutdown now", "Companion computers are shutting down.", "Failed to shut down companion computers."):
-            self.show_success_message("Companion computers are shutting down.")
-            time.sleep(120)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to shut down companion computers.")
+        self._start_task(self._run_power_command, command, relay,
+                         on_done=_on_sent, on_error=lambda msg: _on_sent(False))
+
+    def _run_power_command(self, command, relay):
+        """Worker-thread half of _send_power_command; returns True if every target got the command."""
+        sent = self.ssh_executor.send_async(command, relay=relay)
+        if not sent:
             self.ssh_executor.restart_relay_ssh_tunnel()
+        return sent
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+    def _after_power_command(self):
+        self.is_rebooting_or_shutting_down = False
+        # A periodic tick during the power action stopped the timer; put the cadence back
+        if self.connection_check_enabled and not self.conn_check_timer.isActive():
+            self.conn_check_timer.start(self.connection_check_interval)
+        self.refresh_connection_status()
 
-    def reboot_relay(self):
-        self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Rebooting", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for relay reboot, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_relay_command("sudo reboot", "Relay station is rebooting.", "Failed to reboot relay station."):
-            self.show_success_message("Relay station is rebooting.")
-            time.sleep(90)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to reboot relay station.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
+    def reboot_companion_and_restart_tunnel(self):
+        self._send_power_command("sudo reboot", "System Rebooting", False,
+                                 "Companion computers are rebooting.",
+                                 "Failed to initiate reboot of companion computers.", 90000)
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+    def shutdown_companion_and_restart_tunnel(self):
+        self._send_power_command("sudo shutdown now", "System Shutting Down", False,
+                                 "Companion computers are shutting down.",
+                                 "Failed to shut down companion computers.", 120000)
 
-    def shutdown_relay(self):
-        self.is_rebooting_or_shutting_down = True
-        self.update_connection_status("System Shutting Down", "gray", "Drone IP: Temporarily Unavailable", "gray")
-        original_max_attempts = self.ssh_executor.max_attempts
-        original_timeout = self.ssh_executor.timeout
-        try:
-            self.ssh_executor.max_attempts = 1
-            self.ssh_executor.timeout = int(self.ssh_executor.timeout)
-        except (ValueError, AttributeError):
-            logger.warning("Invalid timeout or max attempts in settings for relay shutdown, using defaults.")
-            self.ssh_executor.timeout = 300
-            self.ssh_executor.max_attempts = 1
-
-        if self.ssh_executor.execute_relay_command("sudo shutdown now", "Relay station is shutting down.", "Failed to shut down relay station."):
-            self.show_success_message("Relay station is shutting down.")
-            time.sleep(120)
-            self.refresh_connection_status()
-        else:
-            self.show_error_message("Failed to shut down relay station.")
-            self.ssh_executor.restart_relay_ssh_tunnel()
+    def reboot_relay(self):
+        self._send_power_command("sudo reboot", "System Rebooting", True,
+                                 "Relay station is rebooting.",
+                                 "Failed to reboot relay station.", 90000)
 
-        self.ssh_executor.max_attempts = original_max_attempts
-        self.ssh_executor.timeout = original_timeout
+    def shutdown_relay(self):
+        self._send_power_command("sudo shutdown now", "System Shutting Down", True,
+                                 "Relay station is shutting down.",
+                                 "Failed to shut down relay station.", 120000)
 
     # -------------------- Wi-Fi Temp polling --------------------
     def update_wifi_temp(self):
-        """Backward-compatible method (no SSH here). Temp is updated by WifiTempPoller."""
+        """Backward-compatible method (no SSH here). Temp is updated by wifi_temp_timer."""
         # Keep for older call sites; do nothing.
         return
 
+    def _apply_temp_polling(self):
+        self.wifi_temp_timer.setInterval(max(200, int(self.wifi_temp_poll_ms)))
+        if self.wifi_temp_enabled:
+            if not self.wifi_temp_timer.isActive():
+                self.wifi_temp_timer.start()
+                self._fire_temp_task()
+        else:
+            self.wifi_temp_timer.stop()
+
+    def _fire_temp_task(self):
+        # A slow read is never stacked behind another; the next tick tries again
+        if self._temp_task is not None:
+            return
+        task = SSHTask(self.ssh_executor.get_wifi_module_temperature)
+
+        def _done(t):
+            self._temp_task = None
+            self._on_wifi_temp_ready(t)
+
+        task.signals.finished.connect(_done)
+        task.signals.error.connect(lambda msg: _done(None))
+        self._temp_task = task
+        QThreadPool.globalInstance().start(task)
+
     def _on_wifi_temp_ready(self, t):
         try:
-            self.wifi_temp_label.setText("Wi-Fi Temp: " + (f"{t:.1f} °C" if t is not None else "N/A"))
-        except Exception:
-            self.wifi_temp_label.setText("Wi-Fi Temp: N/A")
+            disp = None if t is None else round(float(t), 1)
+        except (TypeError, ValueError):
+            disp = None
+        # A flat temperature would otherwise relayout the top dock on every poll
+        if disp == self._last_temp:
+            return
+        self._last_temp = disp
+        self.wifi_temp_label.setText("Wi-Fi Temp: " + (f"{disp:.1f} °C" if disp is not None else "N/A"))
 
 
     # -------------------- Services helpers --------------------
@@ -1451,6 +1535,37 @@ This application provides a user-friendly interface to manage drone camera contr
             table.setItem(r, 1, QTableWidgetItem(str(active)))
             table.setItem(r, 2, QTableWidgetItem(str(enabled)))
 
+    def _start_task(self, fn, *args, on_done=None, on_error=None):
+        """Run blocking SSH work fn(*args) on the thread pool; on_done/on_error run on the GUI thread."""
+        task = SSHTask(fn, *args)
+
+        def _finished(result):
+            self._ssh_tasks.discard(task)
+            if on_done is not None:
+                on_done(result)
+
+        def _failed(msg):
+            self._ssh_tasks.discard(task)
+            logger.error("Background SSH task failed: %s", msg)
+            if on_error is not None:
+                on_error(msg)
+
+        task.signals.finished.connect(_finished)
+        task.signals.error.connect(_failed)
+        self._ssh_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _start_ssh_task(self, host, port, user, pw, cmd, callback, want_output=True):
+        task = SSHCommandTask(self.ssh_executor, host, port, user, pw, cmd, want_output=want_output)
+
+        def _finished(ok, out, err):
+            self._ssh_tasks.discard(task)
+            callback(ok, out, err)
+
+        task.signals.finished_result.connect(_finished)
+        self._ssh_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
     def _get_selected_service(self, target: str):
         table = self.comp_service_table if target == "companion" else self.relay_service_table
         items = table.selectedItems()
@@ -1471,9 +1586,8 @@ This application provides a user-friendly interface to manage drone camera contr
         else:
             host, port, user, pw = self.ssh_executor.relay_ip, self.ssh_executor.relay_ssh_port, self.ssh_executor.relay_username, self.ssh_executor.relay_password
 
-        worker = SSHCommandWorker(host, port, user, pw, cmd, timeout=self.ssh_executor.timeout, parent=self)
-        worker.finished_result.connect(lambda ok, out, err: self._on_services_refreshed(target, ok, out, err))
-        worker.start()
+        self._start_ssh_task(host, port, user, pw, cmd,
+                             lambda ok, out, err: self._on_services_refreshed(target, ok, out, err))
 
     def _on_services_refreshed(self, target: str, ok: bool, out: str, err: str):
         if not ok:
@@ -1515,9 +1629,9 @@ This application provides a user-friendly interface to manage drone camera contr
         else:
             host, port, user, pw = self.ssh_executor.relay_ip, self.ssh_executor.relay_ssh_port, self.ssh_executor.relay_username, self.ssh_executor.relay_password
 
-        worker = SSHCommandWorker(host, port, user, pw, cmd, timeout=self.ssh_executor.timeout, parent=self)
-        worker.finished_result.connect(lambda ok, out, err: self._on_service_action_done(target, svc, action, ok, out, err))
-        worker.start()
+        self._start_ssh_task(host, port, user, pw, cmd,
+                             lambda ok, out, err: self._on_service_action_done(target, svc, action, ok, out, err),
+                             want_output=False)
 
     def _on_service_action_done(self, target: str, svc: str, action: str, ok: bool, out: str, err: str):
         if not ok:
@@ -1538,6 +1652,8 @@ This application provides a user-friendly interface to manage drone camera contr
 # -------------------- Entrypoint --------------------
 def main():
     app = QApplication(sys.argv)
+    # One pool thread per concurrent SSH channel the executor allows
+    QThreadPool.globalInstance().setMaxThreadCount(SSHExecutor.max_sessions)
     apply_dark_gnome_style(app)
     apply_global_stylesheet(app)
     logger.debug("Starting Drone_control_v1.1...")
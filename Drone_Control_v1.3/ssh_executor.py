@@ -5,32 +5,141 @@ Handles SSH connections and commands for the Drone_control_v1.1 application usin
 """
 
 import os
+import copy
 import json
+import functools
+import random
+import select
+import re
 import socket
 import time
-import keyring
+import atexit
+import shlex
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import importlib
 import logging
 import sys
 from datetime import datetime
 
-import paramiko
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
 
 logger = logging.getLogger("DroneControl")
 
+# Remote Wi-Fi temperature probe, fed to `sh -s -- <configured iface>` over a single exec.
+# Prints "A:" (procfs thermal_state), "B:" (wfb-cli) and "C:" (sysfs hwmon) sections and
+# stops as soon as the authoritative procfs source has produced a reading.
+_WIFI_PROBE_SCRIPT = r"""
+TO=2
+cfg_iface=${1:-}
+iface=""
+if [ -r /etc/default/wifibroadcast ]; then
+  v=$(grep -E "^[[:space:]]*WFB_NICS=" /etc/default/wifibroadcast | tail -n1 | cut -d= -f2- | tr -d "\"'")
+  set -- $v
+  iface=${1:-}
+fi
+[ -n "$iface" ] || iface=$(ls -1 /proc/net/rtl88x2eu 2>/dev/null | grep -E "^wl" | head -n1)
+[ -n "$iface" ] || iface=$cfg_iface
+
+echo "A:"
+if [ -n "$iface" ]; then
+  a=$(timeout ${TO}s cat "/proc/net/rtl88x2eu/$iface/thermal_state" 2>/dev/null)
+  printf "%s\n" "$a"
+  case "$a" in *temperature:*) exit 0 ;; esac
+fi
+
+echo "B:"
+out=$( (timeout ${TO}s /usr/local/sbin/wfb-cli drone || timeout ${TO}s /usr/local/bin/wfb-cli drone || timeout ${TO}s wfb-cli drone) 2>/dev/null )
+printf "%s\n" "$out" | grep -iE "temp|temperature" | head -n 20
+
+echo "C:"
+for p in /sys/class/ieee80211/*/device/hwmon/*/temp1_input /sys/class/hwmon/hwmon*/temp1_input; do
+  [ -r "$p" ] || continue
+  v=$(timeout ${TO}s cat "$p" 2>/dev/null) || continue
+  echo "$v"
+  break
+done
+exit 0
+"""
+_WIFI_PROBE_SCRIPT_QUOTED = shlex.quote(_WIFI_PROBE_SCRIPT)
+# Readings in the probe's A: (procfs thermal_state) and B: (wfb-cli) sections
+_RE_PROCFS_TEMP = re.compile(r"temperature:\s*(-?\d+(?:\.\d+)?)")
+_RE_CLI_TEMP = re.compile(r"(-?\d+(?:\.\d+)?)\s*°?\s*[Cc]\b")
+
+# Algorithms moved to the front of paramiko's negotiation lists: these are the ones
+# the cryptography backend runs fastest. Anything the installed paramiko lacks is skipped.
+_PREFERRED_ALGORITHMS = (
+    ("kex", ("curve25519-sha256@libssh.org", "curve25519-sha256", "ecdh-sha2-nistp256")),
+    ("ciphers", ("aes128-gcm@openssh.com", "aes128-ctr", "aes256-gcm@openssh.com", "aes256-ctr")),
+    ("digests", ("hmac-sha2-256-etm@openssh.com", "hmac-sha2-256")),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path, mtime_ns):
+    """Parse a JSON file once per (path, mtime); callers must copy before mutating."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+KEYRING_SERVICE = "Drone-Control"
+
+
+class CommandTimeout(Exception):
+    """A remote command was still running when its time limit ran out (the session itself is fine)."""
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_keyring(service, username):
+    """keyring.get_password() memoized per (service, user); each miss is a Secret Service D-Bus call."""
+    # Imported here: probing the keyring backend is slow and not needed until a password is looked up
+    import keyring
+    return keyring.get_password(service, username)
+
+
+def store_password(service, username, password):
+    """Save a password in the system keyring and drop any memoized copy."""
+    import keyring
+    keyring.set_password(service, username, password)
+    invalidate_keyring_cache()
+
+
+def invalidate_keyring_cache():
+    """Forget memoized passwords, e.g. after the user stores new credentials."""
+    _cached_keyring.cache_clear()
+
 
 class SSHExecutor:
     CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "ssh_config.json")
     timeout = 5         # Default timeout in seconds
+    command_timeout = None  # Seconds a remote command may run; None waits for it (config: command_timeout_s)
+    probe_timeout = 2   # TCP connect timeout for reachability probes
+    secondary_grace_s = 0.5  # How long the primary probe runs alone before the secondary joins it
     max_attempts = 3    # Default max attempts for connection checks
+    backoff_base = 0.2  # First retry delay in seconds, doubled per attempt
+    backoff_cap = 1.0   # Upper bound for a single retry delay
+    compress = True     # zlib on the SSH transport; mostly pays off for log downloads
+    keepalive_interval = 30  # Seconds between SSH keepalives (config: keepalive_interval_s)
+    keepalive_count_max = 3  # Unanswered keepalives before an external ssh gives up (config: keepalive_count_max)
+    max_sessions = 4    # Concurrent exec channels across all pooled transports (sshd MaxSessions is 10)
+    sftp_window_size = 8 << 20  # SFTP channel window; paramiko's 2 MiB default caps prefetch on slow links
 
     def __init__(self):
         self.ssh_config = self.load_config()
 
         self.username = self.ssh_config.get("username", "roz")
-        self.password = keyring.get_password("Drone-Control", self.username) or "default_password"
+        self._password = None   # looked up lazily, see the password property
 
         self.relay_username = self.ssh_config.get("relay_username", "vind-admin")
-        self.relay_password = keyring.get_password("Drone-Control", self.relay_username) or "default_password"
+        self._relay_password = None
 
         self.current_ip = self.ssh_config.get("primary_ip", "10.5.6.100")
         self.current_port = self.ssh_config.get("primary_port", "2222")
@@ -47,6 +156,92 @@ class SSHExecutor:
             self.relay_ip, self.relay_ssh_port
         )
 
+        self._build_wifi_probe_cmds((self.ssh_config.get("wifi_iface") or "").strip())
+
+        # Replaces a leading "sudo " in remote commands; see _sudo()
+        self._sudo_prefix = "sudo -n " if self.ssh_config.get("sudo_nopasswd") else None
+
+        try:
+            self.keepalive_interval = int(self.ssh_config.get("keepalive_interval_s", self.keepalive_interval))
+            self.keepalive_count_max = int(self.ssh_config.get("keepalive_count_max", self.keepalive_count_max))
+        except (TypeError, ValueError):
+            logger.warning("Invalid keepalive settings in config; using defaults.")
+        command_timeout = self.ssh_config.get("command_timeout_s")
+        try:
+            self.command_timeout = float(command_timeout) if command_timeout else None
+        except (TypeError, ValueError):
+            logger.warning("Invalid command_timeout_s in config; commands run without a time limit.")
+
+        # Pooled SSH transports keyed by (ip, port, username); see _get_transport()
+        self._pool = {}
+        self._sftp_pool = {}
+        self._shell_pool = {}
+        # Guards the pool dicts only; connects and channel opens happen under the per-key
+        # lock from _key_lock(), so one slow or dead host never stalls the others
+        self._pool_lock = threading.Lock()
+        self._key_locks = {}
+        # Set by shutdown(); no new sessions are opened afterwards
+        self._shut_down = False
+        # Serialises use of the long-lived shell channels; see exec_pipelined()
+        self._shell_lock = threading.Lock()
+        # Bounds the exec channels open at once, so parallel callers share the pooled
+        # transports without running into the server's per-connection session limit
+        self._session_slots = threading.BoundedSemaphore(self.max_sessions)
+        atexit.register(self.close_all)
+
+        # (ip, port) -> deadline of the last successful probe; see is_reachable()
+        self._reach_cache = {}
+
+        # host -> (expiry, numeric address); see _resolve()
+        self._dns_cache = {}
+        self._dns_lock = threading.Lock()
+
+        # ~/.ssh/known_hosts, parsed once on the first connect; see _known_hosts
+        self._host_keys = None
+        # Private key from ssh_key_file, loaded once on the first connect; see _private_key
+        self._pkey = None
+        self._pkey_loaded = False
+
+        # Worker threads used to talk to several hosts at once (primary + secondary)
+        self._workers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ssh")
+
+    # -------------------------------------------------------------------------
+    # Credentials
+    # -------------------------------------------------------------------------
+    @functools.cached_property
+    def _paramiko(self):
+        # paramiko (and its crypto stack) is only imported on first SSH use, keeping it off GUI
+        # startup; cached so the hot paths' except clauses don't repeat the module lookup
+        return importlib.import_module("paramiko")
+
+    def is_auth_error(self, exc):
+        return isinstance(exc, self._paramiko.AuthenticationException)
+
+    def store_password(self, username, password):
+        store_password(KEYRING_SERVICE, username, password)
+
+    @property
+    def password(self):
+        if self._password is None:
+            self._password = _cached_keyring(KEYRING_SERVICE, self.username) or "default_password"
+        return self._password
+
+    @password.setter
+    def password(self, value):
+        self._password = value
+        invalidate_keyring_cache()
+
+    @property
+    def relay_password(self):
+        if self._relay_password is None:
+            self._relay_password = _cached_keyring(KEYRING_SERVICE, self.relay_username) or "default_password"
+        return self._relay_password
+
+    @relay_password.setter
+    def relay_password(self, value):
+        self._relay_password = value
+        invalidate_keyring_cache()
+
     # -------------------------------------------------------------------------
     # Config
     # -------------------------------------------------------------------------
@@ -65,7 +260,18 @@ class SSHExecutor:
             "wifi_temp": {"offset": 32, "scale": 2.5},
             # Optional UI features
             "connection_check_enabled": True,
-            "connection_check_interval": 30000
+            "connection_check_interval": 30000,
+            # Seconds a successful reachability probe is trusted before probing again
+            "reachability_cache_ttl_s": 15,
+            # SSH keepalives, so idle sessions survive NAT/firewall timeouts between polls
+            "keepalive_interval_s": 30,
+            "keepalive_count_max": 3,
+            # Seconds a remote command may run before it is reported as failed; null = no limit
+            "command_timeout_s": None,
+            # Private key tried before the password; missing or passphrase-protected keys are skipped
+            "ssh_key_file": "~/.ssh/id_ed25519",
+            # True once the targets have NOPASSWD sudoers entries: sudo runs with -n and no password
+            "sudo_nopasswd": False
         }
 
     def load_config(self):
@@ -78,8 +284,8 @@ class SSHExecutor:
             return cfg_default
 
         try:
-            with open(self.CONFIG_FILE, "r", encoding="utf-8") as file:
-                config = json.load(file)
+            mtime_ns = os.stat(self.CONFIG_FILE).st_mtime_ns
+            config = copy.deepcopy(_load_json_cached(self.CONFIG_FILE, mtime_ns))
             # Ensure all defaults exist
             for k, v in cfg_default.items():
                 if k not in config:
@@ -95,40 +301,116 @@ class SSHExecutor:
     def save_config(self):
         config_dir = os.path.dirname(self.CONFIG_FILE)
         os.makedirs(config_dir, exist_ok=True)
-        with open(self.CONFIG_FILE, "w", encoding="utf-8") as file:
-            json.dump(self.ssh_config, file, indent=4)
+        if orjson is not None:
+            data = orjson.dumps(self.ssh_config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.ssh_config, indent=2).encode("utf-8")
+        # Write to a temp file and swap it in, so a crash mid-write can't leave a torn config
+        tmp_path = self.CONFIG_FILE + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.CONFIG_FILE)
+        _load_json_cached.cache_clear()
 
     # -------------------------------------------------------------------------
     # Reachability & connection test
     # -------------------------------------------------------------------------
+    def _resolve(self, host, port=22, ttl=300):
+        """
+        Resolve host to a numeric address, caching the answer for ttl seconds so the
+        periodic polls and reconnects don't go through getaddrinfo every time.
+        """
+        now = time.monotonic()
+        with self._dns_lock:
+            cached = self._dns_cache.get(host)
+            if cached is not None and now < cached[0]:
+                return cached[1]
+
+        infos = socket.getaddrinfo(host, int(port), type=socket.SOCK_STREAM)
+        addr = infos[0][4][0]
+        with self._dns_lock:
+            self._dns_cache[host] = (now + ttl, addr)
+        return addr
+
+    @classmethod
+    def _backoff(cls, attempt):
+        """Delay before retry number attempt + 1: exponential (0.2, 0.4, 0.8 ... capped) plus jitter."""
+        return min(cls.backoff_base * 2 ** attempt, cls.backoff_cap) + random.uniform(0, 0.1)
+
+    def _open_socket(self, ip, port, timeout):
+        """Open a TCP connection to (ip, port) through the DNS cache, with Nagle disabled."""
+        addr = self._resolve(ip, port)
+        family = socket.AF_INET6 if ":" in addr else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect((addr, int(port)))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    @staticmethod
+    def _enable_tcp_keepalive(sock, idle=30, interval=10, count=3):
+        """Turn on kernel TCP keepalive; the tuning knobs are only set where the platform has them."""
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+            if hasattr(socket, name):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+
     def is_reachable(self, ip, port="22", timeout=None, max_attempts=None):
         if timeout is None:
-            timeout = self.timeout
+            timeout = min(self.probe_timeout, float(self.timeout))
         if max_attempts is None:
             max_attempts = self.max_attempts
 
+        cache_key = (ip, str(port))
+        deadline = self._reach_cache.get(cache_key)
+        if deadline is not None and time.monotonic() < deadline:
+            return True
+
         logger.debug("Checking reachability for IP: %s:%s", ip, port)
         for attempt in range(max_attempts):
             try:
-                socket.create_connection((ip, int(port)), timeout=timeout)
+                self._open_socket(ip, port, timeout).close()
                 logger.debug("IP %s:%s is reachable after attempt %d.", ip, port, attempt + 1)
+                ttl = float(self.ssh_config.get("reachability_cache_ttl_s", 15) or 0)
+                self._reach_cache[cache_key] = time.monotonic() + ttl
                 return True
             except Exception as e:
                 logger.error("Attempt %d: Error reaching IP %s:%s: %s", attempt + 1, ip, port, e)
                 if attempt < max_attempts - 1:
-                    time.sleep(5)
+                    time.sleep(self._backoff(attempt))
 
         logger.error("Failed to reach IP %s:%s after %d attempts.", ip, port, max_attempts)
         return False
 
     def test_connection(self):
         logger.debug("Testing primary IP: %s:%s", self.current_ip, self.current_port)
-        if self.current_ip and self.is_reachable(self.current_ip, self.current_port):
+        # The secondary is only probed once the primary has failed or is still retrying after
+        # secondary_grace_s; from then on both run in parallel, so a dead primary doesn't add
+        # its full timeout, and a healthy one costs a single probe.
+        secondary = None
+        primary_ok = False
+        if self.current_ip:
+            primary = self._workers.submit(self.is_reachable, self.current_ip, self.current_port)
+            try:
+                primary_ok = primary.result(timeout=self.secondary_grace_s)
+            except FutureTimeout:
+                if self.secondary_ip:
+                    secondary = self._workers.submit(self.is_reachable, self.secondary_ip, self.secondary_port)
+                primary_ok = primary.result()
+        if primary_ok:
             logger.info("Primary IP is reachable: %s:%s", self.current_ip, self.current_port)
             return self.current_ip
 
         logger.warning("Primary IP %s:%s not reachable. Trying secondary.", self.current_ip, self.current_port)
-        if self.secondary_ip and self.is_reachable(self.secondary_ip, self.secondary_port):
+        if secondary is None and self.secondary_ip:
+            secondary = self._workers.submit(self.is_reachable, self.secondary_ip, self.secondary_port)
+        if secondary is not None and secondary.result():
             logger.info("Secondary IP is reachable: %s:%s", self.secondary_ip, self.secondary_port)
             self.current_ip = self.secondary_ip
             self.current_port = self.secondary_port
@@ -140,65 +422,390 @@ class SSHExecutor:
         )
         return None
 
+    # -------------------------------------------------------------------------
+    # Connection pool
+    # -------------------------------------------------------------------------
+    def _open_transport(self, ip, port, username, password):
+        """
+        Connect and authenticate a bare paramiko Transport to (ip, port): with the
+        ssh_key_file key when the server accepts it, otherwise with the password.
+        Skips SSHClient and its host-key policy plumbing. Like paramiko's WarningPolicy,
+        the server key is checked against the cached known_hosts and a mismatch is logged,
+        not refused.
+        """
+        sock = self._open_socket(ip, port, self.timeout)
+        self._enable_tcp_keepalive(sock)
+        transport = self._paramiko.Transport(sock)
+        try:
+            transport.banner_timeout = self.timeout
+            transport.auth_timeout = self.timeout
+            transport.use_compression(self.compress)
+            self._prefer_fast_algorithms(transport)
+            transport.start_client(timeout=self.timeout)
+            self._check_host_key(transport, ip, port)
+            if not self._auth_with_key(transport, username):
+                transport.auth_password(username, password)
+        except Exception:
+            transport.close()
+            raise
+        # SSH-level keepalive so idle pooled sessions survive NAT/firewall timeouts
+        transport.set_keepalive(self.keepalive_interval)
+        return transport
+
+    @property
+    def _private_key(self):
+        if not self._pkey_loaded:
+            self._pkey_loaded = True
+            path = os.path.expanduser(self.ssh_config.get("ssh_key_file") or "")
+            if path and os.path.isfile(path):
+                paramiko = self._paramiko
+                for key_class in (paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.RSAKey):
+                    try:
+                        self._pkey = key_class.from_private_key_file(path)
+                        break
+                    except paramiko.PasswordRequiredException:
+                        logger.debug("SSH key %s is passphrase-protected; using password auth.", path)
+                        break
+                    except Exception:
+                        continue
+        return self._pkey
+
+    def _auth_with_key(self, transport, username):
+        """Try public-key auth; False means the caller should fall back to the password."""
+        key = self._private_key
+        if key is None:
+            return False
+        try:
+            transport.auth_publickey(username, key)
+        except self._paramiko.AuthenticationException as e:
+            logger.debug("Key auth for %s rejected (%s); falling back to password.", username, e)
+            return False
+        return transport.is_authenticated()
+
+    @property
+    def _known_hosts(self):
+        if self._host_keys is None:
+            host_keys = self._paramiko.HostKeys()
+            try:
+                host_keys.load(os.path.expanduser("~/.ssh/known_hosts"))
+            except (IOError, OSError):
+                pass  # no known_hosts yet
+            except Exception as e:
+                logger.debug("Could not parse known_hosts: %s", e)
+            self._host_keys = host_keys
+        return self._host_keys
+
+    def _check_host_key(self, transport, ip, port):
+        key = transport.get_remote_server_key()
+        name = ip if int(port) == 22 else f"[{ip}]:{port}"
+        known = self._known_hosts.lookup(name)
+        if known is None:
+            logger.debug("No known_hosts entry for %s (%s).", name, key.get_name())
+        elif not self._known_hosts.check(name, key):
+            logger.warning("Host key for %s does not match known_hosts (got %s %s).",
+                           name, key.get_name(), key.get_fingerprint().hex())
+
+    @staticmethod
+    def _prefer_fast_algorithms(transport):
+        """Reorder (never restrict) the offered algorithms so the cheap ones win negotiation."""
+        options = transport.get_security_options()
+        for attr, preferred in _PREFERRED_ALGORITHMS:
+            current = tuple(getattr(options, attr))
+            front = tuple(name for name in preferred if name in current)
+            setattr(options, attr, front + tuple(name for name in current if name not in front))
+
+    def _get_transport(self, ip, port, username, password):
+        """
+        Return an authenticated Transport for (ip, port, username).
+        A pooled transport is reused while it is active and still accepts an SSH_MSG_IGNORE
+        (a one-way no-op, so no round trip); a dead one is dropped and replaced, so callers
+        never pay the handshake twice in a row.
+        """
+        if self._shut_down:
+            raise RuntimeError("SSH executor is shut down")
+        key = (ip, int(port), username)
+        with self._pool_lock:
+            transport = self._pool.get(key)
+        if transport is not None and self._is_alive(transport, ip, port):
+            return transport
+
+        with self._key_lock(key):
+            # Another caller may have reconnected while this one waited for the key
+            with self._pool_lock:
+                current = self._pool.get(key)
+            if current is not None and current is not transport and self._is_alive(current, ip, port):
+                return current
+            if current is not None:
+                self._close_quietly(self._pop_pooled(key, current))
+
+            transport = self._open_transport(ip, port, username, password)
+            with self._pool_lock:
+                self._pool[key] = transport
+            return transport
+
+    def _is_alive(self, transport, ip, port):
+        if not transport.is_active():
+            logger.debug("Pooled SSH session to %s:%s is no longer active; reconnecting.", ip, port)
+            return False
+        try:
+            transport.send_ignore()
+            return True
+        except Exception as e:
+            logger.debug("Pooled SSH session to %s:%s failed its liveness check: %s", ip, port, e)
+            return False
+
+    def _key_lock(self, key):
+        """Lock serialising connects and channel opens for one (ip, port, username)."""
+        with self._pool_lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _exec(self, transport, command):
+        """Run command on a new session channel; returns (stdin, stdout, stderr) like SSHClient.exec_command."""
+        chan = transport.open_session(timeout=self.timeout)
+        chan.exec_command(command)
+        return chan.makefile_stdin("wb"), chan.makefile("r"), chan.makefile_stderr("r")
+
+    def _wait_exit(self, chan, timeout=None, out=None, err=None):
+        """
+        Read stdout/stderr as they arrive until the exit status is in and both buffers are
+        empty, appending to out/err when given and discarding the data otherwise, so a chatty
+        command can't stall on a full channel window. Raises CommandTimeout once timeout
+        seconds (default self.command_timeout) have passed; with no limit at all it waits
+        for the command like recv_exit_status() would.
+        """
+        if timeout is None:
+            timeout = self.command_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not chan.exit_status_ready() or chan.recv_ready() or chan.recv_stderr_ready():
+            if chan.recv_ready():
+                data = chan.recv(65536)
+                if out is not None:
+                    out += data
+            elif chan.recv_stderr_ready():
+                data = chan.recv_stderr(65536)
+                if err is not None:
+                    err += data
+            elif chan.closed:
+                break
+            else:
+                wait = 1.0
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise CommandTimeout(f"no exit status after {timeout}s")
+                    wait = min(wait, remaining)
+                select.select([chan], [], [], wait)
+        return chan.recv_exit_status()
+
+    def _exec_status(self, transport, command, timeout=None):
+        """
+        Run command and return (exit_status, stderr text). stdout is discarded as it arrives;
+        stderr is only returned when the command failed. The channel is closed straight away
+        instead of waiting for GC.
+        """
+        chan = transport.open_session(timeout=self.timeout)
+        try:
+            chan.exec_command(command)
+            err = bytearray()
+            exit_status = self._wait_exit(chan, timeout, err=err)
+            return exit_status, err.decode(errors="ignore") if exit_status != 0 else ""
+        finally:
+            chan.close()
+
+    def _exec_collect(self, transport, command, timeout=None):
+        """
+        Run command and return (exit_status, stdout, stderr) as text. Both streams are drained
+        as data arrives on the one channel, and whatever is still buffered once the exit status
+        is in is read too, so trailing output is never lost. Raises CommandTimeout after
+        timeout seconds (default self.command_timeout).
+        """
+        chan = transport.open_session(timeout=self.timeout)
+        try:
+            chan.exec_command(command)
+            chan.shutdown_write()
+            out, err = bytearray(), bytearray()
+            exit_status = self._wait_exit(chan, timeout, out=out, err=err)
+            return exit_status, out.decode(errors="ignore"), err.decode(errors="ignore")
+        finally:
+            chan.close()
+
+    def _get_sftp(self, ip, port, username, password):
+        """Return a cached SFTP channel living on the pooled transport for (ip, port, username)."""
+        transport = self._get_transport(ip, port, username, password)
+        key = (ip, int(port), username)
+        with self._key_lock(key):
+            with self._pool_lock:
+                sftp = self._sftp_pool.get(key)
+            if sftp is None or sftp.get_channel() is None or sftp.get_channel().closed:
+                sftp = self._paramiko.SFTPClient.from_transport(transport, window_size=self.sftp_window_size)
+                with self._pool_lock:
+                    self._sftp_pool[key] = sftp
+            return sftp
+
+    def _discard(self, ip, port, username):
+        """Close and forget the pooled session for (ip, port, username), e.g. after an I/O error."""
+        # A failed session means the cached "reachable" answer can no longer be trusted
+        self._reach_cache.pop((ip, str(port)), None)
+        try:
+            key = (ip, int(port), username)
+        except (TypeError, ValueError):
+            return
+        self._close_quietly(self._pop_pooled(key))
+
+    def _get_shell(self, ip, port, username, password):
+        """
+        Return a long-lived `sh` channel on the pooled transport for (ip, port, username).
+        stderr is merged into stdout; the channel is reopened if the shell has exited.
+        """
+        transport = self._get_transport(ip, port, username, password)
+        key = (ip, int(port), username)
+        with self._key_lock(key):
+            with self._pool_lock:
+                chan = self._shell_pool.get(key)
+            if chan is None or chan.closed or chan.exit_status_ready():
+                chan = transport.open_session(timeout=self.timeout)
+                chan.set_combine_stderr(True)
+                chan.exec_command("sh")
+                with self._pool_lock:
+                    self._shell_pool[key] = chan
+            return chan
+
+    def _drop_shell(self, ip, port, username):
+        with self._pool_lock:
+            chan = self._shell_pool.pop((ip, int(port), username), None)
+        if chan is not None:
+            try:
+                chan.close()
+            except Exception:
+                pass
+
+    def _pop_pooled(self, key, transport=None):
+        """
+        Remove the pooled transport, SFTP and shell for key and return them for closing.
+        With transport given, nothing is removed unless that is still the pooled transport.
+        """
+        with self._pool_lock:
+            if transport is not None and self._pool.get(key) is not transport:
+                return ()
+            return (self._shell_pool.pop(key, None), self._sftp_pool.pop(key, None), self._pool.pop(key, None))
+
+    @staticmethod
+    def _close_quietly(objs):
+        # Closing a transport joins its reader thread, so this runs outside _pool_lock
+        for obj in objs:
+            try:
+                if obj:
+                    obj.close()
+            except Exception:
+                pass
+
+    def drop_relay_session(self):
+        """Forget the pooled relay session and its cached reachability (e.g. after a reboot)."""
+        self._discard(self.relay_ip, self.relay_ssh_port, self.relay_username)
+
+    def close_all(self):
+        """Close every pooled SSH/SFTP session (registered with atexit)."""
+        with self._pool_lock:
+            keys = list(self._pool)
+        for key in keys:
+            self._close_quietly(self._pop_pooled(key))
+
+    def shutdown(self):
+        """
+        Close every pooled session and refuse new ones, so a read in flight on another
+        thread fails straight away instead of running to its timeout (used on app exit).
+        """
+        self._shut_down = True
+        self.close_all()
+
     # -------------------------------------------------------------------------
     # Command execution
     # -------------------------------------------------------------------------
     def _connect(self):
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(self.current_ip, int(self.current_port), self.username, self.password, timeout=self.timeout)
-        return ssh
+        return self._get_transport(self.current_ip, self.current_port, self.username, self.password)
 
     def execute_command(self, command, success_msg="Command executed successfully.",
-                        error_msg="Failed to execute command.", max_attempts=None):
+                        error_msg="Failed to execute command.", max_attempts=None, timeout=None):
         """
         Execute a remote command and return True/False only (legacy behavior used by UI buttons).
         """
-        if not self.current_ip or not self.password:
+        return self._execute_on(self.current_ip, self.current_port, command,
+                                success_msg, error_msg, max_attempts, timeout)
+
+    def execute_batch(self, commands, success_msg="Commands executed successfully.",
+                      error_msg="Failed to execute commands.", max_attempts=None):
+        """
+        Run several commands as one `a && b && ...` exec, paying a single channel round-trip.
+        Stops at the first failing command. If every command is a sudo command the batch
+        runs under one sudo, so the password is only sent once.
+        """
+        if commands and all(cmd.startswith("sudo ") for cmd in commands):
+            command = "sudo sh -c " + shlex.quote(" && ".join(cmd[5:] for cmd in commands))
+        else:
+            command = " && ".join(commands)
+        return self.execute_command(command, success_msg, error_msg, max_attempts)
+
+    def _sudo(self, command, password):
+        """
+        Make a leading "sudo " non-interactive: `sudo -n` when sudo_nopasswd is set (no password
+        is sent at all), otherwise the password is piped to `sudo -S`.
+        """
+        if not command.startswith("sudo "):
+            return command
+        if self._sudo_prefix is not None:
+            return self._sudo_prefix + command[5:]
+        return f"echo {password} | sudo -S {command[5:]}"
+
+    def _execute_on(self, ip, port, command, success_msg, error_msg, max_attempts=None, timeout=None):
+        """
+        Run a command on the given companion target without touching current_ip/current_port,
+        so it is safe to call for several targets concurrently. timeout bounds the wait for
+        the command itself (default self.command_timeout); a command that overruns is not retried.
+        """
+        if not ip or not self.password:
             logger.error("No IP or password configured for companion.")
             return False
         if max_attempts is None:
             max_attempts = self.max_attempts
 
         for attempt in range(max_attempts):
-            ssh = None
             try:
-                ssh = self._connect()
-                if command.startswith("sudo "):
-                    cmd = f"echo {self.password} | sudo -S {command[5:]}"
-                else:
-                    cmd = command
-
-                stdin, stdout, stderr = ssh.exec_command(cmd)
-                exit_status = stdout.channel.recv_exit_status()
+                transport = self._get_transport(ip, port, self.username, self.password)
+                cmd = self._sudo(command, self.password)
+
+                with self._session_slots:
+                    exit_status, error = self._exec_status(transport, cmd, timeout)
                 if exit_status == 0:
                     logger.info("%s", success_msg)
                     return True
 
-                error = stderr.read().decode(errors="ignore")
                 logger.error("%s\nError: %s", error_msg, error)
                 return False
 
-            except paramiko.AuthenticationException as e:
+            except CommandTimeout as e:
+                logger.error("%s\nCommand %s timed out: %s", error_msg, command, e)
+                return False
+            except self._paramiko.AuthenticationException as e:
                 logger.error("SSH Authentication failed for command %s (attempt %d): %s", command, attempt + 1, e)
+                self._discard(ip, port, self.username)
             except Exception as e:
                 logger.error("Error executing command %s (attempt %d): %s", command, attempt + 1, e)
-            finally:
-                try:
-                    if ssh:
-                        ssh.close()
-                except Exception:
-                    pass
+                self._discard(ip, port, self.username)
 
             if attempt < max_attempts - 1:
-                time.sleep(5)
+                time.sleep(self._backoff(attempt))
 
         return False
 
-    def execute_command_capture(self, command, max_attempts=None):
+    def execute_command_capture(self, command, max_attempts=None, input_data=None):
         """
         Run a command over SSH and return (ok: bool, stdout: str, stderr: str, exit_status: int).
         Use this when you need to parse the command output.
+        If input_data is given it is written to the command's stdin, which is then closed;
+        otherwise a leading "sudo " is given the password the same way as execute_command().
         """
         if not self.current_ip or not self.password:
             logger.error("No IP or password configured for companion.")
@@ -206,51 +813,171 @@ class SSHExecutor:
         if max_attempts is None:
             max_attempts = self.max_attempts
 
+        cmd = command
+        if input_data is None:
+            cmd = self._sudo(command, self.password)
+
         for attempt in range(max_attempts):
-            ssh = None
             try:
-                ssh = self._connect()
-                stdin, stdout, stderr = ssh.exec_command(command)
-                exit_status = stdout.channel.recv_exit_status()
-                out = stdout.read().decode(errors="ignore")
-                err = stderr.read().decode(errors="ignore")
+                transport = self._connect()
+                with self._session_slots:
+                    stdin, stdout, stderr = self._exec(transport, cmd)
+                    if input_data is not None:
+                        stdin.write(input_data)
+                        stdin.channel.shutdown_write()
+                    # Drain output before waiting on the exit status so big outputs can't stall the channel
+                    out = stdout.read().decode(errors="ignore")
+                    err = stderr.read().decode(errors="ignore")
+                    exit_status = stdout.channel.recv_exit_status()
                 return exit_status == 0, out, err, exit_status
-            except paramiko.AuthenticationException as e:
+            except self._paramiko.AuthenticationException as e:
                 logger.error("SSH auth failed for '%s' (attempt %d): %s", command, attempt + 1, e)
+                self._discard(self.current_ip, self.current_port, self.username)
             except Exception as e:
                 logger.error("Error executing '%s' (attempt %d): %s", command, attempt + 1, e)
-            finally:
-                try:
-                    if ssh:
-                        ssh.close()
-                except Exception:
-                    pass
+                self._discard(self.current_ip, self.current_port, self.username)
 
             if attempt < max_attempts - 1:
-                time.sleep(5)
+                time.sleep(self._backoff(attempt))
 
         return False, "", "max attempts exceeded", -1
 
+    def run_on(self, host, port, username, password, command, want_output=True):
+        """
+        Run command on any host/user over the pooled transport for (host, port, username)
+        and return (ok, stdout, stderr). A stale pooled session is reconnected once.
+        With want_output=False stdout is never read (returned as "") and stderr only on failure.
+        """
+        cmd = self._sudo(command.strip(), password)
+        for attempt in range(2):
+            try:
+                transport = self._get_transport(host, port, username, password)
+                with self._session_slots:
+                    if want_output:
+                        exit_status, out, err = self._exec_collect(transport, cmd)
+                    else:
+                        (exit_status, err), out = self._exec_status(transport, cmd), ""
+                return exit_status == 0, out, err
+            except CommandTimeout as e:
+                return False, "", str(e)
+            except self._paramiko.AuthenticationException as e:
+                self._discard(host, port, username)
+                return False, "", str(e)
+            except Exception as e:
+                self._discard(host, port, username)
+                if attempt:
+                    return False, "", str(e)
+                logger.debug("SSH session to %s:%s failed (%s); reconnecting.", host, port, e)
+
+    def exec_pipelined(self, commands, timeout=None):
+        """
+        Run several commands on the companion through one long-lived shell channel,
+        without opening a new SSH channel per command. All commands are written up front
+        and each is followed by a marker carrying its exit status.
+
+        Returns a list of (ok: bool, output: str) in the same order (stderr merged in).
+        A reused shell that turns out to be dead before answering (e.g. dropped by NAT while
+        idle) is replaced and the batch resent once. Otherwise raises on timeout (a deadline
+        for the whole batch, not per read) or a dead channel, after dropping the shell so the
+        next call starts a fresh one.
+        """
+        if not self.current_ip or not self.password:
+            raise RuntimeError("No IP or password configured for companion.")
+        if timeout is None:
+            timeout = self.timeout
+        ip, port, username = self.current_ip, self.current_port, self.username
+
+        marker = f"__MARK_{random.getrandbits(64):016x}__"
+        done = re.compile(rb"\n" + marker.encode() + rb"(\d+)__\n")
+        script = "".join(f"{cmd}\nprintf '\\n{marker}%s__\\n' \"$?\"\n" for cmd in commands)
+
+        with self._shell_lock:
+            while True:
+                reused = (ip, int(port), username) in self._shell_pool
+                results = []
+                received = False
+                try:
+                    chan = self._get_shell(ip, port, username, self.password)
+                    # One deadline for the batch, so trickling output can't hold _shell_lock
+                    deadline = time.monotonic() + timeout
+                    chan.settimeout(timeout)
+                    chan.sendall(script.encode())
+                    buf = b""
+                    while len(results) < len(commands):
+                        m = done.search(buf)
+                        if m is None:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                raise socket.timeout(f"pipelined batch took longer than {timeout}s")
+                            chan.settimeout(remaining)
+                            data = chan.recv(65536)
+                            if not data:
+                                raise EOFError("remote shell closed")
+                            received = True
+                            buf += data
+                            continue
+                        results.append((int(m.group(1)) == 0, buf[:m.start()].decode(errors="ignore")))
+                        buf = buf[m.end():]
+                    return results
+                except Exception as e:
+                    self._drop_shell(ip, port, username)
+                    # Timeouts are not retried: a hung link would just make the caller wait twice
+                    if not reused or received or isinstance(e, socket.timeout):
+                        raise
+                    logger.debug("Reused shell to %s:%s was stale (%s); reopening.", ip, port, e)
+
     def execute_command_all(self, command, success_msg="Command executed successfully on all systems.",
-                            error_msg="Failed to execute command on all systems."):
+                            error_msg="Failed to execute command on all systems.", max_attempts=None):
         logger.debug("Executing command on all systems: %s", command)
-        primary = self.execute_command(command, success_msg, error_msg)
-        secondary = True
-        if self.secondary_ip:
-            orig_ip = self.current_ip
-            orig_port = self.current_port
-            self.current_ip = self.secondary_ip
-            self.current_port = self.secondary_port
-            secondary = self.execute_command(command, success_msg, error_msg)
-            self.current_ip = orig_ip
-            self.current_port = orig_port
-        return primary and secondary
+        same_target = (self.secondary_ip == self.current_ip
+                       and str(self.secondary_port) == str(self.current_port))
+        if not self.secondary_ip or same_target:
+            return self.execute_command(command, success_msg, error_msg, max_attempts)
+        # Run both targets at once so the total time is the slower host, not the sum.
+        primary = self._workers.submit(self._execute_on, self.current_ip, self.current_port,
+                                       command, success_msg, error_msg, max_attempts)
+        secondary = self._workers.submit(self._execute_on, self.secondary_ip, self.secondary_port,
+                                         command, success_msg, error_msg, max_attempts)
+        return all([primary.result(), secondary.result()])
+
+    def send_async(self, command, relay=False):
+        """
+        Fire-and-forget: send command to the companion targets (primary and secondary), or to the
+        relay, and close the channel without waiting for an exit status. Meant for reboot/shutdown,
+        where the remote drops the session anyway. Output is sent to /dev/null on the remote side
+        so nothing is written to the closed channel. Returns True if every target got the command.
+        """
+        if relay:
+            targets = [(self.relay_ip, self.relay_ssh_port, self.relay_username, self.relay_password)]
+        else:
+            targets = [(self.current_ip, self.current_port, self.username, self.password)]
+            same_target = (self.secondary_ip == self.current_ip
+                           and str(self.secondary_port) == str(self.current_port))
+            if self.secondary_ip and not same_target:
+                targets.append((self.secondary_ip, self.secondary_port, self.username, self.password))
+
+        sent = True
+        for ip, port, username, password in targets:
+            try:
+                transport = self._get_transport(ip, port, username, password)
+                with self._session_slots:
+                    chan = transport.open_session(timeout=self.timeout)
+                    try:
+                        chan.exec_command(f"{self._sudo(command, password)} >/dev/null 2>&1")
+                    finally:
+                        chan.close()
+                logger.info("Sent '%s' to %s:%s.", command, ip, port)
+            except Exception as e:
+                logger.error("Failed to send '%s' to %s:%s: %s", command, ip, port, e)
+                self._discard(ip, port, username)
+                sent = False
+        return sent
 
     # -------------------------------------------------------------------------
     # Relay commands
     # -------------------------------------------------------------------------
     def execute_relay_command(self, command, success_msg="Relay command executed successfully.",
-                             error_msg="Failed to execute relay command.", max_attempts=None):
+                             error_msg="Failed to execute relay command.", max_attempts=None, timeout=None):
         if not self.relay_ip or not self.relay_password:
             logger.error("No relay IP or password configured.")
             return False
@@ -258,37 +985,31 @@ class SSHExecutor:
             max_attempts = self.max_attempts
 
         for attempt in range(max_attempts):
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             try:
-                ssh.connect(self.relay_ip, int(self.relay_ssh_port),
-                            self.relay_username, self.relay_password, timeout=self.timeout)
-                if command.startswith("sudo "):
-                    stdin, stdout, stderr = ssh.exec_command(f"echo {self.relay_password} | sudo -S {command[5:]}")
-                else:
-                    stdin, stdout, stderr = ssh.exec_command(command)
-
-                exit_status = stdout.channel.recv_exit_status()
+                transport = self._get_transport(self.relay_ip, self.relay_ssh_port, self.relay_username, self.relay_password)
+                cmd = self._sudo(command, self.relay_password)
+
+                with self._session_slots:
+                    exit_status, error = self._exec_status(transport, cmd, timeout)
                 if exit_status == 0:
                     logger.info("%s", success_msg)
                     return True
 
-                error = stderr.read().decode(errors="ignore")
                 logger.error("%s\nError: %s", error_msg, error)
                 return False
 
-            except paramiko.AuthenticationException as e:
+            except CommandTimeout as e:
+                logger.error("%s\nRelay command %s timed out: %s", error_msg, command, e)
+                return False
+            except self._paramiko.AuthenticationException as e:
                 logger.error("SSH Authentication failed for relay command %s (attempt %d): %s", command, attempt + 1, e)
+                self._discard(self.relay_ip, self.relay_ssh_port, self.relay_username)
             except Exception as e:
                 logger.error("Error executing relay command %s (attempt %d): %s", command, attempt + 1, e)
-            finally:
-                try:
-                    ssh.close()
-                except Exception:
-                    pass
+                self._discard(self.relay_ip, self.relay_ssh_port, self.relay_username)
 
             if attempt < max_attempts - 1:
-                time.sleep(5)
+                time.sleep(self._backoff(attempt))
 
         return False
 
@@ -310,23 +1031,50 @@ class SSHExecutor:
             logger.error("No IP or password configured for file transfer.")
             return False, None
 
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
-            ssh.connect(self.current_ip, int(self.current_port), self.username, self.password, timeout=self.timeout)
-            sftp = ssh.open_sftp()
-            sftp.get(remote_path, local_path)
-            sftp.close()
+            sftp = self._get_sftp(self.current_ip, self.current_port, self.username, self.password)
+            with sftp.file(remote_path, "rb") as remote:
+                # Keep many read requests in flight instead of one round trip per 32 KiB block
+                remote.prefetch()
+                with open(local_path, "wb") as local:
+                    shutil.copyfileobj(remote, local, length=1 << 20)
             logger.info("File transferred successfully from %s to %s", remote_path, local_path)
             return True, local_path
+        except IOError as e:
+            # Missing remote file / local permission problem; the session itself is fine.
+            logger.error("Error transferring file: %s", e)
+            return False, None
         except Exception as e:
             logger.error("Error transferring file: %s", e)
+            self._discard(self.current_ip, self.current_port, self.username)
             return False, None
-        finally:
-            try:
-                ssh.close()
-            except Exception:
-                pass
+
+    def read_remote_text(self, remote_path):
+        """Read a companion file over the pooled SFTP session. Raises on failure."""
+        try:
+            sftp = self._get_sftp(self.current_ip, self.current_port, self.username, self.password)
+            with sftp.file(remote_path, "r") as remote:
+                return remote.read().decode(errors="ignore")
+        except IOError:
+            raise
+        except Exception:
+            self._discard(self.current_ip, self.current_port, self.username)
+            raise
+
+    def write_remote_text(self, remote_path, text):
+        """Overwrite a companion file over the pooled SFTP session. Raises on failure."""
+        try:
+            sftp = self._get_sftp(self.current_ip, self.current_port, self.username, self.password)
+            data = text.encode("utf-8")
+            with sftp.file(remote_path, "wb") as remote:
+                # Don't wait for each write ack; close() collects them all
+                remote.set_pipelined(True)
+                remote.write(data)
+        except IOError:
+            raise
+        except Exception:
+            self._discard(self.current_ip, self.current_port, self.username)
+            raise
 
     def restart_relay_ssh_tunnel(self):
         logger.info("Attempting to restart relay SSH tunnel service.")
@@ -337,6 +1085,42 @@ class SSHExecutor:
             "Failed to restart relay SSH tunnel service."
         )
 
+    def batch_query(self, commands, timeout=15):
+        """
+        Run several read-only companion commands in one round trip and return their
+        outputs as a list of str (same order), or None if nothing could be run.
+        Uses the pipelined shell; falls back to one exec_command with the outputs
+        separated by a marker line.
+        """
+        try:
+            return [out for _, out in self.exec_pipelined(commands, timeout=timeout)]
+        except Exception as e:
+            logger.debug("Pipelined batch failed (%s); using a single exec.", e)
+
+        sep = "__DCSEP__"
+        composed = f"; printf '\\n{sep}\\n'; ".join(f"{{ {cmd}; }}" for cmd in commands)
+        ok, out, err, _ = self.execute_command_capture(composed, max_attempts=1)
+        if not out and not ok:
+            return None
+        parts = out.split(f"\n{sep}\n")
+        parts += [""] * (len(commands) - len(parts))
+        return parts[:len(commands)]
+
+    def query_status(self):
+        """
+        One round trip for the periodic UI status: Wi-Fi module temperature and the
+        companion's /etc/sid.conf (for its version). Returns
+        {"wifi_temp": float or None, "sid_conf": str or None}.
+        """
+        iface = (self.ssh_config.get("wifi_iface") or "").strip()
+        if iface != self._wifi_probe_iface:
+            self._build_wifi_probe_cmds(iface)
+        outputs = self.batch_query([self._wifi_probe_cmd, "cat /etc/sid.conf 2>/dev/null"])
+        if outputs is None:
+            return {"wifi_temp": None, "sid_conf": None}
+        probe_out, sid_conf = outputs
+        return {"wifi_temp": self._parse_wifi_probe(probe_out), "sid_conf": sid_conf.strip()}
+
     # -------------------------------------------------------------------------
     # Wi-Fi temperature (RTL88x2EU procfs authoritative)
     # -------------------------------------------------------------------------
@@ -349,108 +1133,89 @@ class SSHExecutor:
         - Fall back to wfb-cli (if it prints temperature)
         - Last fallback: sysfs hwmon temp1_input
 
+        The whole probe runs remotely as one script, normally through the long-lived
+        shell from exec_pipelined() (no new channel per poll); its A:/B:/C: sections are
+        parsed by _parse_wifi_probe() in the same order of preference.
+
         Returns float °C or None.
         """
-        import re
-
-        clamp_min, clamp_max = -40.0, 130.0
-
-        ssh = None
         try:
-            ssh = self._connect()
+            iface = (self.ssh_config.get("wifi_iface") or "").strip()
+            if iface != self._wifi_probe_iface:
+                self._build_wifi_probe_cmds(iface)
+            try:
+                # Worst case the script waits on three 2 s wfb-cli timeouts plus the sysfs read
+                (ok, out), = self.exec_pipelined([self._wifi_probe_cmd], timeout=15)
+            except Exception as e:
+                logger.debug("Pipelined Wi-Fi probe failed (%s); using a one-off exec.", e)
+                ok, out, err, _ = self.execute_command_capture(
+                    self._wifi_probe_stdin_cmd, max_attempts=1, input_data=_WIFI_PROBE_SCRIPT)
+            return self._parse_wifi_probe(out)
+        except Exception as e:
+            logger.error("get_wifi_module_temperature failed: %s", e)
+            self._discard(self.current_ip, self.current_port, self.username)
+            return None
 
-            def _safe_read(cmd: str) -> str:
-                stdin, stdout, stderr = ssh.exec_command(cmd)
-                # avoid hang
-                stdout.channel.settimeout(self.timeout)
-                return stdout.read().decode(errors="ignore").strip()
+    def _build_wifi_probe_cmds(self, iface):
+        """Quote the probe script/iface once; the poller reuses these strings every tick."""
+        iface_arg = f" {shlex.quote(iface)}" if iface else ""
+        self._wifi_probe_iface = iface
+        self._wifi_probe_cmd = f"sh -c {_WIFI_PROBE_SCRIPT_QUOTED} sh{iface_arg}"
+        self._wifi_probe_stdin_cmd = f"sh -s --{iface_arg}"
 
-            def _pick_iface() -> str:
-                # 1) What WFB is configured to use (first token of WFB_NICS)
-                cmd = r"""sh -lc '
-if [ -r /etc/default/wifibroadcast ]; then
-  v=$(grep -E "^[[:space:]]*WFB_NICS=" /etc/default/wifibroadcast | tail -n1 | cut -d= -f2-)
-  v=${v#\"}; v=${v%\"}; v=${v#\'}; v=${v%\'}
-  set -- $v
-  echo "${1:-}"
-fi
-'"""
-                iface = _safe_read(cmd)
-                if iface:
-                    return iface
-
-                # 2) Auto-detect rtl88x2eu iface from procfs folder listing
-                cmd = r"""sh -lc 'ls -1 /proc/net/rtl88x2eu 2>/dev/null | grep -E "^wl" | head -n1 || true'"""
-                iface = _safe_read(cmd)
-                if iface:
-                    return iface
-
-                # 3) Fall back to configured iface
-                return (self.ssh_config.get("wifi_iface") or "").strip()
-
-            iface = _pick_iface()
-
-            # A) Best: RTL88x2EU procfs thermal_state
-            if iface:
-                proc_path = f"/proc/net/rtl88x2eu/{iface}/thermal_state"
-                proc_cmd = f"sh -lc 'timeout 2s cat {proc_path} 2>/dev/null || true'"
-                proc_out = _safe_read(proc_cmd)
-
-                temps = []
-                for mm in re.finditer(r"temperature:\s*(-?\d+(?:\.\d+)?)", proc_out):
-                    try:
-                        t = float(mm.group(1))
-                        if clamp_min <= t <= clamp_max:
-                            temps.append(t)
-                    except Exception:
-                        pass
+    @classmethod
+    def _parse_wifi_probe(cls, out):
+        """Turn the probe script's A:/B:/C: output into °C (first usable section wins) or None."""
+        clamp_min, clamp_max = -40.0, 130.0
+        if not out:
+            return None
+        sections = cls._split_probe_sections(out)
 
-                if temps:
-                    # conservative: hottest RF path
-                    return float(f"{max(temps):.1f}")
+        # A) Best: RTL88x2EU procfs thermal_state
+        temps = []
+        for mm in _RE_PROCFS_TEMP.finditer(sections.get("A", "")):
+            try:
+                t = float(mm.group(1))
+                if clamp_min <= t <= clamp_max:
+                    temps.append(t)
+            except Exception:
+                pass
 
-            # B) Next: wfb-cli (only if it prints temp)
-            wfb_cmd = r"""sh -lc '
-TO=2
-(out=$((timeout ${TO}s /usr/local/sbin/wfb-cli drone || timeout ${TO}s /usr/local/bin/wfb-cli drone || timeout ${TO}s wfb-cli drone) 2>/dev/null); \
-echo "$out" | grep -iE "temp|temperature" | head -n 20) || true
-'"""
-            out = _safe_read(wfb_cmd)
-            m = re.search(r"(-?\d+(?:\.\d+)?)\s*°?\s*[Cc]\b", out)
-            if m:
-                val = float(m.group(1))
-                if clamp_min <= val <= clamp_max:
-                    return float(f"{val:.1f}")
-
-            # C) Last fallback: sysfs hwmon
-            sysfs_cmd = r"""sh -lc '
-TO=2
-for p in /sys/class/ieee80211/*/device/hwmon/*/temp1_input /sys/class/hwmon/hwmon*/temp1_input; do
-  [ -r "$p" ] || continue
-  v=$(timeout ${TO}s cat "$p" 2>/dev/null) || continue
-  echo "$v"
-  break
-done
-'"""
-            val_s = _safe_read(sysfs_cmd)
-            if val_s:
-                try:
-                    v = float(val_s)
-                    if v > 200:  # millidegC -> degC
-                        v /= 1000.0
-                    if clamp_min <= v <= clamp_max:
-                        return float(f"{v:.1f}")
-                except Exception:
-                    pass
+        if temps:
+            # conservative: hottest RF path
+            return float(f"{max(temps):.1f}")
 
-            return None
+        # B) Next: wfb-cli (only if it prints temp)
+        m = _RE_CLI_TEMP.search(sections.get("B", ""))
+        if m:
+            val = float(m.group(1))
+            if clamp_min <= val <= clamp_max:
+                return float(f"{val:.1f}")
 
-        except Exception as e:
-            logger.error("get_wifi_module_temperature failed: %s", e)
-            return None
-        finally:
+        # C) Last fallback: sysfs hwmon
+        val_s = sections.get("C", "").strip()
+        if val_s:
             try:
-                if ssh:
-                    ssh.close()
+                v = float(val_s.splitlines()[0])
+                if v > 200:  # millidegC -> degC
+                    v /= 1000.0
+                if clamp_min <= v <= clamp_max:
+                    return float(f"{v:.1f}")
             except Exception:
                 pass
+
+        return None
+
+    @staticmethod
+    def _split_probe_sections(out):
+        """Split tagged probe output ("A:" line, body, "B:" line, body, ...) into a dict."""
+        sections = {}
+        current = None
+        for line in out.splitlines():
+            tag = line.strip()
+            if len(tag) == 2 and tag.endswith(":") and tag[0].isupper():
+                current = tag[0]
+                sections[current] = ""
+            elif current is not None:
+                sections[current] += line + "\n"
+        return sections